@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Benchmark script untuk Aksara AI Backend
+"""
+
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Tambahkan root project ke sys.path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config.postgres import SessionLocal, create_async_db_engine, engine
+from src.utils.ids import new_id
+
+BATCH_SIZE = 1000
+
+
+def _index_size(conn, index_name):
+    """Ukuran index dalam bytes (Postgres saja)"""
+    if engine.dialect.name != "postgresql":
+        return None
+    return conn.execute(
+        text("SELECT pg_relation_size(CAST(:name AS regclass))"), {"name": index_name}
+    ).scalar()
+
+
+def benchmark_ids(rows=100000):
+    """Bandingkan insert throughput dan ukuran index uuid4 vs UUIDv7"""
+    generators = {
+        "uuid4": lambda: str(uuid.uuid4()),
+        "uuid7": new_id,
+    }
+
+    print(f"Inserting {rows} rows per generator (batch {BATCH_SIZE})")
+    results = {}
+    with engine.connect() as conn:
+        for name, generate in generators.items():
+            table = f"bench_ids_{name}"
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            conn.execute(
+                text(
+                    f"CREATE TABLE {table} "
+                    f"(id VARCHAR PRIMARY KEY, payload VARCHAR NOT NULL)"
+                )
+            )
+            conn.commit()
+
+            started = time.perf_counter()
+            for offset in range(0, rows, BATCH_SIZE):
+                batch = [
+                    {"id": generate(), "payload": "x" * 64}
+                    for _ in range(min(BATCH_SIZE, rows - offset))
+                ]
+                conn.execute(
+                    text(f"INSERT INTO {table} (id, payload) VALUES (:id, :payload)"),
+                    batch,
+                )
+                conn.commit()
+            elapsed = time.perf_counter() - started
+
+            results[name] = (elapsed, _index_size(conn, f"{table}_pkey"))
+            conn.execute(text(f"DROP TABLE {table}"))
+            conn.commit()
+
+    print(f"{'generator':<10} {'seconds':>10} {'rows/s':>12} {'pk index':>12}")
+    for name, (elapsed, index_size) in results.items():
+        size = f"{index_size / 1024 / 1024:.1f} MB" if index_size else "n/a"
+        print(f"{name:<10} {elapsed:>10.2f} {rows / elapsed:>12.0f} {size:>12}")
+    return True
+
+
+# Layout chat_messages sebelum dan sesudah migration 012
+MESSAGE_LAYOUTS = {
+    "legacy": """
+        id VARCHAR PRIMARY KEY,
+        chat_history_id VARCHAR NOT NULL,
+        sender VARCHAR NOT NULL,
+        text TEXT NOT NULL,
+        deleted BOOLEAN NOT NULL DEFAULT false,
+        created_date TIMESTAMP,
+        updated_date TIMESTAMP
+    """,
+    "compact": """
+        id UUID PRIMARY KEY,
+        chat_history_id UUID NOT NULL,
+        sender SMALLINT NOT NULL,
+        text TEXT NOT NULL,
+        deleted BOOLEAN NOT NULL DEFAULT false,
+        created_date TIMESTAMPTZ,
+        updated_date TIMESTAMPTZ
+    """,
+}
+
+
+def benchmark_storage(rows=100000, messages_per_history=20):
+    """Ukur lebar row dan ukuran index chat_messages: legacy vs compact"""
+    if engine.dialect.name != "postgresql":
+        print("❌ Storage report requires PostgreSQL")
+        return False
+
+    print(f"Seeding {rows} chat messages per layout")
+    results = {}
+    with engine.connect() as conn:
+        for layout, columns in MESSAGE_LAYOUTS.items():
+            table = f"bench_messages_{layout}"
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            conn.execute(text(f"CREATE TABLE {table} ({columns})"))
+            conn.execute(
+                text(
+                    f"CREATE INDEX {table}_history_created "
+                    f"ON {table} (chat_history_id, created_date, id) "
+                    f"WHERE deleted = false"
+                )
+            )
+            conn.commit()
+
+            history_id = new_id()
+            for offset in range(0, rows, BATCH_SIZE):
+                batch = []
+                for number in range(offset, min(offset + BATCH_SIZE, rows)):
+                    if number % messages_per_history == 0:
+                        history_id = new_id()
+                    batch.append(
+                        {
+                            "id": new_id(),
+                            "history": history_id,
+                            "sender": (
+                                ("user" if number % 2 == 0 else "assistant")
+                                if layout == "legacy"
+                                else (1 if number % 2 == 0 else 2)
+                            ),
+                            "text": "Pesan contoh untuk pengukuran. " * 4,
+                        }
+                    )
+                conn.execute(
+                    text(
+                        f"INSERT INTO {table} "
+                        "(id, chat_history_id, sender, text, "
+                        "created_date, updated_date) "
+                        "VALUES (:id, :history, :sender, :text, now(), now())"
+                    ),
+                    batch,
+                )
+                conn.commit()
+
+            results[layout] = conn.execute(
+                text(
+                    f"""
+                    SELECT
+                        (SELECT avg(pg_column_size(t.*)) FROM {table} t),
+                        pg_table_size(CAST(:table AS regclass)),
+                        pg_relation_size(CAST(:pkey AS regclass)),
+                        pg_relation_size(CAST(:history AS regclass))
+                    """
+                ),
+                {
+                    "table": table,
+                    "pkey": f"{table}_pkey",
+                    "history": f"{table}_history_created",
+                },
+            ).one()
+            conn.execute(text(f"DROP TABLE {table}"))
+            conn.commit()
+
+    def mb(size):
+        return f"{size / 1024 / 1024:.1f} MB"
+
+    print(
+        f"{'layout':<10} {'row bytes':>10} {'table':>10} "
+        f"{'pk index':>10} {'history ix':>11}"
+    )
+    for layout, (row_width, table_size, pkey_size, history_size) in results.items():
+        print(
+            f"{layout:<10} {float(row_width):>10.1f} {mb(table_size):>10} "
+            f"{mb(pkey_size):>10} {mb(history_size):>11}"
+        )
+
+    legacy, compact = results["legacy"], results["compact"]
+    for label, index in [("row width", 0), ("table", 1), ("indexes", None)]:
+        if index is None:
+            before, after = sum(legacy[2:]), sum(compact[2:])
+        else:
+            before, after = float(legacy[index]), float(compact[index])
+        print(f"   {label} saving: {(1 - after / before) * 100:.1f}%")
+    return True
+
+
+# Latency simulasi per request (detik), pengganti query lambat / jaringan
+SIMULATED_QUERY_SECONDS = 0.05
+
+
+def benchmark_concurrency(requests=200, concurrency=50):
+    """
+    Throughput satu worker: handler async yang memanggil Session sync
+    (memblokir event loop) vs AsyncSession, masing-masing `concurrency`
+    coroutine bersamaan dengan pg_sleep sebagai latency query.
+    """
+    if engine.dialect.name != "postgresql":
+        print("❌ Concurrency benchmark requires PostgreSQL")
+        return False
+
+    statement = text("SELECT pg_sleep(:seconds)")
+    params = {"seconds": SIMULATED_QUERY_SECONDS}
+
+    async def run(handler):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one():
+            async with semaphore:
+                await handler()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return time.perf_counter() - started
+
+    async def sync_handler():
+        # Seperti controller saat ini: async def, tapi query memblokir loop
+        with SessionLocal() as db:
+            db.execute(statement, params)
+
+    async def async_run():
+        async_engine = create_async_db_engine()
+        sessions = async_sessionmaker(async_engine)
+
+        async def async_handler():
+            async with sessions() as db:
+                await db.execute(statement, params)
+
+        try:
+            return await run(async_handler)
+        finally:
+            await async_engine.dispose()
+
+    print(
+        f"{requests} requests, {concurrency} concurrent, "
+        f"{SIMULATED_QUERY_SECONDS * 1000:.0f} ms per query"
+    )
+    results = {
+        "sync": asyncio.run(run(sync_handler)),
+        "async": asyncio.run(async_run()),
+    }
+
+    print(f"{'session':<10} {'seconds':>10} {'req/s':>10}")
+    for name, elapsed in results.items():
+        print(f"{name:<10} {elapsed:>10.2f} {requests / elapsed:>10.1f}")
+    print(f"   speedup: {results['sync'] / results['async']:.1f}x")
+    return True
+
+
+def benchmark_statements(calls=5000):
+    """
+    CPU per panggilan query panas (auth dan chat): db.query(...).filter(...)
+    yang dibangun ulang setiap kali vs statement yang dibangun sekali dengan
+    bindparam (src/user/repository.py, src/chat/repository.py).
+    """
+    from sqlalchemy import select
+
+    from src.chat.models import ChatHistory, ChatMessage
+    from src.chat.repository import (
+        MESSAGES_BY_CHAT_ID,
+        USER_CHAT_HISTORY_BY_ID,
+    )
+    from src.user.models import User
+    from src.user.repository import ACTIVE_USER_BY_ID
+
+    with SessionLocal() as db:
+        history = db.execute(select(ChatHistory).limit(1)).scalars().first()
+        user_id = history.user_id if history else new_id()
+        chat_id = history.id if history else new_id()
+
+        cases = {
+            "auth user": (
+                lambda: db.query(User)
+                .filter(User.id == user_id, User.is_active, User.deleted == False)
+                .first(),
+                lambda: db.execute(ACTIVE_USER_BY_ID, {"user_id": user_id})
+                .scalars()
+                .first(),
+            ),
+            "chat history": (
+                lambda: db.query(ChatHistory)
+                .filter(ChatHistory.id == chat_id, ChatHistory.deleted == False)
+                .filter(ChatHistory.user_id == user_id)
+                .first(),
+                lambda: db.execute(
+                    USER_CHAT_HISTORY_BY_ID, {"chat_id": chat_id, "user_id": user_id}
+                )
+                .scalars()
+                .first(),
+            ),
+            "messages": (
+                lambda: db.query(ChatMessage)
+                .filter(
+                    ChatMessage.chat_history_id == chat_id,
+                    ChatMessage.deleted == False,
+                )
+                .order_by(ChatMessage.created_date)
+                .all(),
+                lambda: db.execute(MESSAGES_BY_CHAT_ID, {"chat_history_id": chat_id})
+                .scalars()
+                .all(),
+            ),
+        }
+
+        print(f"{calls} calls per query ({engine.dialect.name})")
+        print(f"{'query':<14} {'rebuilt µs':>12} {'cached µs':>12} {'saved':>8}")
+        for name, (rebuilt, cached) in cases.items():
+            timings = []
+            for run in (rebuilt, cached):
+                run()  # warm-up: compiled cache dan koneksi
+                # CPU time proses, bukan wall clock: latency DB tidak dihitung
+                started = time.process_time()
+                for _ in range(calls):
+                    run()
+                timings.append((time.process_time() - started) / calls * 1e6)
+            saved = 1 - timings[1] / timings[0] if timings[0] else 0
+            print(f"{name:<14} {timings[0]:>12.1f} {timings[1]:>12.1f} {saved:>8.0%}")
+    return True
+
+
+def benchmark_read_models(messages=1000, repeats=20):
+    """
+    Detail percakapan `messages` pesan: entity ChatMessage penuh (identity
+    map, change tracking, SQLModel) vs row kolom MESSAGE_COLUMNS, sampai
+    ChatMessageResponse.model_dump. CPU per request dan puncak memori.
+    """
+    import tracemalloc
+
+    from sqlalchemy import delete, select
+
+    from src.chat.models import ChatHistory, ChatMessage
+    from src.chat.repository import MESSAGE_COLUMNS, ChatRepository
+    from src.chat.schemas import ChatMessageResponse
+    from src.user.models import User
+
+    with SessionLocal() as db:
+        user_id = db.execute(select(User.id).limit(1)).scalar()
+        if user_id is None:
+            print("❌ Read model benchmark needs at least one user (make seed)")
+            return False
+        repo = ChatRepository(db)
+        history = repo.create_chat_history(user_id, title="benchmark read models")
+        for number in range(messages):
+            repo.create_chat_message(
+                history.id,
+                "user" if number % 2 == 0 else "assistant",
+                "Pesan contoh untuk pengukuran. " * 8,
+                model=None if number % 2 == 0 else "gemini-2.5-flash",
+            )
+        repo.commit()
+        chat_id = history.id
+
+    def page(*entities):
+        statement = select(*entities).where(
+            ChatMessage.chat_history_id == chat_id, ChatMessage.deleted == False
+        )
+        return ChatRepository._keyset_page(
+            statement, ChatMessage.created_date, ChatMessage.id, messages
+        )
+
+    def respond(loaded):
+        return [
+            ChatMessageResponse(
+                id=msg.id,
+                sender=msg.sender,
+                text=msg.text,
+                model=msg.model,
+                created_date=msg.created_date,
+            ).model_dump()
+            for msg in loaded
+        ]
+
+    def entities():
+        # Sesi baru per request, seperti get_db
+        with SessionLocal() as db:
+            return respond(db.execute(page(ChatMessage)).scalars().all())
+
+    def rows():
+        with SessionLocal() as db:
+            return respond(db.execute(page(*MESSAGE_COLUMNS)).all())
+
+    try:
+        print(f"{messages} messages per request, {repeats} requests")
+        print(f"{'read model':<12} {'cpu ms':>10} {'peak KiB':>10}")
+        results = {}
+        for name, run in (("entities", entities), ("rows", rows)):
+            run()  # warm-up
+            started = time.process_time()
+            for _ in range(repeats):
+                run()
+            cpu_ms = (time.process_time() - started) / repeats * 1000
+
+            tracemalloc.start()
+            run()
+            peak = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+
+            results[name] = (cpu_ms, peak)
+            print(f"{name:<12} {cpu_ms:>10.2f} {peak:>10.0f}")
+
+        (cpu_before, peak_before), (cpu_after, peak_after) = results.values()
+        print(f"   cpu saving: {(1 - cpu_after / cpu_before) * 100:.1f}%")
+        print(f"   memory saving: {(1 - peak_after / peak_before) * 100:.1f}%")
+    finally:
+        with SessionLocal() as db:
+            db.execute(
+                delete(ChatMessage).where(ChatMessage.chat_history_id == chat_id)
+            )
+            db.execute(delete(ChatHistory).where(ChatHistory.id == chat_id))
+            db.commit()
+    return True
+
+
+def benchmark_responses(messages=1000, repeats=50):
+    """
+    Render envelope detail percakapan `messages` pesan: model_dump +
+    jsonable_encoder + JSONResponse (stdlib json) vs create_success_response
+    dengan model langsung (orjson + model_dump_json). Body harus identik.
+    """
+    from datetime import timedelta
+
+    from fastapi.encoders import jsonable_encoder
+    from starlette.responses import JSONResponse
+
+    from src.chat.schemas import ChatHistoryDetail, ChatMessageResponse
+    from src.common.schemas import create_success_response
+    from src.utils.date import now
+
+    started_at = now()
+    detail = ChatHistoryDetail(
+        id=new_id(),
+        title="Percakapan panjang ✨",
+        model="gemini-2.5-flash",
+        language="id",
+        is_active=True,
+        created_date=started_at,
+        updated_date=started_at,
+        message_count=messages,
+        messages=[
+            ChatMessageResponse(
+                id=new_id(),
+                sender="user" if number % 2 == 0 else "assistant",
+                text="Pesan contoh untuk pengukuran, dengan “kutipan” dan é. " * 8,
+                model=None if number % 2 == 0 else "gemini-2.5-flash",
+                created_date=started_at + timedelta(seconds=number),
+            )
+            for number in range(messages)
+        ],
+    )
+    message = "Successfully fetched chat history"
+
+    def legacy():
+        content = jsonable_encoder({"message": message, "data": detail.model_dump()})
+        return JSONResponse(status_code=200, content=content).body
+
+    def fast():
+        return create_success_response(message, detail, 200).body
+
+    legacy_body, fast_body = legacy(), fast()
+    if legacy_body != fast_body:
+        print("❌ Response bodies differ")
+        return False
+
+    # Float: eksponen ditulis berbeda oleh orjson, nilainya harus tetap sama
+    floats = {"rank": [1e-05, 2.5e-07, 1e20, 0.1, 1 / 3, 8.339605608848528]}
+    legacy_floats = JSONResponse(status_code=200, content=floats).body
+    fast_floats = create_success_response(message, floats, 200).body
+    if json.loads(legacy_floats) != json.loads(fast_floats)["data"]:
+        print("❌ Float values differ")
+        return False
+
+    print(
+        f"{messages} messages per response ({len(fast_body) / 1024:.0f} KiB), "
+        f"{repeats} responses, bodies identical, float values equal"
+    )
+    print(f"{'envelope':<10} {'cpu ms':>10}")
+    results = {}
+    for name, render in (("legacy", legacy), ("orjson", fast)):
+        started = time.process_time()
+        for _ in range(repeats):
+            render()
+        results[name] = (time.process_time() - started) / repeats * 1000
+        print(f"{name:<10} {results[name]:>10.2f}")
+    print(f"   speedup: {results['legacy'] / results['orjson']:.1f}x")
+    return True
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python benchmark.py ids [rows]       # Bandingkan uuid4 vs UUIDv7")
+        print(
+            "  python benchmark.py storage [rows]"
+            "   # Ukuran row/index legacy vs compact"
+        )
+        print(
+            "  python benchmark.py concurrency [requests] [concurrency]"
+            "  # Session sync vs async"
+        )
+        print(
+            "  python benchmark.py statements [calls] "
+            "# CPU query dibangun ulang vs cached"
+        )
+        print(
+            "  python benchmark.py read-models [messages] "
+            "# Entity ORM vs row kolom untuk detail chat"
+        )
+        print(
+            "  python benchmark.py responses [messages] "
+            "# Envelope jsonable_encoder vs orjson"
+        )
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "ids":
+        rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+        success = benchmark_ids(rows)
+
+    elif command == "storage":
+        rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+        success = benchmark_storage(rows)
+
+    elif command == "concurrency":
+        requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+        concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+        success = benchmark_concurrency(requests, concurrency)
+
+    elif command == "statements":
+        calls = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+        success = benchmark_statements(calls)
+
+    elif command == "read-models":
+        messages = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        success = benchmark_read_models(messages)
+
+    elif command == "responses":
+        messages = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        success = benchmark_responses(messages)
+
+    else:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
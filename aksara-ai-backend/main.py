@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import sys
+from contextlib import asynccontextmanager
 
 import uvicorn as uvicorn
 from decouple import config
@@ -9,9 +11,12 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.admin.config import setup_admin_routes
+from src.chat.retention import PURGE_INTERVAL_HOURS, run_purge_loop
 from src.chat.router import routerChat
+from src.config.postgres import check_pool_capacity
 from src.health.router import routerHealth
 from src.middleware.ip_middleware import AddClientIPMiddleware
+from src.quota.tracker import quota_tracker
 from src.refresh_token.router import routerRefreshToken
 from src.user.router import routerUser
 from src.utils.allowed_middleware import (
@@ -19,6 +24,12 @@ from src.utils.allowed_middleware import (
     ALLOWED_METHODS,
     ALLOWED_ORIGINS,
 )
+from src.utils.replica import (
+    LAST_WRITE_HEADER,
+    finish_write_tracking,
+    start_write_tracking,
+)
+from src.utils.sql_stats import finish_request, start_request
 
 # environment server
 ENVIRONMENT = config("ENVIRONMENT", default="prod")
@@ -56,8 +67,32 @@ async def custom_exception_handler(request, exc):
         )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pool sizing vs server max_connections (warning only)
+    try:
+        await asyncio.to_thread(check_pool_capacity)
+    except Exception as e:
+        logger.warning(f"Pool capacity check failed: {e}")
+
+    # Background jobs
+    quota_flush_task = asyncio.create_task(quota_tracker.run_flush_loop())
+    purge_task = (
+        asyncio.create_task(run_purge_loop()) if PURGE_INTERVAL_HOURS > 0 else None
+    )
+
+    yield
+
+    quota_flush_task.cancel()
+    if purge_task:
+        purge_task.cancel()
+    # Persist counters that have not been flushed yet
+    await asyncio.to_thread(quota_tracker.flush)
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
+        lifespan=lifespan,
         swagger_ui_parameters={"syntaxHighlight.theme": "obsidian"},
         version="1.0.0",
         title="RESTful API Aksara AI Backend",
@@ -84,8 +119,30 @@ def create_app() -> FastAPI:
         allow_methods=ALLOWED_METHODS,  # Allows all HTTP methods
         allow_headers=ALLOWED_HEADERS,  # Allows all headers (Authorization, Content-Type, etc.)
         allow_credentials=True,  # Allows cookies or authentication credentials
+        expose_headers=[LAST_WRITE_HEADER],  # Read-your-writes across workers
     )
 
+    # Middleware for per-request SQL stats (queries, rows, time)
+    @app.middleware("http")
+    async def sql_request_stats(request: Request, call_next):
+        token = start_request(f"{request.method} {request.url.path}")
+        try:
+            return await call_next(request)
+        finally:
+            finish_request(token)
+
+    # Middleware for read-your-writes: tell the client when this request wrote
+    @app.middleware("http")
+    async def last_write_header(request: Request, call_next):
+        token = start_write_tracking()
+        try:
+            response: Response = await call_next(request)
+        finally:
+            last_write = finish_write_tracking(token)
+        if last_write:
+            response.headers[LAST_WRITE_HEADER] = last_write
+        return response
+
     # Middleware for adding security headers
     @app.middleware("http")
     async def add_security_headers(request: Request, call_next):
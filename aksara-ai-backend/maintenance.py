@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Maintenance script untuk data Aksara AI Backend
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Tambahkan root project ke sys.path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.chat.archive import CHAT_ARCHIVE_AFTER_DAYS
+from src.chat.models import ChatHistory
+from src.chat.partitions import (
+    create_message_partitions,
+    get_partition_bounds,
+    is_partitioned,
+)
+from src.chat.repository import ChatRepository
+from src.chat.retention import CHAT_RETENTION_DAYS, purge_chat_data
+from src.config.postgres import SessionLocal
+from src.utils.date import now
+
+
+def check_chat_summaries(repair=False, limit=100):
+    """Cek ringkasan chat_histories (message_count, preview, last_message_at)"""
+    db = SessionLocal()
+    repo = ChatRepository(db)
+    try:
+        rows = repo.get_inconsistent_chat_histories(limit=None if repair else limit)
+        if not rows:
+            print("✅ Chat history summaries are consistent")
+            return True
+
+        print(f"❌ Found {len(rows)} inconsistent chat histories:")
+        for row in rows[:limit]:
+            print(
+                f"   {row.id}: message_count={row.message_count} "
+                f"(expected {row.expected_message_count}), "
+                f"last_message_at={row.last_message_at} "
+                f"(expected {row.expected_last_message_at})"
+            )
+
+        if not repair:
+            print("   Run 'python maintenance.py repair-summaries' to fix them")
+            return False
+
+        for row in rows:
+            repo.refresh_chat_history_summary(row.id)
+        repo.commit()
+        print(f"✅ Repaired {len(rows)} chat histories")
+        return True
+    except Exception as e:
+        repo.rollback()
+        print(f"❌ Summary check failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def create_partitions(months_ahead=3):
+    """Buat partisi bulanan chat_messages untuk bulan-bulan berikutnya"""
+    db = SessionLocal()
+    try:
+        if not is_partitioned(db):
+            print("⚠️  chat_messages is not partitioned (Postgres + migration 014)")
+            return True
+
+        created = create_message_partitions(db, months_ahead=months_ahead)
+        db.commit()
+        for name in created:
+            print(f"   ✅ {name}")
+        print(f"✅ {len(created)} partitions created or already present")
+
+        for name, upper_bound in get_partition_bounds(db):
+            print(f"   {name}: until {upper_bound or '(default)'}")
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Creating partitions failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def archive_chats(days=CHAT_ARCHIVE_AFTER_DAYS, batch_size=100):
+    """Pindahkan percakapan yang tidak aktif N hari ke chat_archives"""
+    db = SessionLocal()
+    repo = ChatRepository(db)
+    cutoff = now() - timedelta(days=days)
+    chats = messages = original_bytes = archived_bytes = 0
+    try:
+        print(f"🗄️  Archiving chats inactive since {cutoff:%Y-%m-%d %H:%M}")
+        while True:
+            chat_ids = repo.get_archivable_chat_history_ids(cutoff, batch_size)
+            if not chat_ids:
+                break
+            for chat_id in chat_ids:
+                archive = repo.archive_chat_history(chat_id, cutoff)
+                if archive:
+                    chats += 1
+                    messages += archive.message_count
+                    original_bytes += archive.original_bytes
+                    archived_bytes += len(archive.payload)
+            repo.commit()
+            print(f"   ... {chats} chats archived")
+
+        reclaimed = original_bytes - archived_bytes
+        print(f"✅ Archived {chats} chats ({messages} messages)")
+        print(
+            f"   {original_bytes} bytes of message rows -> {archived_bytes} bytes "
+            f"compressed, {reclaimed} bytes reclaimed"
+        )
+        print("   (Postgres reuses the space after VACUUM)")
+        return True
+    except Exception as e:
+        repo.rollback()
+        print(f"❌ Archiving failed after {chats} chats: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def restore_chats(batch_size=100):
+    """Kembalikan semua percakapan dari chat_archives ke chat_messages"""
+    db = SessionLocal()
+    repo = ChatRepository(db)
+    chats = messages = 0
+    try:
+        while True:
+            chat_ids = repo.get_archived_chat_history_ids(batch_size)
+            if not chat_ids:
+                break
+            for chat_id in chat_ids:
+                # Soft-deleted histories are restored too
+                chat = db.get(ChatHistory, chat_id)
+                messages += repo.restore_chat_history(chat)
+                chats += 1
+            repo.commit()
+        print(f"✅ Restored {chats} chats ({messages} messages)")
+        return True
+    except Exception as e:
+        repo.rollback()
+        print(f"❌ Restoring failed after {chats} chats: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def purge(days=CHAT_RETENTION_DAYS):
+    """Hapus permanen data chat yang sudah dihapus (soft delete) dan chat kosong"""
+
+    def report(kind, deleted, totals):
+        print(
+            f"   batch {totals['batches']}: {deleted} {kind} "
+            f"(total {totals['messages']} messages, {totals['histories']} histories)"
+        )
+
+    try:
+        print(f"🧹 Purging chat data soft-deleted more than {days} days ago...")
+        totals = purge_chat_data(retention_days=days, progress=report)
+        if totals is None:
+            print("⚠️  Another purge is running, skipped")
+            return True
+        print(
+            f"✅ Purged {totals['messages']} messages and "
+            f"{totals['histories']} chat histories in {totals['batches']} batches"
+        )
+        return True
+    except Exception as e:
+        print(f"❌ Purge failed: {e}")
+        return False
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print(
+            "  python maintenance.py check-summaries   # Cek ringkasan chat_histories"
+        )
+        print(
+            "  python maintenance.py repair-summaries  # Perbaiki ringkasan yang salah"
+        )
+        print(
+            "  python maintenance.py create-partitions [months]"
+            "  # Partisi chat_messages"
+        )
+        print(
+            "  python maintenance.py archive-chats [days]  # Arsipkan chat tidak aktif"
+        )
+        print("  python maintenance.py restore-chats  # Kembalikan semua arsip chat")
+        print("  python maintenance.py purge [days]  # Hapus permanen data chat lama")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "check-summaries":
+        success = check_chat_summaries()
+
+    elif command == "repair-summaries":
+        success = check_chat_summaries(repair=True)
+
+    elif command == "create-partitions":
+        months = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+        success = create_partitions(months_ahead=months)
+
+    elif command == "archive-chats":
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else CHAT_ARCHIVE_AFTER_DAYS
+        success = archive_chats(days=days)
+
+    elif command == "restore-chats":
+        success = restore_chats()
+
+    elif command == "purge":
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else CHAT_RETENTION_DAYS
+        success = purge(days=days)
+
+    else:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
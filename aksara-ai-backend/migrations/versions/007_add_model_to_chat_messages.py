@@ -0,0 +1,25 @@
+"""add model to chat_messages
+
+Revision ID: 007_add_model_to_chat_messages
+Revises: 006_add_created_date_to_messages
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "007_add_model_to_chat_messages"
+down_revision = "006_add_created_date_to_messages"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Model that generated each assistant reply (chosen by prompt routing)
+    op.add_column("chat_messages", sa.Column("model", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("chat_messages", "model")
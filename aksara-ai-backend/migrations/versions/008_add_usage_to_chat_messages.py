@@ -0,0 +1,36 @@
+"""add token usage and timing to chat_messages
+
+Revision ID: 008_add_usage_to_chat_messages
+Revises: 007_add_model_to_chat_messages
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008_add_usage_to_chat_messages"
+down_revision = "007_add_model_to_chat_messages"
+branch_labels = None
+depends_on = None
+
+
+USAGE_COLUMNS = [
+    "prompt_tokens",
+    "output_tokens",
+    "cached_tokens",
+    "latency_ms",
+    "ttft_ms",
+]
+
+
+def upgrade() -> None:
+    # Usage metadata and upstream timing, filled for assistant messages only
+    for column in USAGE_COLUMNS:
+        op.add_column("chat_messages", sa.Column(column, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    for column in reversed(USAGE_COLUMNS):
+        op.drop_column("chat_messages", column)
@@ -0,0 +1,63 @@
+"""add token quota tables
+
+Revision ID: 009_add_token_quota_tables
+Revises: 008_add_usage_to_chat_messages
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "009_add_token_quota_tables"
+down_revision = "008_add_usage_to_chat_messages"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-user quota overrides (role defaults come from configuration)
+    op.create_table(
+        "token_quotas",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("daily_output_tokens", sa.Integer(), nullable=False),
+        sa.Column("created_by", sa.String(), nullable=True),
+        sa.Column(
+            "created_date",
+            sa.DateTime(),
+            nullable=True,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("updated_by", sa.String(), nullable=True),
+        sa.Column(
+            "updated_date",
+            sa.DateTime(),
+            nullable=True,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+    )
+
+    # Daily usage counters flushed by every worker
+    op.create_table(
+        "token_usage_daily",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("usage_date", sa.Date(), nullable=False),
+        sa.Column("prompt_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_date",
+            sa.DateTime(),
+            nullable=True,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("user_id", "usage_date"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("token_usage_daily")
+    op.drop_table("token_quotas")
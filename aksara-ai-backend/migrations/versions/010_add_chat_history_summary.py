@@ -0,0 +1,60 @@
+"""add denormalized message summary to chat_histories
+
+Revision ID: 010_add_chat_history_summary
+Revises: 009_add_token_quota_tables
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "010_add_chat_history_summary"
+down_revision = "009_add_token_quota_tables"
+branch_labels = None
+depends_on = None
+
+
+# Same length as MESSAGE_PREVIEW_LENGTH in src/chat/repository.py
+PREVIEW_LENGTH = 100
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat_histories",
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "chat_histories", sa.Column("last_message_preview", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "chat_histories", sa.Column("last_message_at", sa.DateTime(), nullable=True)
+    )
+
+    # Backfill from existing messages
+    op.execute(sa.text(f"""
+            UPDATE chat_histories SET
+                message_count = (
+                    SELECT count(*) FROM chat_messages m
+                    WHERE m.chat_history_id = chat_histories.id AND m.deleted = false
+                ),
+                last_message_preview = (
+                    SELECT substr(m.text, 1, {PREVIEW_LENGTH}) FROM chat_messages m
+                    WHERE m.chat_history_id = chat_histories.id AND m.deleted = false
+                    ORDER BY m.created_date DESC, m.id DESC
+                    LIMIT 1
+                ),
+                last_message_at = (
+                    SELECT m.created_date FROM chat_messages m
+                    WHERE m.chat_history_id = chat_histories.id AND m.deleted = false
+                    ORDER BY m.created_date DESC, m.id DESC
+                    LIMIT 1
+                )
+            """))
+
+
+def downgrade() -> None:
+    op.drop_column("chat_histories", "last_message_at")
+    op.drop_column("chat_histories", "last_message_preview")
+    op.drop_column("chat_histories", "message_count")
@@ -0,0 +1,75 @@
+"""replace boolean chat indexes with composite partial indexes
+
+Revision ID: 011_add_composite_chat_indexes
+Revises: 010_add_chat_history_summary
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "011_add_composite_chat_indexes"
+down_revision = "010_add_chat_history_summary"
+branch_labels = None
+depends_on = None
+
+
+LIVE_HISTORY = sa.text("deleted = false AND is_active = true")
+LIVE_MESSAGE = sa.text("deleted = false")
+
+# Low-selectivity single-column indexes that no hot query can use
+BOOLEAN_INDEXES = [
+    ("ix_chat_histories_deleted", "chat_histories", "deleted"),
+    ("ix_chat_histories_is_active", "chat_histories", "is_active"),
+    ("ix_chat_messages_deleted", "chat_messages", "deleted"),
+]
+
+
+def upgrade() -> None:
+    # Build without blocking writes on Postgres (CONCURRENTLY needs autocommit)
+    with op.get_context().autocommit_block():
+        # Sidebar: user_id + live filter ordered by (updated_date, id)
+        op.create_index(
+            "ix_chat_histories_user_activity",
+            "chat_histories",
+            ["user_id", "updated_date", "id"],
+            postgresql_where=LIVE_HISTORY,
+            sqlite_where=LIVE_HISTORY,
+            postgresql_concurrently=True,
+        )
+        # Conversation: chat_history_id + live filter ordered by (created_date, id)
+        op.create_index(
+            "ix_chat_messages_history_created",
+            "chat_messages",
+            ["chat_history_id", "created_date", "id"],
+            postgresql_where=LIVE_MESSAGE,
+            sqlite_where=LIVE_MESSAGE,
+            postgresql_concurrently=True,
+        )
+
+        for name, table, _ in BOOLEAN_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in BOOLEAN_INDEXES:
+            op.create_index(name, table, [column], postgresql_concurrently=True)
+
+        op.drop_index(
+            "ix_chat_messages_history_created",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_histories_user_activity",
+            table_name="chat_histories",
+            postgresql_concurrently=True,
+        )
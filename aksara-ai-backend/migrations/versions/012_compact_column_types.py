@@ -0,0 +1,326 @@
+"""compact column types: native uuid, smallint enums and timestamptz
+
+Revision ID: 012_compact_column_types
+Revises: 011_add_composite_chat_indexes
+Create Date: 2026-10-19 14:00:00.000000
+
+Postgres only (SQLite dev databases are created from the models).
+
+chat_messages is converted online: shadow columns kept in sync by a trigger,
+batched backfill, indexes built concurrently, then a short swap. The other
+tables are small and are altered in place inside the swap transaction.
+Deploy the application right after the swap, old code writes sender as text.
+Every step before the swap can be re-run if the migration is interrupted.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "012_compact_column_types"
+down_revision = "011_add_composite_chat_indexes"
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 5000
+TIMEZONE = "Asia/Jakarta"
+UUID_PATTERN = "^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$"
+
+# Primary keys converted to uuid (foreign keys pointing at them follow)
+UUID_PRIMARY_KEYS = {"user": "id", "user_profile": "id", "chat_histories": "id"}
+
+# Small tables whose naive timestamps become timestamptz in place
+TIMESTAMP_TABLES = [
+    "user",
+    "user_profile",
+    "chat_histories",
+    "token_quotas",
+    "token_usage_daily",
+]
+
+# Same codes as ROLE_CODES / SENDER_CODES in the models
+ROLE_TO_CODE = "CASE WHEN upper(role::text) = 'ADMIN' THEN 1 ELSE 2 END"
+CODE_TO_ROLE = "CASE WHEN role = 1 THEN 'ADMIN' ELSE 'USER' END"
+CODE_TO_SENDER = "CASE WHEN sender = 1 THEN 'user' ELSE 'assistant' END"
+
+# chat_messages shadow columns: column -> (new type, value from a row)
+# Anything that is not 'user' is a model reply (older rows used 'model')
+MESSAGE_COLUMNS = {
+    "id": ("uuid", "NEW.id::uuid"),
+    "chat_history_id": ("uuid", "NEW.chat_history_id::uuid"),
+    "sender": ("smallint", "CASE WHEN NEW.sender = 'user' THEN 1 ELSE 2 END"),
+    "created_date": ("timestamptz", f"NEW.created_date AT TIME ZONE '{TIMEZONE}'"),
+    "updated_date": ("timestamptz", f"NEW.updated_date AT TIME ZONE '{TIMEZONE}'"),
+}
+MESSAGE_NOT_NULL = ["id", "chat_history_id", "sender"]
+
+# Indexes built on the shadow columns, renamed to the final names on swap
+MESSAGE_INDEXES = {
+    "ix_chat_messages_chat_history_id": "(chat_history_id_new)",
+    "ix_chat_messages_history_created": (
+        "(chat_history_id_new, created_date_new, id_new) WHERE deleted = false"
+    ),
+    "ix_chat_messages_created_date": "(created_date_new)",
+}
+
+
+def _uuid_foreign_keys(bind):
+    """Foreign keys (table, fk) referencing a converted primary key"""
+    inspector = sa.inspect(bind)
+    return [
+        (table, fk)
+        for table in inspector.get_table_names()
+        for fk in inspector.get_foreign_keys(table)
+        if fk["referred_table"] in UUID_PRIMARY_KEYS
+    ]
+
+
+def _timestamp_columns(bind, table, timezone):
+    """Timestamp columns of a table, with or without time zone"""
+    return [
+        column["name"]
+        for column in sa.inspect(bind).get_columns(table)
+        if isinstance(column["type"], sa.DateTime)
+        and bool(column["type"].timezone) == timezone
+    ]
+
+
+def _alter(table, clauses):
+    """Single ALTER TABLE so the table is rewritten once"""
+    if clauses:
+        op.execute(f'ALTER TABLE "{table}" ' + ", ".join(clauses))
+
+
+def _drop_foreign_keys(foreign_keys):
+    for table, fk in foreign_keys:
+        op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{fk["name"]}"')
+
+
+def _add_foreign_keys(foreign_keys, not_valid=False):
+    for table, fk in foreign_keys:
+        columns = ", ".join(fk["constrained_columns"])
+        referred = ", ".join(fk["referred_columns"])
+        ondelete = fk.get("options", {}).get("ondelete")
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{fk["name"]}" '
+            f'FOREIGN KEY ({columns}) REFERENCES "{fk["referred_table"]}" ({referred})'
+            + (f" ON DELETE {ondelete}" if ondelete else "")
+            + (" NOT VALID" if not_valid else "")
+        )
+
+
+def _check_uuid_values(bind, foreign_keys):
+    """Refuse to start when an id cannot be cast to uuid"""
+    columns = [(table, column) for table, column in UUID_PRIMARY_KEYS.items()]
+    columns += [("chat_messages", "id")]
+    columns += [
+        (table, column)
+        for table, fk in foreign_keys
+        for column in fk["constrained_columns"]
+    ]
+    invalid = []
+    for table, column in columns:
+        count = bind.execute(
+            sa.text(
+                f'SELECT count(*) FROM "{table}" '
+                f"WHERE {column} IS NOT NULL AND lower({column}::text) !~ :pattern"
+            ),
+            {"pattern": UUID_PATTERN},
+        ).scalar()
+        if count:
+            invalid.append(f"{table}.{column}: {count}")
+    if invalid:
+        raise RuntimeError("Non-uuid ids found, fix them first: " + ", ".join(invalid))
+
+
+def _prepare_messages(bind):
+    """Shadow columns, sync trigger, batched backfill and concurrent indexes"""
+    _alter(
+        "chat_messages",
+        [
+            f"ADD COLUMN IF NOT EXISTS {column}_new {new_type}"
+            for column, (new_type, _) in MESSAGE_COLUMNS.items()
+        ],
+    )
+
+    assignments = "\n".join(
+        f"    NEW.{column}_new := {value};"
+        for column, (_, value) in MESSAGE_COLUMNS.items()
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION chat_messages_compact_sync() RETURNS trigger AS $$
+        BEGIN
+        {assignments}
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS chat_messages_compact_sync ON chat_messages")
+    op.execute(
+        "CREATE TRIGGER chat_messages_compact_sync "
+        "BEFORE INSERT OR UPDATE ON chat_messages "
+        "FOR EACH ROW EXECUTE FUNCTION chat_messages_compact_sync()"
+    )
+
+    # No-op updates in primary key order; the trigger fills the shadow columns.
+    # The batch bound is computed in SQL so it follows the column collation.
+    last_id, total = "", 0
+    while True:
+        updated, last_id = bind.execute(
+            sa.text(
+                """
+                WITH batch AS (
+                    SELECT id FROM chat_messages
+                    WHERE id > :last_id
+                    ORDER BY id
+                    LIMIT :batch_size
+                ),
+                updated AS (
+                    UPDATE chat_messages m SET id = m.id
+                    FROM batch
+                    WHERE m.id = batch.id AND m.id_new IS NULL
+                    RETURNING 1
+                )
+                SELECT (SELECT count(*) FROM updated), (SELECT max(id) FROM batch)
+                """
+            ),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).one()
+        if last_id is None:
+            break
+        total += updated
+        print(f"   chat_messages backfilled: {total}")
+
+    # Validated checks let SET NOT NULL skip the full table scan on swap
+    for column in MESSAGE_NOT_NULL:
+        name = f"chat_messages_{column}_new_not_null"
+        op.execute(f"ALTER TABLE chat_messages DROP CONSTRAINT IF EXISTS {name}")
+        op.execute(
+            f"ALTER TABLE chat_messages ADD CONSTRAINT {name} "
+            f"CHECK ({column}_new IS NOT NULL) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE chat_messages VALIDATE CONSTRAINT {name}")
+
+    op.execute(
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS chat_messages_id_new_key "
+        "ON chat_messages (id_new)"
+    )
+    for name, definition in MESSAGE_INDEXES.items():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name}_new "
+            f"ON chat_messages {definition}"
+        )
+
+
+def _swap(bind, foreign_keys):
+    """Short transaction: small tables in place, chat_messages column swap"""
+    op.execute("SET LOCAL lock_timeout = '10s'")
+    _drop_foreign_keys(foreign_keys)
+
+    uuid_columns = {table: [column] for table, column in UUID_PRIMARY_KEYS.items()}
+    for table, fk in foreign_keys:
+        if table != "chat_messages":
+            uuid_columns.setdefault(table, []).extend(fk["constrained_columns"])
+
+    for table in set(uuid_columns) | set(TIMESTAMP_TABLES):
+        clauses = [
+            f"ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+            for column in uuid_columns.get(table, [])
+        ]
+        if table in TIMESTAMP_TABLES:
+            clauses += [
+                f"ALTER COLUMN {column} TYPE timestamptz "
+                f"USING {column} AT TIME ZONE '{TIMEZONE}'"
+                for column in _timestamp_columns(bind, table, timezone=False)
+            ]
+        if table == "user":
+            clauses += [
+                "ALTER COLUMN role DROP DEFAULT",
+                f"ALTER COLUMN role TYPE smallint USING {ROLE_TO_CODE}",
+            ]
+        _alter(table, clauses)
+    op.execute("DROP TYPE IF EXISTS userrole")
+
+    op.execute("DROP TRIGGER chat_messages_compact_sync ON chat_messages")
+    op.execute("DROP FUNCTION chat_messages_compact_sync()")
+    _alter("chat_messages", [f"DROP COLUMN {column}" for column in MESSAGE_COLUMNS])
+    for column in MESSAGE_COLUMNS:
+        op.execute(f"ALTER TABLE chat_messages RENAME COLUMN {column}_new TO {column}")
+    _alter(
+        "chat_messages",
+        [f"ALTER COLUMN {column} SET NOT NULL" for column in MESSAGE_NOT_NULL]
+        + [
+            "ADD CONSTRAINT chat_messages_pkey PRIMARY KEY "
+            "USING INDEX chat_messages_id_new_key"
+        ],
+    )
+    _alter(
+        "chat_messages",
+        [
+            f"DROP CONSTRAINT chat_messages_{column}_new_not_null"
+            for column in MESSAGE_NOT_NULL
+        ]
+        + [
+            "ALTER COLUMN created_date SET DEFAULT now()",
+            "ALTER COLUMN updated_date SET DEFAULT now()",
+        ],
+    )
+    for name in MESSAGE_INDEXES:
+        op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+    # Checked after commit without blocking writes
+    _add_foreign_keys(foreign_keys, not_valid=True)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    foreign_keys = _uuid_foreign_keys(bind)
+    _check_uuid_values(bind, foreign_keys)
+
+    with op.get_context().autocommit_block():
+        _prepare_messages(bind)
+
+    _swap(bind, foreign_keys)
+
+    with op.get_context().autocommit_block():
+        for table, fk in foreign_keys:
+            op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{fk["name"]}"')
+
+
+def downgrade() -> None:
+    # Offline: every table is rewritten in place
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    foreign_keys = _uuid_foreign_keys(bind)
+    _drop_foreign_keys(foreign_keys)
+
+    uuid_columns = {table: [column] for table, column in UUID_PRIMARY_KEYS.items()}
+    uuid_columns["chat_messages"] = ["id"]
+    for table, fk in foreign_keys:
+        uuid_columns.setdefault(table, []).extend(fk["constrained_columns"])
+
+    for table in set(uuid_columns) | set(TIMESTAMP_TABLES) | {"chat_messages"}:
+        clauses = [
+            f"ALTER COLUMN {column} TYPE varchar USING {column}::text"
+            for column in uuid_columns.get(table, [])
+        ]
+        clauses += [
+            f"ALTER COLUMN {column} TYPE timestamp "
+            f"USING {column} AT TIME ZONE '{TIMEZONE}'"
+            for column in _timestamp_columns(bind, table, timezone=True)
+        ]
+        if table == "user":
+            clauses.append(f"ALTER COLUMN role TYPE varchar USING {CODE_TO_ROLE}")
+        if table == "chat_messages":
+            clauses.append(f"ALTER COLUMN sender TYPE varchar USING {CODE_TO_SENDER}")
+        _alter(table, clauses)
+
+    _add_foreign_keys(foreign_keys)
@@ -0,0 +1,83 @@
+"""add full-text search over chat messages
+
+Revision ID: 013_add_chat_message_search
+Revises: 012_compact_column_types
+Create Date: 2026-10-19 15:00:00.000000
+
+Postgres: generated tsvector column + GIN index on live messages. Adding a
+stored generated column rewrites chat_messages once (ACCESS EXCLUSIVE), so
+run this in a quiet window; the index itself is built concurrently.
+SQLite (dev): FTS5 external-content table kept in sync by triggers.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "013_add_chat_message_search"
+down_revision = "012_compact_column_types"
+branch_labels = None
+depends_on = None
+
+
+# 'simple' (no stemming) because conversations mix Indonesian and English
+SEARCH_CONFIG = "simple"
+
+SQLITE_TRIGGERS = {
+    "chat_messages_fts_insert": """
+        AFTER INSERT ON chat_messages BEGIN
+            INSERT INTO chat_messages_fts(rowid, text) VALUES (new.rowid, new.text);
+        END
+    """,
+    "chat_messages_fts_delete": """
+        AFTER DELETE ON chat_messages BEGIN
+            INSERT INTO chat_messages_fts(chat_messages_fts, rowid, text)
+            VALUES ('delete', old.rowid, old.text);
+        END
+    """,
+    "chat_messages_fts_update": """
+        AFTER UPDATE OF text ON chat_messages BEGIN
+            INSERT INTO chat_messages_fts(chat_messages_fts, rowid, text)
+            VALUES ('delete', old.rowid, old.text);
+            INSERT INTO chat_messages_fts(rowid, text) VALUES (new.rowid, new.text);
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts "
+            "USING fts5(text, content='chat_messages', content_rowid='rowid')"
+        )
+        for name, body in SQLITE_TRIGGERS.items():
+            op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+        # Index the existing messages
+        op.execute(
+            "INSERT INTO chat_messages_fts(chat_messages_fts) VALUES ('rebuild')"
+        )
+        return
+
+    op.execute(
+        "ALTER TABLE chat_messages ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(text, ''))) "
+        "STORED"
+    )
+    # Build without blocking writes (CONCURRENTLY needs autocommit)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chat_messages_search "
+            "ON chat_messages USING gin (search_vector) WHERE deleted = false"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for name in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS chat_messages_fts")
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chat_messages_search")
+    op.execute("ALTER TABLE chat_messages DROP COLUMN IF EXISTS search_vector")
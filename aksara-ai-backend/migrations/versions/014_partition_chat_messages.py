@@ -0,0 +1,186 @@
+"""partition chat_messages by month on created_date
+
+Revision ID: 014_partition_chat_messages
+Revises: 013_add_chat_message_search
+Create Date: 2026-10-19 16:00:00.000000
+
+Postgres only (SQLite dev databases keep a plain table).
+
+The existing table is not copied: it becomes the partition holding
+everything up to the start of next month (chat_messages_legacy), so it can
+later be archived or detached as one unit. A validated check constraint and
+indexes prepared beforehand let ATTACH skip the table scan and reuse them.
+New rows land in monthly partitions; keep them created ahead with
+`python maintenance.py create-partitions`.
+The primary key becomes (id, created_date) because a partitioned table's
+unique constraints must include the partition key.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "014_partition_chat_messages"
+down_revision = "013_add_chat_message_search"
+branch_labels = None
+depends_on = None
+
+
+TIMEZONE = "Asia/Jakarta"
+MONTHS_AHEAD = 3
+
+LEGACY = "chat_messages_legacy"
+BOUND_CHECK = "chat_messages_legacy_bound"
+LEGACY_KEY = "chat_messages_legacy_id_created_key"
+
+# Indexes re-created on the partitioned parent; ATTACH reuses the legacy ones
+MESSAGE_INDEXES = {
+    "ix_chat_messages_chat_history_id": "(chat_history_id)",
+    "ix_chat_messages_history_created": (
+        "(chat_history_id, created_date, id) WHERE deleted = false"
+    ),
+    "ix_chat_messages_created_date": "(created_date)",
+    "ix_chat_messages_search": "USING gin (search_vector) WHERE deleted = false",
+}
+
+
+def _legacy_bound(bind):
+    """Start of the month after the newest message (or after now)"""
+    return bind.execute(
+        sa.text(
+            "SELECT (date_trunc('month', greatest(now(), max(created_date)) "
+            "AT TIME ZONE :tz) + interval '1 month') AT TIME ZONE :tz "
+            "FROM chat_messages"
+        ),
+        {"tz": TIMEZONE},
+    ).scalar()
+
+
+def _history_foreign_key(bind):
+    """Reflected chat_messages -> chat_histories FK (as created by 004 / 012)"""
+    for fk in sa.inspect(bind).get_foreign_keys("chat_messages"):
+        if fk["referred_table"] == "chat_histories":
+            return fk
+    return {
+        "name": "chat_messages_chat_history_id_fkey",
+        "options": {"ondelete": "CASCADE"},
+    }
+
+
+def _monthly_partitions(bind, start):
+    """Create the monthly partitions from `start` and the default partition"""
+    months = bind.execute(
+        sa.text(
+            "SELECT to_char(month, 'YYYY_MM') AS suffix, "
+            "month AT TIME ZONE :tz AS month_start, "
+            "(month + interval '1 month') AT TIME ZONE :tz AS month_end "
+            "FROM generate_series(CAST(:start AS timestamptz) AT TIME ZONE :tz, "
+            "date_trunc('month', now() AT TIME ZONE :tz) "
+            f"+ interval '{MONTHS_AHEAD} months', interval '1 month') AS month"
+        ),
+        {"tz": TIMEZONE, "start": start},
+    ).all()
+    for suffix, month_start, month_end in months:
+        op.execute(
+            f"CREATE TABLE chat_messages_{suffix} PARTITION OF chat_messages "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') "
+            f"TO ('{month_end.isoformat()}')"
+        )
+    # Safety net for rows outside the created months, normally empty
+    op.execute("CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # The partition key joins the primary key, so it can't stay NULL
+    op.execute(
+        "UPDATE chat_messages SET created_date = coalesce(updated_date, now()) "
+        "WHERE created_date IS NULL"
+    )
+    bound = _legacy_bound(bind)
+    history_fk = _history_foreign_key(bind)
+    ondelete = history_fk.get("options", {}).get("ondelete")
+
+    with op.get_context().autocommit_block():
+        # Validated check = partition constraint proven, ATTACH skips the scan
+        op.execute(f"ALTER TABLE chat_messages DROP CONSTRAINT IF EXISTS {BOUND_CHECK}")
+        op.execute(
+            f"ALTER TABLE chat_messages ADD CONSTRAINT {BOUND_CHECK} "
+            "CHECK (created_date IS NOT NULL "
+            f"AND created_date < '{bound.isoformat()}') NOT VALID"
+        )
+        op.execute(f"ALTER TABLE chat_messages VALIDATE CONSTRAINT {BOUND_CHECK}")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {LEGACY_KEY} "
+            "ON chat_messages (id, created_date)"
+        )
+
+    # Swap: metadata only, the legacy rows are not touched
+    op.execute("ALTER TABLE chat_messages ALTER COLUMN created_date SET NOT NULL")
+    op.execute(
+        f"ALTER TABLE chat_messages ADD CONSTRAINT {LEGACY_KEY} "
+        f"UNIQUE USING INDEX {LEGACY_KEY}"
+    )
+    op.execute(f"ALTER TABLE chat_messages RENAME TO {LEGACY}")
+    op.execute(
+        f"ALTER TABLE {LEGACY} RENAME CONSTRAINT chat_messages_pkey TO {LEGACY}_pkey"
+    )
+    for name in MESSAGE_INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_legacy")
+
+    op.execute(
+        f"CREATE TABLE chat_messages (LIKE {LEGACY} INCLUDING DEFAULTS "
+        "INCLUDING GENERATED) PARTITION BY RANGE (created_date)"
+    )
+    # Same FK as the legacy table (ON DELETE CASCADE), so ATTACH merges them
+    op.execute(
+        "ALTER TABLE chat_messages "
+        "ADD CONSTRAINT chat_messages_pkey PRIMARY KEY (id, created_date), "
+        f"ADD CONSTRAINT {history_fk['name']} FOREIGN KEY (chat_history_id) "
+        "REFERENCES chat_histories (id)"
+        + (f" ON DELETE {ondelete}" if ondelete else "")
+    )
+    for name, definition in MESSAGE_INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON chat_messages {definition}")
+
+    op.execute(
+        f"ALTER TABLE chat_messages ATTACH PARTITION {LEGACY} "
+        f"FOR VALUES FROM (MINVALUE) TO ('{bound.isoformat()}')"
+    )
+    op.execute(f"ALTER TABLE {LEGACY} DROP CONSTRAINT {BOUND_CHECK}")
+    _monthly_partitions(bind, bound)
+
+
+def downgrade() -> None:
+    # Offline: rows of the monthly partitions are copied back into the legacy table
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    columns = ", ".join(
+        row[0]
+        for row in bind.execute(
+            sa.text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = :table AND is_generated = 'NEVER' "
+                "ORDER BY ordinal_position"
+            ),
+            {"table": LEGACY},
+        )
+    )
+    op.execute(f"ALTER TABLE chat_messages DETACH PARTITION {LEGACY}")
+    op.execute(f"INSERT INTO {LEGACY} ({columns}) SELECT {columns} FROM chat_messages")
+    op.execute("DROP TABLE chat_messages CASCADE")
+
+    op.execute(f"ALTER TABLE {LEGACY} RENAME TO chat_messages")
+    op.execute(
+        f"ALTER TABLE chat_messages RENAME CONSTRAINT {LEGACY}_pkey "
+        "TO chat_messages_pkey"
+    )
+    for name in MESSAGE_INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name}_legacy RENAME TO {name}")
+    op.execute(f"ALTER TABLE chat_messages DROP CONSTRAINT IF EXISTS {LEGACY_KEY}")
+    op.execute("ALTER TABLE chat_messages ALTER COLUMN created_date DROP NOT NULL")
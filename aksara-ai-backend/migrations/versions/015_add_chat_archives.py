@@ -0,0 +1,66 @@
+"""add chat_archives for inactive conversations
+
+Revision ID: 015_add_chat_archives
+Revises: 014_partition_chat_messages
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "015_add_chat_archives"
+down_revision = "014_partition_chat_messages"
+branch_labels = None
+depends_on = None
+
+
+# Same storage as UUIDString in src/utils/types.py
+UUID = sa.String().with_variant(postgresql.UUID(as_uuid=False), "postgresql")
+
+
+def upgrade() -> None:
+    # Constant default: metadata-only on Postgres, no table rewrite
+    op.add_column(
+        "chat_histories",
+        sa.Column(
+            "is_archived", sa.Boolean(), nullable=False, server_default=sa.false()
+        ),
+    )
+
+    # One row per archived conversation, messages as gzip-compressed JSON
+    op.create_table(
+        "chat_archives",
+        sa.Column("chat_history_id", UUID, nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "original_bytes", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "archived_date",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("chat_history_id"),
+        sa.ForeignKeyConstraint(["chat_history_id"], ["chat_histories.id"]),
+    )
+    # Payloads are already compressed, skip TOAST compression
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE chat_archives ALTER COLUMN payload SET STORAGE EXTERNAL"
+        )
+
+
+def downgrade() -> None:
+    archived = op.get_bind().execute(sa.text("SELECT count(*) FROM chat_archives"))
+    if archived.scalar():
+        raise RuntimeError(
+            "chat_archives is not empty, "
+            "run 'python maintenance.py restore-chats' first"
+        )
+    op.drop_table("chat_archives")
+    op.drop_column("chat_histories", "is_archived")
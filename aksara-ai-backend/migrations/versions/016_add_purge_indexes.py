@@ -0,0 +1,82 @@
+"""add partial indexes for the chat purge job
+
+Revision ID: 016_add_purge_indexes
+Revises: 015_add_chat_archives
+Create Date: 2026-10-19 18:00:00.000000
+
+Built without blocking writes. chat_messages is partitioned on Postgres, where
+CREATE INDEX CONCURRENTLY is not allowed on the parent: the index is created
+on the parent only, built concurrently per partition and then attached.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "016_add_purge_indexes"
+down_revision = "015_add_chat_archives"
+branch_labels = None
+depends_on = None
+
+
+# name -> (table, column, predicate); soft-deleted / empty rows are rare
+PURGE_INDEXES = {
+    "ix_chat_histories_purge": ("chat_histories", "updated_date", "deleted = true"),
+    "ix_chat_histories_empty": ("chat_histories", "created_date", "message_count = 0"),
+    "ix_chat_messages_purge": ("chat_messages", "updated_date", "deleted = true"),
+}
+
+
+def _partitions(bind, table):
+    return (
+        bind.execute(
+            sa.text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+        .scalars()
+        .all()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        for name, (table, column, predicate) in PURGE_INDEXES.items():
+            op.create_index(name, table, [column], sqlite_where=sa.text(predicate))
+        return
+
+    partitioned = {}
+    for name, (table, column, predicate) in PURGE_INDEXES.items():
+        partitions = _partitions(bind, table)
+        if partitions:
+            # Invalid until every partition index is attached
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} "
+                f"({column}) WHERE {predicate}"
+            )
+            partitioned[name] = partitions
+
+    with op.get_context().autocommit_block():
+        for name, (table, column, predicate) in PURGE_INDEXES.items():
+            targets = partitioned.get(name, [table])
+            for target in targets:
+                index = f"{target}_{name}" if name in partitioned else name
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                    f"ON {target} ({column}) WHERE {predicate}"
+                )
+
+    for name, partitions in partitioned.items():
+        for partition in partitions:
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition}_{name}")
+
+
+def downgrade() -> None:
+    # Dropping a partitioned index drops the attached partition indexes too
+    for name, (table, _, _) in PURGE_INDEXES.items():
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,57 @@
+"""backfill chat_histories.updated_date and make it NOT NULL
+
+Revision ID: 017_backfill_chat_history_dates
+Revises: 016_add_purge_indexes
+Create Date: 2026-10-19 19:00:00.000000
+
+updated_date is the keyset of the sidebar pages: legacy rows with NULL sort
+first under DESC, fall outside the (updated_date, id) < cursor comparison
+and can't be encoded as a cursor. chat_messages.created_date, the message
+keyset, is already NOT NULL on Postgres (014) and backfilled here for SQLite.
+
+On SQLite only the backfill runs; new dev databases get NOT NULL from the
+models.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017_backfill_chat_history_dates"
+down_revision = "016_add_purge_indexes"
+branch_labels = None
+depends_on = None
+
+
+NOT_NULL_CHECK = "chat_histories_updated_date_not_null"
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE chat_histories "
+        "SET updated_date = coalesce(last_message_at, created_date, CURRENT_TIMESTAMP) "
+        "WHERE updated_date IS NULL"
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        op.execute(
+            "UPDATE chat_messages "
+            "SET created_date = coalesce(updated_date, CURRENT_TIMESTAMP) "
+            "WHERE created_date IS NULL"
+        )
+        return
+
+    # Validated check first: SET NOT NULL then skips its scan under the lock
+    op.execute(
+        f"ALTER TABLE chat_histories ADD CONSTRAINT {NOT_NULL_CHECK} "
+        "CHECK (updated_date IS NOT NULL) NOT VALID"
+    )
+    op.execute(f"ALTER TABLE chat_histories VALIDATE CONSTRAINT {NOT_NULL_CHECK}")
+    op.execute("ALTER TABLE chat_histories ALTER COLUMN updated_date SET NOT NULL")
+    op.execute(f"ALTER TABLE chat_histories DROP CONSTRAINT {NOT_NULL_CHECK}")
+
+
+def downgrade() -> None:
+    # Backfilled values stay
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE chat_histories ALTER COLUMN updated_date DROP NOT NULL")
@@ -2,18 +2,23 @@
 AdminController - Business logic for admin functionality (API-based)
 """
 
+from datetime import date
+from typing import Optional, Union
+
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
-from src.admin.repository import AdminRepository
+from src.admin.repository import AdminRepository, AsyncAdminRepository
 from src.admin.schemas import (
     AdminUserCreateRequest,
     AdminUserUpdateRequest,
     ChangeUserRoleRequest,
     ToggleUserActiveRequest,
+    TokenQuotaUpdateRequest,
 )
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
 from src.constants import (
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
@@ -26,9 +31,12 @@ from src.middleware.middleware import (
     get_password_hash,
     get_user_id_from_token,
     require_admin_role,
+    require_admin_role_async,
 )
-from src.user.repository import UserRepository
-from src.utils.date import serialize_date
+from src.quota.repository import QuotaRepository
+from src.quota.tracker import ROLE_DAILY_OUTPUT_TOKENS, quota_tracker
+from src.user.repository import AsyncUserRepository, UserRepository
+from src.utils.date import date_range_bounds, serialize_date
 from src.utils.helper import formatError, ok, validateEmail
 
 
@@ -38,19 +46,19 @@ class AdminController:
     @staticmethod
     async def get_dashboard_statistics(
         authorization: str,
-        db: Session = Depends(get_db),
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
     ) -> JSONResponse:
         """Get dashboard statistics for admin"""
         try:
-            admin_role = require_admin_role(authorization, db)
+            admin_role = await require_admin_role_async(authorization, db)
             if not admin_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
                     detail="Access denied! Admin role required.",
                 )
 
-            repo = AdminRepository(db)
-            stats = repo.get_user_statistics()
+            repo = AsyncAdminRepository(db)
+            stats = await repo.get_user_statistics()
 
             return ok(stats, "Successfully retrieved statistics!", HTTP_OK)
         except HTTPException as e:
@@ -61,26 +69,25 @@ class AdminController:
     @staticmethod
     async def get_all_users(
         authorization: str,
-        db: Session = Depends(get_db),
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
     ) -> JSONResponse:
         """Get all users - Admin only"""
         try:
-            admin_role = require_admin_role(authorization, db)
+            admin_role = await require_admin_role_async(authorization, db)
             if not admin_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
                     detail="Access denied! Admin role required.",
                 )
 
-            repo = AdminRepository(db)
-            user_repo = UserRepository(db)
+            repo = AsyncAdminRepository(db)
 
-            users = repo.get_all_users()
+            # Users and profiles in one query (no per-user profile lookup)
+            rows = await repo.get_all_users_with_profiles()
 
             # Transform users data with profile information
             users_data = []
-            for user in users:
-                profile = user_repo.get_profile_by_user_id(str(user.id))
+            for user, profile in rows:
                 user_data = {
                     "id": str(user.id),
                     "username": user.username,
@@ -103,28 +110,28 @@ class AdminController:
     async def get_user_by_id(
         user_id: str,
         authorization: str,
-        db: Session = Depends(get_db),
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
     ) -> JSONResponse:
         """Get user by ID - Admin only"""
         try:
-            admin_role = require_admin_role(authorization, db)
+            admin_role = await require_admin_role_async(authorization, db)
             if not admin_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
                     detail="Access denied! Admin role required.",
                 )
 
-            repo = AdminRepository(db)
-            user_repo = UserRepository(db)
+            repo = AsyncAdminRepository(db)
+            user_repo = AsyncUserRepository(db)
 
-            user = repo.get_user_by_id(user_id)
+            user = await repo.get_user_by_id(user_id)
             if not user:
                 raise HTTPException(
                     status_code=HTTP_NOT_FOUND,
                     detail=f"User with id {user_id} not found!",
                 )
 
-            profile = user_repo.get_profile_by_user_id(user_id)
+            profile = await user_repo.get_profile_by_user_id(user_id)
             user_data = {
                 "id": str(user.id),
                 "username": user.username,
@@ -478,3 +485,198 @@ class AdminController:
         except Exception as e:
             admin_repo.rollback()
             return formatError(str(e), HTTP_BAD_REQUEST)
+
+    @staticmethod
+    def _usage_data(row) -> dict:
+        """Serialize aggregated token usage row"""
+        return {
+            "replies": row.replies,
+            "prompt_tokens": int(row.prompt_tokens),
+            "output_tokens": int(row.output_tokens),
+            "cached_tokens": int(row.cached_tokens),
+            "avg_latency_ms": (
+                round(float(row.avg_latency_ms))
+                if row.avg_latency_ms is not None
+                else None
+            ),
+            "avg_ttft_ms": (
+                round(float(row.avg_ttft_ms)) if row.avg_ttft_ms is not None else None
+            ),
+        }
+
+    @staticmethod
+    async def get_token_usage_by_user(
+        authorization: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        db: Session = Depends(get_db),
+    ) -> JSONResponse:
+        """Get token usage aggregated per user - Admin only"""
+        try:
+            admin_role = require_admin_role(authorization, db)
+            if not admin_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! Admin role required.",
+                )
+
+            start, end = date_range_bounds(start_date, end_date)
+            repo = AdminRepository(db)
+            rows = repo.get_token_usage_by_user(start, end)
+
+            usage_data = [
+                {
+                    "user_id": str(row.user_id),
+                    "username": row.username,
+                    **AdminController._usage_data(row),
+                }
+                for row in rows
+            ]
+
+            return ok(usage_data, "Successfully retrieved token usage!", HTTP_OK)
+        except HTTPException as e:
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            return formatError(str(e), HTTP_BAD_REQUEST)
+
+    @staticmethod
+    async def get_token_usage_by_day(
+        authorization: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_id: Optional[str] = None,
+        db: Session = Depends(get_db),
+    ) -> JSONResponse:
+        """Get token usage aggregated per day - Admin only"""
+        try:
+            admin_role = require_admin_role(authorization, db)
+            if not admin_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! Admin role required.",
+                )
+
+            start, end = date_range_bounds(start_date, end_date)
+            repo = AdminRepository(db)
+            rows = repo.get_token_usage_by_day(start, end, user_id)
+
+            usage_data = [
+                {
+                    # SQLite returns date() as text, PostgreSQL as date
+                    "day": (
+                        row.day if isinstance(row.day, str) else serialize_date(row.day)
+                    ),
+                    **AdminController._usage_data(row),
+                }
+                for row in rows
+            ]
+
+            return ok(usage_data, "Successfully retrieved daily token usage!", HTTP_OK)
+        except HTTPException as e:
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            return formatError(str(e), HTTP_BAD_REQUEST)
+
+    @staticmethod
+    def _quota_data(user, quota, used_today: int) -> dict:
+        """Serialize effective quota of a user"""
+        return {
+            "user_id": str(user.id),
+            "username": user.username,
+            "role": user.role,
+            "daily_output_tokens": (
+                quota.daily_output_tokens
+                if quota
+                else ROLE_DAILY_OUTPUT_TOKENS.get(user.role, 0)
+            ),
+            "source": "override" if quota else "role",
+            "used_today": used_today,
+        }
+
+    @staticmethod
+    async def get_user_quota(
+        user_id: str,
+        authorization: str,
+        db: Session = Depends(get_db),
+    ) -> JSONResponse:
+        """Get effective daily token quota of a user - Admin only"""
+        try:
+            admin_role = require_admin_role(authorization, db)
+            if not admin_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! Admin role required.",
+                )
+
+            admin_repo = AdminRepository(db)
+            quota_repo = QuotaRepository(db)
+
+            user = admin_repo.get_user_by_id(user_id)
+            if not user:
+                raise HTTPException(
+                    status_code=HTTP_NOT_FOUND,
+                    detail="User not found!",
+                )
+
+            quota = quota_repo.get_quota(user_id)
+            used_today = quota_tracker.get_used(db, user_id)
+
+            return ok(
+                AdminController._quota_data(user, quota, used_today),
+                "Successfully retrieved user quota!",
+                HTTP_OK,
+            )
+        except HTTPException as e:
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            return formatError(str(e), HTTP_BAD_REQUEST)
+
+    @staticmethod
+    async def update_user_quota(
+        user_id: str,
+        request: TokenQuotaUpdateRequest,
+        authorization: str,
+        db: Session = Depends(get_db),
+    ) -> JSONResponse:
+        """Override or reset daily token quota of a user - Admin only"""
+        try:
+            admin_role = require_admin_role(authorization, db)
+            if not admin_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! Admin role required.",
+                )
+
+            admin_repo = AdminRepository(db)
+            quota_repo = QuotaRepository(db)
+
+            user = admin_repo.get_user_by_id(user_id)
+            if not user:
+                raise HTTPException(
+                    status_code=HTTP_NOT_FOUND,
+                    detail="User not found!",
+                )
+
+            if request.daily_output_tokens is None:
+                quota_repo.delete_quota(user_id)
+                quota = None
+            else:
+                quota = quota_repo.set_quota(
+                    user_id, request.daily_output_tokens, admin_role.username
+                )
+
+            quota_repo.commit()
+            quota_tracker.invalidate_limit(user_id)
+            used_today = quota_tracker.get_used(db, user_id)
+
+            return ok(
+                AdminController._quota_data(user, quota, used_today),
+                "User quota updated successfully!",
+                HTTP_OK,
+            )
+        except HTTPException as e:
+            db.rollback()
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            db.rollback()
+            return formatError(str(e), HTTP_BAD_REQUEST)
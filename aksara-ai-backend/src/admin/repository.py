@@ -3,11 +3,28 @@ AdminRepository - Database operations for admin functionality
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
+from sqlalchemy import Row, and_, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.user.models import User, UserRole
+from src.chat.models import ChatHistory, ChatMessage
+from src.user.models import User, UserProfile, UserRole
+from src.utils.date import now
+from src.utils.helper import resolve
+from src.utils.types import local_date
+
+
+def _users_with_profiles_statement():
+    return (
+        select(User, UserProfile)
+        .outerjoin(
+            UserProfile,
+            and_(UserProfile.id_user == User.id, UserProfile.deleted == False),
+        )
+        .where(User.deleted == False)
+    )
 
 
 class AdminRepository:
@@ -48,6 +65,10 @@ class AdminRepository:
         """Get all non-deleted users"""
         return self.db.query(User).filter(User.deleted == False).all()
 
+    def get_all_users_with_profiles(self) -> List[Row]:
+        """All non-deleted users with their profile (None if missing), one query"""
+        return self.db.execute(_users_with_profiles_statement()).all()
+
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
         return self.db.query(User).filter(User.id == user_id).first()
@@ -70,7 +91,7 @@ class AdminRepository:
                 {
                     "deleted": True,
                     "updated_by": updated_by,
-                    "updated_date": datetime.now(),
+                    "updated_date": now(),
                 }
             )
         )
@@ -110,6 +131,60 @@ class AdminRepository:
             "regular_users": self.get_regular_users_count(),
         }
 
+    # Token usage operations
+    def _usage_columns(self) -> list:
+        """Aggregate columns over assistant replies"""
+        return [
+            func.count(ChatMessage.id).label("replies"),
+            func.coalesce(func.sum(ChatMessage.prompt_tokens), 0).label(
+                "prompt_tokens"
+            ),
+            func.coalesce(func.sum(ChatMessage.output_tokens), 0).label(
+                "output_tokens"
+            ),
+            func.coalesce(func.sum(ChatMessage.cached_tokens), 0).label(
+                "cached_tokens"
+            ),
+            func.avg(ChatMessage.latency_ms).label("avg_latency_ms"),
+            func.avg(ChatMessage.ttft_ms).label("avg_ttft_ms"),
+        ]
+
+    def get_token_usage_by_user(self, start: datetime, end: datetime) -> List[Row]:
+        """Get token usage per user within [start, end), including deleted chats"""
+        return (
+            self.db.query(
+                User.id.label("user_id"),
+                User.username,
+                *self._usage_columns(),
+            )
+            .join(ChatHistory, ChatHistory.user_id == User.id)
+            .join(ChatMessage, ChatMessage.chat_history_id == ChatHistory.id)
+            .filter(
+                ChatMessage.sender == "assistant",
+                ChatMessage.created_date >= start,
+                ChatMessage.created_date < end,
+            )
+            .group_by(User.id, User.username)
+            .order_by(desc("output_tokens"))
+            .all()
+        )
+
+    def get_token_usage_by_day(
+        self, start: datetime, end: datetime, user_id: str = None
+    ) -> List[Row]:
+        """Get token usage per day within [start, end), optionally for one user"""
+        day = local_date(ChatMessage.created_date).label("day")
+        query = self.db.query(day, *self._usage_columns()).filter(
+            ChatMessage.sender == "assistant",
+            ChatMessage.created_date >= start,
+            ChatMessage.created_date < end,
+        )
+        if user_id:
+            query = query.join(
+                ChatHistory, ChatHistory.id == ChatMessage.chat_history_id
+            ).filter(ChatHistory.user_id == user_id)
+        return query.group_by(day).order_by(day).all()
+
     # Transaction management
     def commit(self):
         """Commit the current transaction"""
@@ -118,3 +193,44 @@ class AdminRepository:
     def rollback(self):
         """Rollback the current transaction"""
         self.db.rollback()
+
+
+class AsyncAdminRepository:
+    """Async variant of AdminRepository for the read endpoints"""
+
+    def __init__(self, db: Union[AsyncSession, Session]):
+        self.db = db
+
+    async def _execute(self, statement):
+        return await resolve(self.db.execute(statement))
+
+    async def get_all_users(self) -> List[User]:
+        """Get all non-deleted users"""
+        result = await self._execute(select(User).where(User.deleted == False))
+        return list(result.scalars().all())
+
+    async def get_all_users_with_profiles(self) -> List[Row]:
+        """All non-deleted users with their profile (None if missing), one query"""
+        result = await self._execute(_users_with_profiles_statement())
+        return list(result.all())
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        result = await self._execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
+
+    async def get_user_statistics(self) -> dict:
+        """Get user statistics summary (one query)"""
+        live = User.deleted == False
+        result = await self._execute(
+            select(
+                func.count().filter(live).label("total_users"),
+                func.count()
+                .filter(live, User.role == UserRole.ADMIN)
+                .label("admin_users"),
+                func.count()
+                .filter(live, User.role == UserRole.USER)
+                .label("regular_users"),
+            ).select_from(User)
+        )
+        return dict(result.one()._mapping)
@@ -2,7 +2,11 @@
 AdminRouter - REST API routes for admin functionality
 """
 
+from datetime import date
+from typing import Optional, Union
+
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.admin.controller import AdminController
@@ -11,9 +15,10 @@ from src.admin.schemas import (
     AdminUserUpdateRequest,
     ChangeUserRoleRequest,
     ToggleUserActiveRequest,
+    TokenQuotaUpdateRequest,
 )
 from src.auth.auth import JWTBearer
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
 
 # Create admin router
 admin_router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
@@ -25,7 +30,7 @@ admin_router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 )
 async def get_statistics(
     authorization: str = Depends(JWTBearer()),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
 ):
     """Get dashboard statistics - Admin only"""
     return await AdminController.get_dashboard_statistics(authorization, db)
@@ -37,7 +42,7 @@ async def get_statistics(
 )
 async def get_all_users(
     authorization: str = Depends(JWTBearer()),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
 ):
     """Get all users - Admin only"""
     return await AdminController.get_all_users(authorization, db)
@@ -50,7 +55,7 @@ async def get_all_users(
 async def get_user(
     user_id: str,
     authorization: str = Depends(JWTBearer()),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
 ):
     """Get user by ID - Admin only"""
     return await AdminController.get_user_by_id(user_id, authorization, db)
@@ -124,6 +129,66 @@ async def change_user_role(
     return await AdminController.change_user_role(user_id, request, authorization, db)
 
 
+@admin_router.get(
+    "/usage/users",
+    summary="Get token usage per user",
+)
+async def get_token_usage_by_user(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    authorization: str = Depends(JWTBearer()),
+    db: Session = Depends(get_db),
+):
+    """Get token usage aggregated per user (default last 30 days) - Admin only"""
+    return await AdminController.get_token_usage_by_user(
+        authorization, start_date, end_date, db
+    )
+
+
+@admin_router.get(
+    "/usage/daily",
+    summary="Get token usage per day",
+)
+async def get_token_usage_by_day(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: Optional[str] = None,
+    authorization: str = Depends(JWTBearer()),
+    db: Session = Depends(get_db),
+):
+    """Get token usage aggregated per day (default last 30 days) - Admin only"""
+    return await AdminController.get_token_usage_by_day(
+        authorization, start_date, end_date, user_id, db
+    )
+
+
+@admin_router.get(
+    "/quotas/{user_id}",
+    summary="Get user token quota",
+)
+async def get_user_quota(
+    user_id: str,
+    authorization: str = Depends(JWTBearer()),
+    db: Session = Depends(get_db),
+):
+    """Get effective daily token quota and today's usage - Admin only"""
+    return await AdminController.get_user_quota(user_id, authorization, db)
+
+
+@admin_router.put(
+    "/quotas/{user_id}",
+    summary="Override user token quota",
+)
+async def update_user_quota(
+    user_id: str,
+    request: TokenQuotaUpdateRequest,
+    authorization: str = Depends(JWTBearer()),
+    db: Session = Depends(get_db),
+):
+    """Override (or reset to role default) daily token quota - Admin only"""
+    return await AdminController.update_user_quota(user_id, request, authorization, db)
+
+
 def setup_admin_routes(app):
     """Setup admin routes"""
     app.include_router(admin_router)
@@ -4,7 +4,7 @@ Admin Schemas - Request and Response models for Admin API
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.user.models import UserRole
 
@@ -63,3 +63,13 @@ class AdminUserUpdateRequest(BaseModel):
     email: Optional[str] = None
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
+
+
+class TokenQuotaUpdateRequest(BaseModel):
+    """Request model to override a user's daily token quota"""
+
+    daily_output_tokens: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Daily output-token limit (0 = unlimited, null = role default)",
+    )
@@ -0,0 +1,54 @@
+"""
+Chat Archive - Compressed payloads for inactive conversations
+All live messages of a history are stored as one gzip-compressed JSON
+document in chat_archives and restored on the next access.
+"""
+
+import gzip
+import json
+from datetime import datetime
+from typing import List
+
+from decouple import config
+
+# Conversations untouched for this many days are moved to chat_archives
+CHAT_ARCHIVE_AFTER_DAYS: int = int(config("CHAT_ARCHIVE_AFTER_DAYS", default=30))
+
+# ChatMessage columns kept in the payload
+ARCHIVED_FIELDS = [
+    "id",
+    "sender",
+    "text",
+    "model",
+    "prompt_tokens",
+    "output_tokens",
+    "cached_tokens",
+    "latency_ms",
+    "ttft_ms",
+    "created_date",
+    "updated_date",
+]
+ARCHIVED_DATES = ("created_date", "updated_date")
+
+
+def pack_messages(messages: list) -> bytes:
+    """Messages (ORM rows, oldest first) to a compressed JSON payload"""
+    documents = []
+    for message in messages:
+        document = {field: getattr(message, field) for field in ARCHIVED_FIELDS}
+        for field in ARCHIVED_DATES:
+            if document[field]:
+                document[field] = document[field].isoformat()
+        documents.append(document)
+    raw = json.dumps(documents, ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(raw.encode("utf-8"), compresslevel=9)
+
+
+def unpack_messages(payload: bytes) -> List[dict]:
+    """Compressed payload back to ChatMessage field dicts"""
+    documents = json.loads(gzip.decompress(payload).decode("utf-8"))
+    for document in documents:
+        for field in ARCHIVED_DATES:
+            if document.get(field):
+                document[field] = datetime.fromisoformat(document[field])
+    return documents
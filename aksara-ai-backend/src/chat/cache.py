@@ -0,0 +1,126 @@
+"""
+Chat Cache - Per-worker LRU of hot conversations
+Holds provider-ready context (without system prompt) keyed by chat history id.
+Entries are versioned by chat_histories.updated_date, so a turn written by
+another worker turns the next lookup into a miss instead of stale context.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+from decouple import config
+
+from src.utils.metrics import metrics
+
+CHAT_CACHE_MAX_BYTES: int = int(
+    config("CHAT_CACHE_MAX_BYTES", default=64 * 1024 * 1024)
+)
+
+# Rough per-message overhead of the dict/list structure
+MESSAGE_OVERHEAD_BYTES = 160
+
+
+def _content_size(contents: List[dict]) -> int:
+    """Approximate memory footprint of Gemini content dicts"""
+    return sum(
+        MESSAGE_OVERHEAD_BYTES
+        + sum(len(part["text"].encode("utf-8")) for part in content["parts"])
+        for content in contents
+    )
+
+
+class _Entry:
+    __slots__ = ("version", "contents", "size")
+
+    def __init__(self, version: Optional[datetime], contents: List[dict]):
+        self.version = version
+        self.contents = contents
+        self.size = _content_size(contents)
+
+
+class ConversationCache:
+    """LRU cache of conversation context bounded by approximate bytes"""
+
+    def __init__(self, max_bytes: int = CHAT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, chat_history_id: str, version: Optional[datetime]) -> Optional[list]:
+        """Cached context if present and still at the given version"""
+        with self._lock:
+            entry = self._entries.get(chat_history_id)
+            if entry is None or entry.version != version:
+                metrics.inc("chat_cache.misses")
+                return None
+            self._entries.move_to_end(chat_history_id)
+            metrics.inc("chat_cache.hits")
+            return entry.contents
+
+    def put(self, chat_history_id: str, version: Optional[datetime], contents: list):
+        """Store full context of a conversation"""
+        with self._lock:
+            self._remove(chat_history_id)
+            entry = _Entry(version, list(contents))
+            if entry.size > self.max_bytes:
+                return
+            self._entries[chat_history_id] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def append(
+        self,
+        chat_history_id: str,
+        previous_version: Optional[datetime],
+        version: Optional[datetime],
+        contents: list,
+    ):
+        """Append new turns; drops the entry if it was not at previous_version"""
+        with self._lock:
+            entry = self._entries.get(chat_history_id)
+            if entry is None:
+                return
+            if entry.version != previous_version:
+                self._remove(chat_history_id)
+                return
+            size = _content_size(contents)
+            entry.contents.extend(contents)
+            entry.version = version
+            entry.size += size
+            self._bytes += size
+            self._entries.move_to_end(chat_history_id)
+            self._evict()
+
+    def invalidate(self, chat_history_id: str):
+        """Drop a conversation (e.g. after delete)"""
+        with self._lock:
+            self._remove(chat_history_id)
+
+    def stats(self) -> dict:
+        """Gauges for the metrics endpoint"""
+        hits = metrics.get("chat_cache.hits")
+        misses = metrics.get("chat_cache.misses")
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+
+    def _remove(self, chat_history_id: str):
+        entry = self._entries.pop(chat_history_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            metrics.inc("chat_cache.evictions")
+
+
+conversation_cache = ConversationCache()
+metrics.register_collector("chat_cache", conversation_cache.stats)
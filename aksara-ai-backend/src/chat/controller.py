@@ -3,14 +3,21 @@ Chat Controller - Business logic and query orchestration
 All database queries executed here using repository
 """
 
+import time
 from datetime import datetime
+from typing import Optional, Union
 
-import google.genai as genai
-from decouple import config
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.chat.repository import ChatRepository
+from src.auth.handler import decodeJWT
+from src.chat.cache import conversation_cache
+from src.chat.llm import GeminiReply
+from src.chat.prompt import build_conversation_context, message_content
+from src.chat.repository import AsyncChatRepository, ChatRepository
+from src.chat.routing import route_prompt
 from src.chat.schemas import (
     ChatHistoryDetail,
     ChatHistoryListResponse,
@@ -18,16 +25,136 @@ from src.chat.schemas import (
     ChatMessageResponse,
     ChatRequest,
     ChatResponse,
+    ChatSearchParams,
+    ChatSearchResult,
+    ChatSearchSnippet,
+    ChatSocketRequest,
 )
-from src.config.postgres import get_db
-from src.constants import HTTP_FORBIDDEN, HTTP_INTERNAL_SERVER_ERROR
-from src.middleware.middleware import get_user_id_from_token, require_user_role
-from src.utils.helper import formatError, ok
+from src.chat.search import split_highlights
+from src.config.postgres import SessionLocal, get_db, get_read_db, recent_writers
+from src.constants import (
+    HTTP_BAD_REQUEST,
+    HTTP_FORBIDDEN,
+    HTTP_INTERNAL_SERVER_ERROR,
+    HTTP_UNAUTHORIZED,
+    WS_POLICY_VIOLATION,
+)
+from src.middleware.middleware import (
+    get_user_id_from_token,
+    require_user_role,
+    require_user_role_async,
+)
+from src.quota.tracker import quota_tracker
+from src.user.models import User, UserRole
+from src.user.repository import UserRepository
+from src.utils.date import now
+from src.utils.helper import formatError, log, ok, resolve
+from src.utils.pagination import (
+    CursorParams,
+    MapPagination,
+    decode_cursor,
+    encode_cursor,
+)
+
+FALLBACK_RESPONSE = (
+    "I apologize, but I encountered an issue generating a response. Please try again."
+)
+
+
+class ChatSocketSession:
+    """State pinned to one WebSocket connection"""
+
+    __slots__ = ("user", "chat_history_id", "expires", "version", "context")
+
+    def __init__(
+        self, user: User, expires: float, chat_history_id: Optional[str] = None
+    ):
+        self.user = user
+        self.chat_history_id = chat_history_id
+        self.expires = expires  # access token expiry (epoch seconds)
+        self.version: Optional[datetime] = None  # updated_date after last turn
+        self.context: list = []
 
 
 class ChatController:
     """Controller class for chat business logic"""
 
+    @staticmethod
+    def _make_title(user_input: str) -> str:
+        """Auto-generate history title from the first message"""
+        return user_input[:50] + "..." if len(user_input) > 50 else user_input
+
+    @staticmethod
+    def _save_turn(
+        repo: ChatRepository,
+        chat_history_id: str,
+        user_input: str,
+        response_text: str,
+        model: str,
+        usage: dict,
+        title: Optional[str] = None,
+    ) -> datetime:
+        """
+        Save user and assistant messages of one turn (caller commits)
+
+        Returns the new updated_date of the history, used as cache version.
+        """
+        repo.create_chat_message(
+            chat_history_id=chat_history_id, sender="user", text=user_input
+        )
+        reply = repo.create_chat_message(
+            chat_history_id=chat_history_id,
+            sender="assistant",
+            text=response_text,
+            model=model,
+            **usage,
+        )
+        # Record model used by the latest turn, bump activity and counters
+        updated_date = now()
+        repo.update_chat_history_turn(
+            chat_history_id, model, updated_date, last_message=reply, title=title
+        )
+        return updated_date
+
+    @staticmethod
+    async def _restore_if_archived(repo, chat_history) -> None:
+        """Bring back archived messages before the conversation is read"""
+        if chat_history.is_archived:
+            # Replicas won't have the restored messages right away
+            recent_writers.mark(chat_history.user_id)
+            restored = await resolve(repo.restore_chat_history(chat_history))
+            await resolve(repo.commit())
+            log(f"Restored {restored} archived messages of {chat_history.id}")
+
+    @staticmethod
+    def _page_cursors(page: CursorParams):
+        """Decode before/after cursors (only one direction per request)"""
+        if page.before and page.after:
+            raise HTTPException(
+                status_code=HTTP_BAD_REQUEST,
+                detail="Use either before or after, not both.",
+            )
+        return decode_cursor(page.before), decode_cursor(page.after)
+
+    @staticmethod
+    def _split_page(rows: list, limit: int, timestamp_field: str):
+        """Trim the extra keyset row and build the cursor of the last row"""
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor(getattr(last, timestamp_field), last.id)
+        return rows, next_cursor, has_more
+
+    @staticmethod
+    def _turn_contents(user_input: str, response_text: str) -> list:
+        """Provider-ready contents of one finished turn"""
+        return [
+            message_content("user", user_input),
+            message_content("assistant", response_text),
+        ]
+
     @staticmethod
     async def generate_chat_response(
         request: ChatRequest, authorization: str, db: Session = Depends(get_db)
@@ -44,6 +171,9 @@ class ChatController:
             # Get user ID from token (authentication already handled by middleware)
             userId = get_user_id_from_token(authorization)
 
+            # Reject over-quota users before any prompt assembly or upstream call
+            quota_tracker.check(db, user_role)
+
             # Initialize repository
             repo = ChatRepository(db)
 
@@ -58,245 +188,94 @@ class ChatController:
                     raise HTTPException(
                         status_code=404, detail="Chat history not found"
                     )
-            else:
-                # Create new chat history (chat_history_id is None, empty, or whitespace)
-                chat_history = repo.create_chat_history(
-                    user_id=userId, title="New Chat", model="gemini-2.5-flash"
+                await ChatController._restore_if_archived(repo, chat_history)
+                # Hot conversations skip the message query and rebuild
+                history_context = conversation_cache.get(
+                    chat_history.id, chat_history.updated_date
                 )
-                repo.commit()
-                repo.refresh(chat_history)
-
-            # Get conversation context (previous messages)
-            messages = repo.get_messages_by_chat_id(chat_history.id)
-            conversation_context = []
-
-            # Add system prompt with Aksara AI identity and context
-            system_prompt = """Kamu adalah Aksara AI, asisten virtual cerdas untuk UKM Literasi Cakrawala University (Universitas Cakrawala). 
-
-IDENTITAS DIRI:
-- Nama: Aksara AI
-- Peran: Asisten Virtual untuk Komunitas Literasi Kampus
-- Afiliasi: UKM Literasi Cakrawala University
-- Misi: Meningkatkan budaya literasi di lingkungan kampus melalui teknologi AI
-- Visi: Menjadi platform literasi AI terdepan yang melestarikan kearifan lokal sambil mengadopsi teknologi global
-
-TENTANG AKSARA AI PLATFORM:
-Aksara AI adalah platform web berbasis kecerdasan buatan yang dirancang khusus untuk mendukung kegiatan literasi di lingkungan Universitas Cakrawala. Platform ini menggabungkan teknologi AI modern dengan semangat literasi nusantara.
-
-FITUR UNGGULAN:
-1. **AI Chat Cerdas** - Diskusi mendalam tentang literasi dengan AI yang memahami konteks akademik
-2. **Ruang Aksara** - Tempat bertemu ide, diskusi, dan karya dalam literasi kampus
-3. **Aksara Nusantara** - Melestarikan dan mengembangkan literasi berbasis budaya lokal Indonesia
-
-TEKNOLOGI YANG DIGUNAKAN:
-- **Backend**: FastAPI (Python), PostgreSQL, SQLAlchemy
-- **Frontend**: React 19, TypeScript, Tailwind CSS
-- **AI**: Google Gemini API
-- **Architecture**: MVC Pattern, Repository Pattern, RESTful API
-- **Security**: JWT Authentication, Bcrypt Password Hashing, RBAC
-
-KEMAMPUAN KAMU:
-1. Menjawab pertanyaan tentang literasi (membaca, menulis, penelitian)
-2. Memberikan tips dan strategi meningkatkan kemampuan literasi
-3. Membantu dengan topik akademik dan riset
-4. Diskusi tentang buku, artikel, dan karya ilmiah
-5. Memberikan saran menulis (essay, makalah, skripsi)
-6. Membahas budaya literasi Indonesia
-7. Membantu brainstorming ide tulisan
-8. Menjelaskan konsep-konsep literasi dengan cara yang mudah dipahami
-
-CARA BERKOMUNIKASI:
-- Ramah, sopan, dan profesional
-- Menggunakan Bahasa Indonesia yang baik dan benar
-- Memberikan penjelasan yang terstruktur dan mudah dipahami
-- Mendorong critical thinking dan diskusi mendalam
-- Memberikan contoh konkret dan relevan dengan konteks akademik
-- Menghargai kearifan lokal dan budaya Indonesia
-- Responsif terhadap kebutuhan mahasiswa dan akademisi
-
-FORMAT RESPONS:
-- Gunakan **bold** untuk penekanan penting
-- Gunakan numbered list (1. 2. 3.) untuk langkah-langkah atau urutan
-- Gunakan bullet points (- atau *) untuk daftar item
-- Gunakan heading (## atau ###) untuk section jika respons panjang
-- Pisahkan paragraf dengan line break untuk readability
-- Gunakan *italic* untuk istilah asing atau penekanan ringan
-
-TIPS LITERASI YANG KAMU TAWARKAN:
-
-**1. Membaca Efektif:**
-- Teknik SQ3R (Survey, Question, Read, Recite, Review)
-- Active reading dengan anotasi
-- Membaca kritis dengan evaluasi sumber
-- Speed reading untuk efisiensi
-
-**2. Menulis Akademik:**
-- Struktur penulisan ilmiah yang baik
-- Cara membuat outline yang efektif
-- Teknik parafrase dan sitasi yang benar
-- Menghindari plagiarisme
-- Revisi dan editing yang sistematis
-
-**3. Penelitian:**
-- Cara mencari sumber terpercaya
-- Evaluasi kredibilitas sumber
-- Manajemen referensi
-- Sintesis informasi dari berbagai sumber
-
-**4. Critical Thinking:**
-- Analisis argumen
-- Identifikasi bias
-- Evaluasi bukti
-- Membuat kesimpulan yang valid
-
-**5. Manajemen Literasi:**
-- Membuat jadwal membaca
-- Note-taking yang efektif
-- Mengorganisir bahan bacaan
-- Digital literacy tools
-
-TENTANG CAKRAWALA UNIVERSITY:
-Universitas Cakrawala adalah institusi pendidikan tinggi yang berkomitmen pada pengembangan literasi dan kualitas akademik. UKM Literasi Aksara adalah wadah bagi mahasiswa untuk mengembangkan kemampuan literasi melalui berbagai kegiatan dan teknologi modern seperti Aksara AI ini.
-
-BATASAN:
-- Kamu tidak bisa membuat konten yang berbahaya, kasar, atau tidak pantas
-- Kamu tidak bisa memberikan jawaban untuk ujian atau tugas (hanya bimbingan)
-- Kamu tidak bisa mengakses data pribadi pengguna
-- Kamu fokus pada topik literasi, akademik, dan pendidikan
-
-CONTOH RESPONS:
-
-Ketika ditanya "Siapa kamu?":
-"Halo! Saya **Aksara AI**, asisten virtual untuk UKM Literasi Cakrawala University. Saya di sini untuk membantu kamu dalam perjalanan literasi - baik itu diskusi tentang buku, tips menulis, strategi membaca efektif, atau apapun yang berkaitan dengan pengembangan kemampuan literasi akademik. 
-
-Ada yang bisa saya bantu hari ini?"
-
-Ketika ditanya tips literasi, gunakan format seperti ini:
-
-"Berikut beberapa **tips meningkatkan kemampuan membaca kritis**:
-
-**1. Survey (Tinjauan Awal)**
-- Baca judul, heading, dan subheading
-- Perhatikan grafik, tabel, atau ilustrasi
-- Baca paragraf pembuka dan penutup
-
-**2. Question (Bertanya)**
-- Buat pertanyaan dari heading
-- Apa tujuan penulis?
-- Apa argumen utamanya?
-
-**3. Read (Membaca Aktif)**
-- Buat catatan di margin
-- Highlight poin penting
-- Identifikasi kata kunci
-
-Apakah ada aspek tertentu yang ingin kamu pelajari lebih dalam?"
-
-Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusaha mendukung visi misi kampus dalam meningkatkan kualitas literasi mahasiswa. Respons kamu harus terstruktur, mudah dibaca, dan menggunakan formatting markdown yang baik."""
-
-            conversation_context.append(
-                {"role": "user", "parts": [{"text": system_prompt}]}
-            )
-            conversation_context.append(
-                {
-                    "role": "model",
-                    "parts": [
-                        {
-                            "text": "Baik, saya mengerti. Saya adalah Aksara AI, asisten virtual untuk UKM Literasi Cakrawala University. Saya siap membantu dengan segala hal yang berkaitan dengan literasi akademik, membaca, menulis, penelitian, dan pengembangan kemampuan literasi. Saya akan memberikan respons yang ramah, terstruktur, dan bermanfaat sesuai dengan identitas dan misi saya. Silakan bertanya atau diskusi tentang literasi!"
-                        }
-                    ],
-                }
-            )
+                if history_context is None:
+                    history_context = [
+                        message_content(msg.sender, msg.text)
+                        for msg in repo.get_message_turns(chat_history.id)
+                    ]
+                    conversation_cache.put(
+                        chat_history.id, chat_history.updated_date, history_context
+                    )
+            else:
+                history_context = []
 
-            # Add previous conversation messages
-            for msg in messages:
-                role = "user" if msg.sender == "user" else "model"
-                conversation_context.append(
-                    {"role": role, "parts": [{"text": msg.text}]}
-                )
+            # Pick model tier and output cap from the prompt itself
+            route = route_prompt(
+                request.input,
+                history_depth=len(history_context),
+                requested_max_tokens=request.max_tokens,
+            )
 
-            # Add current user input
-            conversation_context.append(
-                {"role": "user", "parts": [{"text": request.input}]}
+            # Build conversation context (system prompt, previous messages, input)
+            conversation_context = build_conversation_context(
+                history_context, request.input
             )
 
-            # Call Gemini API
-            gemini_api_key = config("GEMINI_API_KEY", default=None)
-            if not gemini_api_key:
-                raise HTTPException(
-                    status_code=HTTP_INTERNAL_SERVER_ERROR,
-                    detail="Gemini API key not configured.",
-                )
+            # Don't hold a pooled connection during the upstream call
+            db.release()
 
-            client = genai.Client(api_key=gemini_api_key)
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
+            # Call Gemini API (streamed, so TTFT and usage can be recorded)
+            reply = GeminiReply(
+                model=route.model,
                 contents=conversation_context,
-                config=genai.types.GenerateContentConfig(
-                    temperature=request.temperature or 0.7,
-                    max_output_tokens=request.max_tokens or 1024,
-                ),
+                temperature=request.temperature or 0.7,
+                max_tokens=route.max_tokens,
             )
-
-            # Extract response text
-            response_text = ""
-
-            # Check if response has candidates
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-
-                # Extract content
-                if hasattr(candidate, "content") and candidate.content:
-                    content = candidate.content
-
-                    # Extract parts
-                    if hasattr(content, "parts") and content.parts:
-                        # Get text from first part
-                        first_part = content.parts[0]
-                        if hasattr(first_part, "text") and first_part.text:
-                            response_text = first_part.text.strip()
-
-            # Fallback: try direct text access
-            if not response_text and hasattr(response, "text") and response.text:
-                response_text = response.text.strip()
+            response_text = await reply.collect()
 
             # Final fallback
             if not response_text:
-                response_text = "I apologize, but I encountered an issue generating a response. Please try again."
+                response_text = FALLBACK_RESPONSE
 
-            # Save user message
-            repo.create_chat_message(
-                chat_history_id=chat_history.id, sender="user", text=request.input
-            )
+            if not chat_history:
+                # Create new chat history (chat_history_id is None, empty, or whitespace)
+                # only now, so a failed upstream call leaves no empty history behind
+                chat_history = repo.create_chat_history(
+                    user_id=userId, title="New Chat", model=route.model
+                )
 
-            # Save assistant message
-            repo.create_chat_message(
-                chat_history_id=chat_history.id, sender="assistant", text=response_text
+            # Save both messages and bump the history
+            usage = reply.usage_fields()
+            previous_version = chat_history.updated_date
+            version = ChatController._save_turn(
+                repo,
+                chat_history.id,
+                request.input,
+                response_text,
+                route.model,
+                usage,
+                title=(
+                    ChatController._make_title(request.input)
+                    if not history_context
+                    else None
+                ),
             )
 
-            # Auto-generate title if this is the first message
-            if len(messages) == 0 and request.input:
-                title = (
-                    request.input[:50] + "..."
-                    if len(request.input) > 50
-                    else request.input
-                )
-                repo.update_chat_history_title(chat_history.id, title)
-
             repo.commit()
+            turn_contents = ChatController._turn_contents(request.input, response_text)
+            if history_context:
+                conversation_cache.append(
+                    chat_history.id, previous_version, version, turn_contents
+                )
+            else:
+                conversation_cache.put(chat_history.id, version, turn_contents)
+            quota_tracker.record(userId, usage["prompt_tokens"], usage["output_tokens"])
 
             # Build response
             chat_response = ChatResponse(
                 conversation_id=chat_history.id,
-                model="gemini-2.5-flash",
+                model=route.model,
                 input=request.input,
                 output=response_text,
                 timestamp=datetime.now().isoformat(),
             )
 
-            return ok(
-                chat_response.model_dump(), "Successfully generated chat response", 200
-            )
+            return ok(chat_response, "Successfully generated chat response", 200)
 
         except HTTPException as e:
             db.rollback()
@@ -311,10 +290,14 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
             return formatError(str(e), HTTP_INTERNAL_SERVER_ERROR)
 
     @staticmethod
-    async def get_chat_histories(authorization: str, db: Session = Depends(get_db)):
-        """Get all chat histories for current user"""
+    async def get_chat_histories(
+        authorization: str,
+        page: CursorParams,
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
+    ):
+        """Get a page of chat histories for current user (newest activity first)"""
         try:
-            user_role = require_user_role(authorization, db)
+            user_role = await require_user_role_async(authorization, db)
             if not user_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
@@ -324,42 +307,39 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
             # Get user ID from token (authentication already handled by middleware)
             userId = get_user_id_from_token(authorization)
 
-            # Query chat histories
-            repo = ChatRepository(db)
-            chat_histories = repo.get_user_chat_histories(userId)
+            before, after = ChatController._page_cursors(page)
 
-            # Transform to summary format
-            summaries = []
-            for chat in chat_histories:
-                try:
-                    messages = repo.get_messages_by_chat_id(chat.id or "")
-                    last_message = messages[-1].text if messages else None
-
-                    # Ensure dates are not None
-                    created_date = chat.created_date or datetime.now()
-                    updated_date = chat.updated_date or datetime.now()
-
-                    summary = ChatHistorySummary(
-                        id=chat.id or "",
-                        title=chat.title or "New Chat",
-                        model=chat.model,
-                        message_count=len(messages),
-                        last_message=last_message,
-                        created_date=created_date,
-                        updated_date=updated_date,
-                    )
-                    summaries.append(summary)
-                except Exception as e:
-                    print(f"❌ Error processing chat {chat.id}: {str(e)}")
-                    import traceback
-
-                    traceback.print_exc()
-                    continue
+            # Query one page of chat histories (denormalized summary columns)
+            repo = AsyncChatRepository(db)
+            rows = await repo.get_user_chat_history_summaries(
+                userId, page.limit, before, after
+            )
+            rows, next_cursor, has_more = ChatController._split_page(
+                rows, page.limit, "updated_date"
+            )
+            if after:
+                rows.reverse()
+
+            summaries = [
+                ChatHistorySummary(
+                    id=row.id,
+                    title=row.title or "New Chat",
+                    model=row.model,
+                    message_count=row.message_count,
+                    last_message=row.last_message,
+                    created_date=row.created_date or now(),
+                    updated_date=row.updated_date or now(),
+                )
+                for row in rows
+            ]
 
             response = ChatHistoryListResponse(
-                histories=summaries, total=len(summaries)
+                histories=summaries,
+                total=len(summaries),
+                next_cursor=next_cursor,
+                has_more=has_more,
             )
-            return ok(response.model_dump(), "Successfully fetched chat histories", 200)
+            return ok(response, "Successfully fetched chat histories", 200)
 
         except HTTPException as e:
             return formatError(e.detail, e.status_code)
@@ -372,11 +352,14 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
 
     @staticmethod
     async def get_chat_history_by_id(
-        history_id: str, authorization: str, db: Session = Depends(get_db)
+        history_id: str,
+        authorization: str,
+        page: CursorParams,
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
     ):
-        """Get chat history detail with all messages"""
+        """Get chat history detail with a page of messages (latest by default)"""
         try:
-            user_role = require_user_role(authorization, db)
+            user_role = await require_user_role_async(authorization, db)
             if not user_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
@@ -387,19 +370,30 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
             userId = get_user_id_from_token(authorization)
 
             # Query chat history
-            repo = ChatRepository(db)
-            chat_history = repo.get_chat_history_by_id(history_id, userId)
+            repo = AsyncChatRepository(db)
+            chat_history = await repo.get_chat_history_by_id(history_id, userId)
 
             if not chat_history:
                 raise HTTPException(status_code=404, detail="Chat history not found")
+            await ChatController._restore_if_archived(repo, chat_history)
+
+            before, after = ChatController._page_cursors(page)
 
-            # Get messages
-            messages = repo.get_messages_by_chat_id(chat_history.id)
+            # Get one page of messages, shown in chronological order
+            messages = await repo.get_messages_page(
+                chat_history.id, page.limit, before, after
+            )
+            messages, next_cursor, has_more = ChatController._split_page(
+                messages, page.limit, "created_date"
+            )
+            if not after:
+                messages.reverse()
             message_responses = [
                 ChatMessageResponse(
                     id=msg.id,
                     sender=msg.sender,
                     text=msg.text,
+                    model=msg.model,
                     created_date=msg.created_date,
                 )
                 for msg in messages
@@ -414,10 +408,71 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
                 is_active=chat_history.is_active,
                 created_date=chat_history.created_date,
                 updated_date=chat_history.updated_date,
+                message_count=chat_history.message_count,
                 messages=message_responses,
+                next_cursor=next_cursor,
+                has_more=has_more,
             )
 
-            return ok(detail.model_dump(), "Successfully fetched chat history", 200)
+            return ok(detail, "Successfully fetched chat history", 200)
+
+        except HTTPException as e:
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            return formatError(str(e), HTTP_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    async def search_chat_histories(
+        authorization: str, params: ChatSearchParams, db: Session = Depends(get_db)
+    ):
+        """Full-text search over current user's chats, grouped by history"""
+        try:
+            user_role = require_user_role(authorization, db)
+            if not user_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! User role required.",
+                )
+
+            # Get user ID from token (authentication already handled by middleware)
+            userId = get_user_id_from_token(authorization)
+
+            # Rank matching histories first, then build snippets for that page only
+            repo = ChatRepository(db)
+            rows = repo.search_chat_histories(
+                userId, params.q, params.size, (params.page - 1) * params.size
+            )
+            snippets = {row.id: [] for row in rows}
+            for match in repo.get_search_snippets(list(snippets), params.q):
+                snippet, highlights = split_highlights(match.snippet)
+                snippets[match.chat_history_id].append(
+                    ChatSearchSnippet(
+                        message_id=match.id,
+                        sender=match.sender,
+                        snippet=snippet,
+                        highlights=highlights,
+                        created_date=match.created_date,
+                    )
+                )
+
+            results = [
+                ChatSearchResult(
+                    chat_history_id=row.id,
+                    title=row.title or "New Chat",
+                    updated_date=row.updated_date or now(),
+                    rank=row.rank,
+                    match_count=row.match_count,
+                    snippets=snippets[row.id],
+                ).model_dump()
+                for row in rows
+            ]
+            total = rows[0].total if rows else 0
+
+            return ok(
+                MapPagination(results, total, params),
+                "Successfully searched chat histories",
+                200,
+            )
 
         except HTTPException as e:
             return formatError(e.detail, e.status_code)
@@ -455,6 +510,7 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
                 )
 
             repo.commit()
+            conversation_cache.invalidate(history_id)
             return ok({"deleted": True}, "Successfully deleted chat history", 200)
 
         except HTTPException as e:
@@ -463,3 +519,201 @@ Ingat: Kamu adalah bagian dari komunitas Cakrawala University dan selalu berusah
         except Exception as e:
             db.rollback()
             return formatError(str(e), HTTP_INTERNAL_SERVER_ERROR)
+
+    # ============ WebSocket chat session ============
+
+    @staticmethod
+    async def chat_websocket(
+        websocket: WebSocket, token: str, chat_history_id: Optional[str] = None
+    ):
+        """
+        Interactive chat session over WebSocket
+
+        The token is verified and the user/history loaded once at connect time;
+        each turn then only streams the reply and writes the new messages.
+        """
+        session = await ChatController._open_socket_session(token, chat_history_id)
+        if session is None:
+            await websocket.close(code=WS_POLICY_VIOLATION)
+            return
+
+        await websocket.accept()
+        await websocket.send_json({"type": "ready", "conversation_id": chat_history_id})
+
+        try:
+            while True:
+                data = await websocket.receive_json()
+                try:
+                    if not await ChatController._socket_turn(websocket, session, data):
+                        return
+                except ValidationError as e:
+                    await websocket.send_json(
+                        {
+                            "type": "error",
+                            "message": str(e),
+                            "error_code": HTTP_BAD_REQUEST,
+                        }
+                    )
+                except HTTPException as e:
+                    await websocket.send_json(
+                        {
+                            "type": "error",
+                            "message": e.detail,
+                            "error_code": e.status_code,
+                        }
+                    )
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    log(f"Error in chat websocket turn: {e}", log_level="error")
+                    await websocket.send_json(
+                        {
+                            "type": "error",
+                            "message": str(e),
+                            "error_code": HTTP_INTERNAL_SERVER_ERROR,
+                        }
+                    )
+        except WebSocketDisconnect:
+            return
+
+    @staticmethod
+    async def _open_socket_session(
+        token: str, chat_history_id: Optional[str]
+    ) -> Optional[ChatSocketSession]:
+        """
+        Authenticate a connecting socket and warm its conversation context;
+        None when the connection must be refused
+        """
+        # Authenticate once per connection
+        payload = decodeJWT(token)
+        user_id = payload.get("id") if payload.get("type") == "access" else None
+        if not user_id:
+            return None
+
+        db = SessionLocal()
+        try:
+            user = UserRepository(db).get_user_by_id(user_id)
+            if not user or user.role != UserRole.USER:
+                return None
+
+            # Pin the conversation and warm its context
+            session = ChatSocketSession(user, payload["expires"], chat_history_id)
+            if chat_history_id:
+                repo = ChatRepository(db)
+                chat_history = repo.get_chat_history_by_id(chat_history_id, user_id)
+                if not chat_history:
+                    return None
+                await ChatController._restore_if_archived(repo, chat_history)
+                version = chat_history.updated_date
+                cached = conversation_cache.get(chat_history.id, version)
+                if cached is None:
+                    cached = [
+                        message_content(msg.sender, msg.text)
+                        for msg in repo.get_message_turns(chat_history.id)
+                    ]
+                    conversation_cache.put(chat_history.id, version, cached)
+                # Socket keeps its own copy, the cache is updated per turn
+                session.context = list(cached)
+                session.version = version
+            return session
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _socket_turn(
+        websocket: WebSocket, session: ChatSocketSession, data
+    ) -> bool:
+        """
+        Run one streamed turn, persist it and extend the warm context.
+        Returns False when the connection was closed (token expired).
+        """
+        # Token expiry still applies to long-lived connections
+        if session.expires < time.time():
+            await websocket.send_json(
+                {
+                    "type": "error",
+                    "message": "Token has expired",
+                    "error_code": HTTP_UNAUTHORIZED,
+                }
+            )
+            await websocket.close(code=WS_POLICY_VIOLATION)
+            return False
+
+        request = ChatSocketRequest.model_validate(data)
+        user, context = session.user, session.context
+        # Quota check mostly hits in-process counters
+        db = SessionLocal()
+        try:
+            quota_tracker.check(db, user)
+        finally:
+            db.close()
+
+        route = route_prompt(
+            request.input,
+            history_depth=len(context),
+            requested_max_tokens=request.max_tokens,
+        )
+        reply = GeminiReply(
+            model=route.model,
+            contents=build_conversation_context(context, request.input),
+            temperature=request.temperature or 0.7,
+            max_tokens=route.max_tokens,
+        )
+        async for chunk in reply.chunks():
+            await websocket.send_json({"type": "chunk", "text": chunk})
+
+        response_text = reply.text or FALLBACK_RESPONSE
+        usage = reply.usage_fields()
+
+        db = SessionLocal()
+        repo = ChatRepository(db)
+        try:
+            title = None
+            if not session.chat_history_id:
+                chat_history = repo.create_chat_history(
+                    user_id=user.id,
+                    title=ChatController._make_title(request.input),
+                    model=route.model,
+                )
+                session.chat_history_id = chat_history.id
+            elif not context:
+                title = ChatController._make_title(request.input)
+
+            version = ChatController._save_turn(
+                repo,
+                session.chat_history_id,
+                request.input,
+                response_text,
+                route.model,
+                usage,
+                title=title,
+            )
+            repo.commit()
+        except Exception:
+            repo.rollback()
+            raise
+        finally:
+            db.close()
+
+        recent_writers.mark(user.id)
+        quota_tracker.record(user.id, usage["prompt_tokens"], usage["output_tokens"])
+        turn_contents = ChatController._turn_contents(request.input, response_text)
+        if session.version is None:
+            conversation_cache.put(session.chat_history_id, version, turn_contents)
+        else:
+            conversation_cache.append(
+                session.chat_history_id, session.version, version, turn_contents
+            )
+        context.extend(turn_contents)
+        session.version = version
+
+        await websocket.send_json(
+            {
+                "type": "done",
+                "conversation_id": session.chat_history_id,
+                "model": route.model,
+                "output": response_text,
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+        return True
@@ -0,0 +1,111 @@
+"""
+Chat LLM - Gemini upstream calls
+Streams the reply so latency, time-to-first-token and usage metadata can be recorded
+"""
+
+import time
+from typing import AsyncIterator, List, Optional
+
+import google.genai as genai
+from decouple import config
+from fastapi import HTTPException
+
+from src.constants import HTTP_INTERNAL_SERVER_ERROR
+
+_client: Optional[genai.Client] = None
+
+
+def get_client() -> genai.Client:
+    """Get shared Gemini client (created on first use)"""
+    global _client
+    if _client is None:
+        gemini_api_key = config("GEMINI_API_KEY", default=None)
+        if not gemini_api_key:
+            raise HTTPException(
+                status_code=HTTP_INTERNAL_SERVER_ERROR,
+                detail="Gemini API key not configured.",
+            )
+        _client = genai.Client(api_key=gemini_api_key)
+    return _client
+
+
+def _chunk_text(chunk) -> str:
+    """Extract answer text (without thought parts) from a streamed chunk"""
+    if not getattr(chunk, "candidates", None):
+        return ""
+    content = getattr(chunk.candidates[0], "content", None)
+    if not content or not getattr(content, "parts", None):
+        return ""
+    return "".join(
+        part.text
+        for part in content.parts
+        if getattr(part, "text", None) and not getattr(part, "thought", False)
+    )
+
+
+class GeminiReply:
+    """Single streamed Gemini reply with timing and token usage"""
+
+    def __init__(self, model: str, contents: list, temperature: float, max_tokens: int):
+        self.model = model
+        self.contents = contents
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.parts: List[str] = []
+        self.usage = None
+        self.latency_ms: Optional[int] = None
+        self.ttft_ms: Optional[int] = None
+
+    async def chunks(self) -> AsyncIterator[str]:
+        """Yield reply text chunks as they arrive from upstream"""
+        client = get_client()
+        started = time.perf_counter()
+        stream = await client.aio.models.generate_content_stream(
+            model=self.model,
+            contents=self.contents,
+            config=genai.types.GenerateContentConfig(
+                temperature=self.temperature,
+                max_output_tokens=self.max_tokens,
+            ),
+        )
+        async for chunk in stream:
+            # Usage metadata is cumulative, the last chunk carries the totals
+            if getattr(chunk, "usage_metadata", None):
+                self.usage = chunk.usage_metadata
+
+            text = _chunk_text(chunk)
+            if not text:
+                continue
+            if self.ttft_ms is None:
+                self.ttft_ms = int((time.perf_counter() - started) * 1000)
+            self.parts.append(text)
+            yield text
+
+        self.latency_ms = int((time.perf_counter() - started) * 1000)
+
+    async def collect(self) -> str:
+        """Consume the whole stream and return the reply text"""
+        async for _ in self.chunks():
+            pass
+        return self.text
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts).strip()
+
+    def usage_fields(self) -> dict:
+        """Token usage and timing as ChatMessage column values"""
+        usage = self.usage
+        output_tokens = None
+        if usage is not None and usage.candidates_token_count is not None:
+            # Thinking tokens are billed as output tokens
+            output_tokens = usage.candidates_token_count + (
+                usage.thoughts_token_count or 0
+            )
+        return {
+            "prompt_tokens": usage.prompt_token_count if usage else None,
+            "output_tokens": output_tokens,
+            "cached_tokens": usage.cached_content_token_count if usage else None,
+            "latency_ms": self.latency_ms,
+            "ttft_ms": self.ttft_ms,
+        }
@@ -1,41 +1,152 @@
-import uuid
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import DDL, Index, event, text
 from sqlmodel import Field, SQLModel
 
+from src.chat.search import POSTGRES_SEARCH_DDL, SQLITE_SEARCH_DDL
+from src.user.models import User  # noqa: F401 (registers the user.id FK target)
+from src.utils.date import now
+from src.utils.ids import new_id
+from src.utils.types import SmallEnum, TZDateTime, UUIDString
+
+# Compact smallint codes for chat_messages.sender
+SENDER_CODES = {"user": 1, "assistant": 2}
+
 
 class ChatHistory(SQLModel, table=True):
     """Chat history model - stores conversation metadata"""
 
     __tablename__ = "chat_histories"
+    __table_args__ = (
+        # Sidebar listing: live histories of a user by latest activity
+        Index(
+            "ix_chat_histories_user_activity",
+            "user_id",
+            "updated_date",
+            "id",
+            postgresql_where=text("deleted = false AND is_active = true"),
+            sqlite_where=text("deleted = false AND is_active = true"),
+        ),
+        # Purge job: soft-deleted and empty histories (few rows each)
+        Index(
+            "ix_chat_histories_purge",
+            "updated_date",
+            postgresql_where=text("deleted = true"),
+            sqlite_where=text("deleted = true"),
+        ),
+        Index(
+            "ix_chat_histories_empty",
+            "created_date",
+            postgresql_where=text("message_count = 0"),
+            sqlite_where=text("message_count = 0"),
+        ),
+    )
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    user_id: str = Field(foreign_key="user.id", index=True)
+    id: Optional[str] = Field(
+        default_factory=new_id, primary_key=True, sa_type=UUIDString
+    )
+    user_id: str = Field(foreign_key="user.id", index=True, sa_type=UUIDString)
     title: Optional[str] = None
     model: str = Field(default="gemini-2.5-flash")
     language: str = Field(default="id")
     is_active: bool = Field(default=True)
     deleted: bool = Field(default=False)
+    # Messages moved to chat_archives, restored on the next access
+    is_archived: bool = Field(default=False)
+    # Denormalized sidebar summary, maintained by ChatRepository
+    message_count: int = Field(default=0)
+    last_message_preview: Optional[str] = None
+    last_message_at: Optional[datetime] = Field(default=None, sa_type=TZDateTime)
     created_by: Optional[str] = None
-    created_date: Optional[datetime] = Field(default_factory=lambda: datetime.now())
+    created_date: Optional[datetime] = Field(default_factory=now, sa_type=TZDateTime)
     updated_by: Optional[str] = None
-    updated_date: Optional[datetime] = Field(default_factory=lambda: datetime.now())
+    # Sidebar keyset, never NULL (migration 017)
+    updated_date: datetime = Field(
+        default_factory=now, sa_type=TZDateTime, nullable=False
+    )
 
     # Note: Relationships will be handled by repository layer for now
 
 
 class ChatMessage(SQLModel, table=True):
-    """Individual chat message model"""
+    """
+    Individual chat message model
+
+    On Postgres the table is partitioned monthly by created_date (migration
+    014) with primary key (id, created_date); ids stay unique on their own.
+    """
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Conversation paging: live messages of a history in order
+        Index(
+            "ix_chat_messages_history_created",
+            "chat_history_id",
+            "created_date",
+            "id",
+            postgresql_where=text("deleted = false"),
+            sqlite_where=text("deleted = false"),
+        ),
+        # Purge job: soft-deleted messages
+        Index(
+            "ix_chat_messages_purge",
+            "updated_date",
+            postgresql_where=text("deleted = true"),
+            sqlite_where=text("deleted = true"),
+        ),
+    )
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    chat_history_id: str = Field(foreign_key="chat_histories.id", index=True)
-    sender: str  # 'user' or 'assistant'
+    id: Optional[str] = Field(
+        default_factory=new_id, primary_key=True, sa_type=UUIDString
+    )
+    chat_history_id: str = Field(
+        foreign_key="chat_histories.id", index=True, sa_type=UUIDString
+    )
+    sender: str = Field(sa_type=SmallEnum(SENDER_CODES))  # 'user' or 'assistant'
     text: str
+    model: Optional[str] = None  # model that generated the reply (assistant only)
+    # Upstream usage and timing (assistant only)
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None
+    latency_ms: Optional[int] = None
+    ttft_ms: Optional[int] = None
     deleted: bool = Field(default=False)
-    created_date: Optional[datetime] = Field(default_factory=lambda: datetime.now())
-    updated_date: Optional[datetime] = Field(default_factory=lambda: datetime.now())
+    # Partition key and conversation keyset, never NULL (migrations 014, 017)
+    created_date: datetime = Field(
+        default_factory=now, sa_type=TZDateTime, nullable=False
+    )
+    updated_date: Optional[datetime] = Field(default_factory=now, sa_type=TZDateTime)
 
     # Note: Relationships will be handled by repository layer for now
+
+
+class ChatArchive(SQLModel, table=True):
+    """Compressed messages of an inactive chat history (see src/chat/archive.py)"""
+
+    __tablename__ = "chat_archives"
+
+    chat_history_id: str = Field(
+        foreign_key="chat_histories.id", primary_key=True, sa_type=UUIDString
+    )
+    payload: bytes  # gzip-compressed JSON list of messages
+    message_count: int = Field(default=0)
+    original_bytes: int = Field(default=0)  # storage of the archived rows
+    archived_date: Optional[datetime] = Field(default_factory=now, sa_type=TZDateTime)
+
+
+# Full-text search objects for databases created from the models
+# (existing databases get them from migration 013)
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        ChatMessage.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        ChatMessage.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
@@ -0,0 +1,83 @@
+"""
+Chat Partitions - Monthly range partitions of chat_messages (Postgres only)
+Partitions are keyed on created_date, month boundaries in Asia/Jakarta time.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.utils.date import APP_TIMEZONE, now
+
+PARENT_TABLE = "chat_messages"
+
+# Upper bound of every range partition of chat_messages
+_PARTITION_BOUNDS = text(
+    """
+    SELECT child.relname AS name,
+           (regexp_match(pg_get_expr(child.relpartbound, child.oid),
+                         'TO \\(''([^'']+)''\\)'))[1]::timestamptz AS upper_bound
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = :parent
+    ORDER BY upper_bound NULLS FIRST
+    """
+)
+
+
+def month_start(moment: datetime, months: int = 0) -> datetime:
+    """Start of the month of `moment` (plus `months`) in the app timezone"""
+    local = moment.astimezone(APP_TIMEZONE)
+    index = local.year * 12 + local.month - 1 + months
+    return APP_TIMEZONE.localize(datetime(index // 12, index % 12 + 1, 1))
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_{month:%Y_%m}"
+
+
+def is_partitioned(db: Session) -> bool:
+    """Whether chat_messages is a partitioned table on this database"""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    kind = db.execute(
+        text("SELECT relkind FROM pg_class WHERE relname = :parent"),
+        {"parent": PARENT_TABLE},
+    ).scalar()
+    return kind == "p"
+
+
+def get_partition_bounds(db: Session) -> List[tuple]:
+    """(name, upper bound) of each partition, the default partition has None"""
+    return db.execute(_PARTITION_BOUNDS, {"parent": PARENT_TABLE}).all()
+
+
+def create_message_partitions(
+    db: Session, months_ahead: int = 3, current: Optional[datetime] = None
+) -> List[str]:
+    """
+    Create the missing monthly partitions up to `months_ahead` months after
+    the current one, continuing from the highest existing bound.
+    Returns the names of the created partitions (caller commits).
+    """
+    bounds = [bound for _, bound in get_partition_bounds(db) if bound]
+    first = month_start(current or now())
+    start = max([first] + [month_start(bound) for bound in bounds])
+    last = month_start(first, months_ahead)
+
+    created = []
+    while start <= last:
+        end = month_start(start, 1)
+        name = partition_name(start)
+        db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        created.append(name)
+        start = end
+    return created
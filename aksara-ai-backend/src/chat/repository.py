@@ -3,13 +3,125 @@ Chat Repository - Database operations only
 All business logic moved to controller
 """
 
-import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Union
 
-from sqlalchemy import desc
+from sqlalchemy import (
+    and_,
+    bindparam,
+    column,
+    delete,
+    desc,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.chat.models import ChatHistory, ChatMessage
+from src.chat.archive import pack_messages, unpack_messages
+from src.chat.models import ChatArchive, ChatHistory, ChatMessage
+from src.chat.search import (
+    HEADLINE_OPTIONS,
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    SEARCH_CONFIG,
+    fts5_query,
+)
+from src.utils.date import now
+from src.utils.helper import resolve
+from src.utils.ids import new_id
+from src.utils.pagination import Cursor
+
+# Length of last_message_preview stored on chat_histories
+MESSAGE_PREVIEW_LENGTH = 100
+
+# Sidebar summary of a history, from the denormalized columns only
+SUMMARY_COLUMNS = (
+    ChatHistory.id,
+    ChatHistory.title,
+    ChatHistory.model,
+    ChatHistory.message_count,
+    ChatHistory.last_message_preview.label("last_message"),
+    ChatHistory.created_date,
+    ChatHistory.updated_date,
+)
+
+# Message fields shown by the API; read as plain rows, never session entities
+MESSAGE_COLUMNS = (
+    ChatMessage.id,
+    ChatMessage.sender,
+    ChatMessage.text,
+    ChatMessage.model,
+    ChatMessage.created_date,
+)
+
+# Full-text search objects (see src/chat/search.py), not mapped on the models
+SEARCH_VECTOR = literal_column("chat_messages.search_vector")
+SEARCH_FTS = table("chat_messages_fts", column("rowid"), column("rank"))
+
+# Hot read statements built once at import (see src/user/repository.py)
+CHAT_HISTORY_BY_ID = (
+    select(ChatHistory)
+    .where(ChatHistory.id == bindparam("chat_id"), ChatHistory.deleted == False)
+    .limit(1)
+)
+USER_CHAT_HISTORY_BY_ID = (
+    select(ChatHistory)
+    .where(
+        ChatHistory.id == bindparam("chat_id"),
+        ChatHistory.deleted == False,
+        ChatHistory.user_id == bindparam("user_id"),
+    )
+    .limit(1)
+)
+MESSAGES_BY_CHAT_ID = (
+    select(ChatMessage)
+    .where(
+        ChatMessage.chat_history_id == bindparam("chat_history_id"),
+        ChatMessage.deleted == False,
+    )
+    .order_by(ChatMessage.created_date)
+)
+MESSAGE_TURNS_BY_CHAT_ID = (
+    select(ChatMessage.sender, ChatMessage.text)
+    .where(
+        ChatMessage.chat_history_id == bindparam("chat_history_id"),
+        ChatMessage.deleted == False,
+    )
+    .order_by(ChatMessage.created_date)
+)
+
+
+def _chat_history_statement(chat_id: str, user_id: Optional[str]):
+    """Cached history lookup with its parameters"""
+    if user_id:
+        return USER_CHAT_HISTORY_BY_ID, {"chat_id": chat_id, "user_id": user_id}
+    return CHAT_HISTORY_BY_ID, {"chat_id": chat_id}
+
+
+def _take_archive_statement(chat_id: str):
+    """Delete a history's archive row, returning its payload (None if gone)"""
+    return (
+        delete(ChatArchive)
+        .where(ChatArchive.chat_history_id == chat_id)
+        .returning(ChatArchive.payload)
+    )
+
+
+def _restored_message_rows(chat_id: str, payload: bytes) -> List[dict]:
+    """chat_messages insert parameters for an unpacked archive payload"""
+    return [
+        dict(message, chat_history_id=chat_id, deleted=False)
+        for message in unpack_messages(payload)
+    ]
 
 
 class ChatRepository:
@@ -29,25 +141,23 @@ class ChatRepository:
     ) -> ChatHistory:
         """Create new chat history record"""
         new_chat = ChatHistory(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             user_id=user_id,
             title=title,
             model=model,
             language=language,
         )
         self.db.add(new_chat)
+        # Insert now so messages can reference it in the same transaction
+        self.db.flush()
         return new_chat
 
     def get_chat_history_by_id(
         self, chat_id: str, user_id: str = None
     ) -> Optional[ChatHistory]:
         """Get chat history by ID, optionally filter by user_id"""
-        query = self.db.query(ChatHistory).filter(
-            ChatHistory.id == chat_id, ChatHistory.deleted == False
-        )
-        if user_id:
-            query = query.filter(ChatHistory.user_id == user_id)
-        return query.first()
+        statement, params = _chat_history_statement(chat_id, user_id)
+        return self.db.execute(statement, params).scalars().first()
 
     def get_user_chat_histories(self, user_id: str) -> List[ChatHistory]:
         """Get all chat histories for a user"""
@@ -62,6 +172,145 @@ class ChatRepository:
             .all()
         )
 
+    @staticmethod
+    def _keyset_page(
+        query,
+        timestamp_column,
+        id_column,
+        limit: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None,
+    ):
+        """
+        Keyset pagination on (timestamp, id) for a Query or a select()
+
+        Rows come newest first, or oldest first when paging with `after`.
+        One extra row is fetched so the caller can tell if there is more.
+        """
+        key = tuple_(timestamp_column, id_column)
+        if after:
+            return (
+                query.filter(key > after)
+                .order_by(timestamp_column, id_column)
+                .limit(limit + 1)
+            )
+        if before:
+            query = query.filter(key < before)
+        return query.order_by(desc(timestamp_column), desc(id_column)).limit(limit + 1)
+
+    def get_user_chat_history_summaries(
+        self,
+        user_id: str,
+        limit: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None,
+    ) -> List[Row]:
+        """Get a page of sidebar summaries from the denormalized columns only"""
+        query = self.db.query(*SUMMARY_COLUMNS).filter(
+            ChatHistory.user_id == user_id,
+            ChatHistory.deleted == False,
+            ChatHistory.is_active == True,
+        )
+        return self._keyset_page(
+            query, ChatHistory.updated_date, ChatHistory.id, limit, before, after
+        ).all()
+
+    def _message_summaries(self):
+        """
+        Message count, preview and timestamp of the latest live message per
+        history, computed from chat_messages (truth source for the counters)
+        """
+        ranked = (
+            self.db.query(
+                ChatMessage.chat_history_id.label("chat_history_id"),
+                func.count()
+                .over(partition_by=ChatMessage.chat_history_id)
+                .label("message_count"),
+                func.substr(ChatMessage.text, 1, MESSAGE_PREVIEW_LENGTH).label(
+                    "last_message_preview"
+                ),
+                ChatMessage.created_date.label("last_message_at"),
+                func.row_number()
+                .over(
+                    partition_by=ChatMessage.chat_history_id,
+                    order_by=(desc(ChatMessage.created_date), desc(ChatMessage.id)),
+                )
+                .label("position"),
+            )
+            .filter(ChatMessage.deleted == False)
+            .subquery()
+        )
+        return (
+            self.db.query(
+                ranked.c.chat_history_id,
+                ranked.c.message_count,
+                ranked.c.last_message_preview,
+                ranked.c.last_message_at,
+            )
+            .filter(ranked.c.position == 1)
+            .subquery()
+        )
+
+    def get_inconsistent_chat_histories(self, limit: int = None) -> List[Row]:
+        """Histories whose denormalized summary differs from their messages"""
+        actual = self._message_summaries()
+        expected_count = func.coalesce(actual.c.message_count, 0)
+        query = (
+            self.db.query(
+                ChatHistory.id,
+                ChatHistory.message_count,
+                expected_count.label("expected_message_count"),
+                ChatHistory.last_message_at,
+                actual.c.last_message_at.label("expected_last_message_at"),
+            )
+            .outerjoin(actual, actual.c.chat_history_id == ChatHistory.id)
+            .filter(ChatHistory.is_archived == False)
+            .filter(
+                or_(
+                    ChatHistory.message_count != expected_count,
+                    ChatHistory.last_message_preview.is_distinct_from(
+                        actual.c.last_message_preview
+                    ),
+                    ChatHistory.last_message_at.is_distinct_from(
+                        actual.c.last_message_at
+                    ),
+                )
+            )
+            .order_by(ChatHistory.id)
+        )
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    def refresh_chat_history_summary(self, chat_id: str) -> bool:
+        """Recompute denormalized summary of one history from its messages"""
+        live = and_(
+            ChatMessage.chat_history_id == chat_id, ChatMessage.deleted == False
+        )
+        latest = (
+            select(ChatMessage)
+            .where(live)
+            .order_by(desc(ChatMessage.created_date), desc(ChatMessage.id))
+            .limit(1)
+            .subquery()
+        )
+        result = self.db.execute(
+            update(ChatHistory)
+            .where(ChatHistory.id == chat_id)
+            .values(
+                message_count=select(func.count())
+                .select_from(ChatMessage)
+                .where(live)
+                .scalar_subquery(),
+                last_message_preview=select(
+                    func.substr(latest.c.text, 1, MESSAGE_PREVIEW_LENGTH)
+                ).scalar_subquery(),
+                last_message_at=select(latest.c.created_date).scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
     def update_chat_history_title(
         self, chat_id: str, title: str
     ) -> Optional[ChatHistory]:
@@ -71,11 +320,42 @@ class ChatRepository:
             chat.title = title  # type: ignore
         return chat
 
+    def update_chat_history_turn(
+        self,
+        chat_id: str,
+        model: str,
+        updated_date: datetime,
+        last_message: ChatMessage,
+        added_messages: int = 2,
+        title: Optional[str] = None,
+    ) -> bool:
+        """
+        Record model of the latest turn, bump activity and maintain the
+        denormalized summary in the same transaction (no SELECT)
+        """
+        values = {
+            "model": model,
+            "updated_date": updated_date,
+            "message_count": ChatHistory.message_count + added_messages,
+            "last_message_preview": last_message.text[:MESSAGE_PREVIEW_LENGTH],
+            "last_message_at": last_message.created_date,
+        }
+        if title:
+            values["title"] = title
+        result = (
+            self.db.query(ChatHistory)
+            .filter(ChatHistory.id == chat_id)
+            .update(values, synchronize_session=False)
+        )
+        return result > 0
+
     def soft_delete_chat_history(self, chat_id: str) -> bool:
         """Soft delete chat history"""
         chat = self.get_chat_history_by_id(chat_id)
         if chat:
             chat.deleted = True  # type: ignore
+            # Retention window of the purge job starts here
+            chat.updated_date = now()  # type: ignore
             return True
         return False
 
@@ -90,14 +370,29 @@ class ChatRepository:
     # ============ ChatMessage Operations ============
 
     def create_chat_message(
-        self, chat_history_id: str, sender: str, text: str
+        self,
+        chat_history_id: str,
+        sender: str,
+        text: str,
+        model: str = None,
+        prompt_tokens: int = None,
+        output_tokens: int = None,
+        cached_tokens: int = None,
+        latency_ms: int = None,
+        ttft_ms: int = None,
     ) -> ChatMessage:
-        """Create new chat message"""
+        """Create new chat message (usage fields only for assistant replies)"""
         new_message = ChatMessage(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             chat_history_id=chat_history_id,
             sender=sender,
             text=text,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+            cached_tokens=cached_tokens,
+            latency_ms=latency_ms,
+            ttft_ms=ttft_ms,
         )
         self.db.add(new_message)
         return new_message
@@ -105,15 +400,33 @@ class ChatRepository:
     def get_messages_by_chat_id(self, chat_history_id: str) -> List[ChatMessage]:
         """Get all messages for a chat history"""
         return (
-            self.db.query(ChatMessage)
-            .filter(
-                ChatMessage.chat_history_id == chat_history_id,
-                ChatMessage.deleted == False,
-            )
-            .order_by(ChatMessage.created_date)
+            self.db.execute(MESSAGES_BY_CHAT_ID, {"chat_history_id": chat_history_id})
+            .scalars()
             .all()
         )
 
+    def get_message_turns(self, chat_history_id: str) -> List[Row]:
+        """(sender, text) of all messages, oldest first, for the model context"""
+        return self.db.execute(
+            MESSAGE_TURNS_BY_CHAT_ID, {"chat_history_id": chat_history_id}
+        ).all()
+
+    def get_messages_page(
+        self,
+        chat_history_id: str,
+        limit: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None,
+    ) -> List[Row]:
+        """Get a page of messages for a chat history (MESSAGE_COLUMNS rows)"""
+        query = self.db.query(*MESSAGE_COLUMNS).filter(
+            ChatMessage.chat_history_id == chat_history_id,
+            ChatMessage.deleted == False,
+        )
+        return self._keyset_page(
+            query, ChatMessage.created_date, ChatMessage.id, limit, before, after
+        ).all()
+
     def delete_message(self, message_id: str) -> bool:
         """Soft delete a message"""
         message = (
@@ -121,9 +434,291 @@ class ChatRepository:
         )
         if message:
             message.deleted = True  # type: ignore
+            message.updated_date = now()  # type: ignore
+            self.db.flush()
+            self.refresh_chat_history_summary(message.chat_history_id)
             return True
         return False
 
+    # ============ Search Operations ============
+
+    def _is_sqlite(self) -> bool:
+        return self.db.get_bind().dialect.name == "sqlite"
+
+    def _search_query(self, query_text: str, *entities):
+        """
+        Query for `entities` over live messages of live histories matching the
+        search text, plus its relevance expression (higher is better).
+        Postgres uses the GIN-indexed tsvector, SQLite the FTS5 table.
+        """
+        query = (
+            self.db.query(*entities)
+            .select_from(ChatMessage)
+            .join(ChatHistory, ChatHistory.id == ChatMessage.chat_history_id)
+            .filter(
+                ChatMessage.deleted == False,
+                ChatHistory.deleted == False,
+                ChatHistory.is_active == True,
+            )
+        )
+        if self._is_sqlite():
+            query = query.join(
+                SEARCH_FTS, SEARCH_FTS.c.rowid == literal_column("chat_messages.rowid")
+            ).filter(
+                literal_column("chat_messages_fts").op("MATCH")(fts5_query(query_text))
+            )
+            # FTS5 rank is bm25, lower is better
+            return query, -SEARCH_FTS.c.rank
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+        query = query.filter(SEARCH_VECTOR.op("@@")(ts_query))
+        return query, func.ts_rank(SEARCH_VECTOR, ts_query)
+
+    def search_chat_histories(
+        self, user_id: str, query_text: str, limit: int, offset: int = 0
+    ) -> List[Row]:
+        """
+        Page of the user's histories with messages matching the search text,
+        best match first. Each row carries `total` (matching histories).
+        """
+        if self._is_sqlite() and not fts5_query(query_text):
+            return []
+        query, rank = self._search_query(query_text, ChatHistory.id)
+        return (
+            query.add_columns(
+                ChatHistory.title,
+                ChatHistory.updated_date,
+                func.max(rank).label("rank"),
+                func.count().label("match_count"),
+                func.count().over().label("total"),
+            )
+            .filter(ChatHistory.user_id == user_id)
+            .group_by(ChatHistory.id, ChatHistory.title, ChatHistory.updated_date)
+            .order_by(desc("rank"), ChatHistory.id)
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+    def get_search_snippets(
+        self, history_ids: List[str], query_text: str, per_history: int = 3
+    ) -> List[Row]:
+        """
+        Highlighted snippets of the best matching messages per history,
+        best first within each history. Snippets are only built for the
+        selected messages; matches are wrapped in HIGHLIGHT_START/STOP.
+        """
+        if not history_ids:
+            return []
+        query, rank = self._search_query(query_text, ChatMessage.id)
+        ranked = (
+            query.add_columns(
+                func.row_number()
+                .over(
+                    partition_by=ChatMessage.chat_history_id,
+                    order_by=(desc(rank), desc(ChatMessage.created_date)),
+                )
+                .label("position")
+            )
+            .filter(ChatMessage.chat_history_id.in_(history_ids))
+            .subquery()
+        )
+        best = {
+            row.id: row.position
+            for row in self.db.query(ranked.c.id, ranked.c.position).filter(
+                ranked.c.position <= per_history
+            )
+        }
+        if not best:
+            return []
+
+        if self._is_sqlite():
+            snippet = func.snippet(
+                literal_column("chat_messages_fts"),
+                0,
+                HIGHLIGHT_START,
+                HIGHLIGHT_STOP,
+                "…",
+                16,
+            )
+        else:
+            snippet = func.ts_headline(
+                SEARCH_CONFIG,
+                ChatMessage.text,
+                func.websearch_to_tsquery(SEARCH_CONFIG, query_text),
+                HEADLINE_OPTIONS,
+            )
+        query, _ = self._search_query(
+            query_text,
+            ChatMessage.chat_history_id,
+            ChatMessage.id,
+            ChatMessage.sender,
+            ChatMessage.created_date,
+            snippet.label("snippet"),
+        )
+        rows = query.filter(ChatMessage.id.in_(list(best))).all()
+        return sorted(rows, key=lambda row: best[row.id])
+
+    # ============ Archive Operations ============
+
+    def get_archivable_chat_history_ids(
+        self, cutoff: datetime, limit: int
+    ) -> List[str]:
+        """Live histories not archived yet and without activity since `cutoff`"""
+        rows = (
+            self.db.query(ChatHistory.id)
+            .filter(
+                ChatHistory.deleted == False,
+                ChatHistory.is_archived == False,
+                ChatHistory.updated_date < cutoff,
+            )
+            .order_by(ChatHistory.updated_date)
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    def get_archived_chat_history_ids(self, limit: int) -> List[str]:
+        rows = (
+            self.db.query(ChatArchive.chat_history_id)
+            .order_by(ChatArchive.chat_history_id)
+            .limit(limit)
+            .all()
+        )
+        return [row.chat_history_id for row in rows]
+
+    def _messages_storage_bytes(self, chat_id: str) -> int:
+        """Row bytes of a history's messages (text length only on SQLite)"""
+        if self._is_sqlite():
+            size = func.length(ChatMessage.text)
+        else:
+            size = func.pg_column_size(literal_column("chat_messages"))
+        total = (
+            self.db.query(func.coalesce(func.sum(size), 0))
+            .filter(ChatMessage.chat_history_id == chat_id)
+            .scalar()
+        )
+        return int(total)
+
+    def archive_chat_history(
+        self, chat_id: str, cutoff: datetime
+    ) -> Optional[ChatArchive]:
+        """
+        Move the live messages of an inactive history into chat_archives and
+        delete its rows from chat_messages (caller commits). Returns None when
+        the history was used since `cutoff` or is already archived.
+        """
+        claimed = (
+            self.db.query(ChatHistory)
+            .filter(
+                ChatHistory.id == chat_id,
+                ChatHistory.is_archived == False,
+                ChatHistory.updated_date < cutoff,
+            )
+            .update({"is_archived": True}, synchronize_session=False)
+        )
+        if not claimed:
+            return None
+
+        messages = self.get_messages_by_chat_id(chat_id)
+        archive = ChatArchive(
+            chat_history_id=chat_id,
+            payload=pack_messages(messages),
+            message_count=len(messages),
+            original_bytes=self._messages_storage_bytes(chat_id),
+        )
+        self.db.add(archive)
+        self.db.query(ChatMessage).filter(
+            ChatMessage.chat_history_id == chat_id
+        ).delete(synchronize_session=False)
+        return archive
+
+    def restore_chat_history(self, chat: ChatHistory) -> int:
+        """
+        Move archived messages of a history back into chat_messages (caller
+        commits). Returns the number of restored messages; 0 when another
+        request restored it first.
+        """
+        chat.is_archived = False  # type: ignore
+        payload = self.db.execute(_take_archive_statement(chat.id)).scalar()
+        if payload is None:
+            return 0
+
+        rows = _restored_message_rows(chat.id, payload)
+        if rows:
+            self.db.execute(insert(ChatMessage), rows)
+        return len(rows)
+
+    # ============ Retention Operations ============
+
+    def purge_deleted_messages(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        Hard delete one batch of messages soft-deleted before `cutoff`, or
+        belonging to histories soft-deleted before `cutoff` (caller commits)
+        """
+        expired_histories = select(ChatHistory.id).where(
+            ChatHistory.deleted == True, ChatHistory.updated_date < cutoff
+        )
+        batch = (
+            select(ChatMessage.id)
+            .where(
+                or_(
+                    and_(
+                        ChatMessage.deleted == True, ChatMessage.updated_date < cutoff
+                    ),
+                    ChatMessage.chat_history_id.in_(expired_histories),
+                )
+            )
+            .limit(batch_size)
+        )
+        result = self.db.execute(
+            delete(ChatMessage)
+            .where(ChatMessage.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def purge_chat_histories(
+        self, deleted_cutoff: datetime, orphan_cutoff: datetime, batch_size: int
+    ) -> int:
+        """
+        Hard delete one batch of histories without messages that were either
+        soft-deleted before `deleted_cutoff` or left empty since
+        `orphan_cutoff` (caller commits)
+        """
+        has_messages = exists().where(ChatMessage.chat_history_id == ChatHistory.id)
+        expired = and_(
+            ChatHistory.deleted == True, ChatHistory.updated_date < deleted_cutoff
+        )
+        orphaned = and_(
+            ChatHistory.message_count == 0,
+            ChatHistory.is_archived == False,
+            ChatHistory.created_date < orphan_cutoff,
+        )
+        chat_ids = (
+            self.db.execute(
+                select(ChatHistory.id)
+                .where(or_(expired, orphaned), ~has_messages)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not chat_ids:
+            return 0
+
+        self.db.execute(
+            delete(ChatArchive)
+            .where(ChatArchive.chat_history_id.in_(chat_ids))
+            .execution_options(synchronize_session=False)
+        )
+        # Re-checked: a message may have been written since the select
+        result = self.db.execute(
+            delete(ChatHistory)
+            .where(ChatHistory.id.in_(chat_ids), ~has_messages)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     # ============ Transaction Management ============
 
     def commit(self):
@@ -137,3 +732,90 @@ class ChatRepository:
     def refresh(self, instance):
         """Refresh instance from database"""
         self.db.refresh(instance)
+
+
+class AsyncChatRepository:
+    """Async variant of ChatRepository for the read endpoints"""
+
+    def __init__(self, db: Union[AsyncSession, Session]):
+        self.db = db
+
+    async def _execute(self, statement, params=None):
+        return await resolve(self.db.execute(statement, params))
+
+    async def get_chat_history_by_id(
+        self, chat_id: str, user_id: str = None
+    ) -> Optional[ChatHistory]:
+        """Get chat history by ID, optionally filter by user_id"""
+        result = await self._execute(*_chat_history_statement(chat_id, user_id))
+        return result.scalars().first()
+
+    async def get_user_chat_history_summaries(
+        self,
+        user_id: str,
+        limit: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None,
+    ) -> List[Row]:
+        """Get a page of sidebar summaries from the denormalized columns only"""
+        statement = select(*SUMMARY_COLUMNS).where(
+            ChatHistory.user_id == user_id,
+            ChatHistory.deleted == False,
+            ChatHistory.is_active == True,
+        )
+        result = await self._execute(
+            ChatRepository._keyset_page(
+                statement,
+                ChatHistory.updated_date,
+                ChatHistory.id,
+                limit,
+                before,
+                after,
+            )
+        )
+        return list(result.all())
+
+    async def get_messages_page(
+        self,
+        chat_history_id: str,
+        limit: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None,
+    ) -> List[Row]:
+        """Get a page of messages for a chat history (MESSAGE_COLUMNS rows)"""
+        statement = select(*MESSAGE_COLUMNS).where(
+            ChatMessage.chat_history_id == chat_history_id,
+            ChatMessage.deleted == False,
+        )
+        result = await self._execute(
+            ChatRepository._keyset_page(
+                statement,
+                ChatMessage.created_date,
+                ChatMessage.id,
+                limit,
+                before,
+                after,
+            )
+        )
+        return list(result.all())
+
+    async def restore_chat_history(self, chat: ChatHistory) -> int:
+        """Async ChatRepository.restore_chat_history (caller commits)"""
+        chat.is_archived = False  # type: ignore
+        result = await self._execute(_take_archive_statement(chat.id))
+        payload = result.scalar()
+        if payload is None:
+            return 0
+
+        rows = _restored_message_rows(chat.id, payload)
+        if rows:
+            await self._execute(insert(ChatMessage), rows)
+        return len(rows)
+
+    async def commit(self):
+        """Commit transaction"""
+        await resolve(self.db.commit())
+
+    async def rollback(self):
+        """Rollback transaction"""
+        await resolve(self.db.rollback())
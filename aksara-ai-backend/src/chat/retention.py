@@ -0,0 +1,116 @@
+"""
+Chat Retention - Batched hard delete of soft-deleted and orphaned chat data
+Small batches in short transactions keep row locks and replication lag low.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Callable, Optional
+
+from decouple import config
+from sqlalchemy import text
+
+from src.chat.repository import ChatRepository
+from src.config.postgres import SessionLocal, engine
+from src.utils.date import now
+from src.utils.helper import log
+
+# Soft-deleted histories/messages are hard deleted after this many days
+CHAT_RETENTION_DAYS: int = int(config("CHAT_RETENTION_DAYS", default=30))
+# Histories without any message are orphans once older than this
+CHAT_ORPHAN_GRACE_MINUTES: int = int(config("CHAT_ORPHAN_GRACE_MINUTES", default=60))
+PURGE_BATCH_SIZE: int = int(config("PURGE_BATCH_SIZE", default=500))
+# Pause between batches, gives replicas and autovacuum room to catch up
+PURGE_BATCH_PAUSE_SECONDS: float = float(
+    config("PURGE_BATCH_PAUSE_SECONDS", default=0.2)
+)
+# Scheduled purge in every worker (0 = only via maintenance.py purge)
+PURGE_INTERVAL_HOURS: float = float(config("PURGE_INTERVAL_HOURS", default=24))
+
+# Advisory lock key, only one worker purges at a time
+PURGE_LOCK_KEY = 48_101
+
+
+@contextmanager
+def _purge_lock():
+    """
+    Transaction-level advisory lock held by an open transaction on a
+    dedicated connection (Postgres only). Unlike a session-level lock it
+    can't leak to another client behind a transaction-pooling PgBouncer.
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+    with engine.connect() as conn:
+        # Released when this transaction ends, i.e. when the block exits
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PURGE_LOCK_KEY}
+        ).scalar()
+        try:
+            yield acquired
+        finally:
+            conn.rollback()
+
+
+def purge_chat_data(
+    retention_days: int = CHAT_RETENTION_DAYS,
+    batch_size: int = PURGE_BATCH_SIZE,
+    pause_seconds: float = PURGE_BATCH_PAUSE_SECONDS,
+    progress: Optional[Callable[[str, int, dict], None]] = None,
+) -> Optional[dict]:
+    """
+    Hard delete expired messages first, then empty expired/orphan histories.
+    `progress(kind, deleted, totals)` is called after every batch.
+    Returns the totals, or None when another worker is already purging.
+    """
+    deleted_cutoff = now() - timedelta(days=retention_days)
+    orphan_cutoff = now() - timedelta(minutes=CHAT_ORPHAN_GRACE_MINUTES)
+    totals = {"messages": 0, "histories": 0, "batches": 0}
+
+    with _purge_lock() as acquired:
+        if not acquired:
+            return None
+
+        db = SessionLocal()
+        repo = ChatRepository(db)
+        steps = {
+            "messages": lambda: repo.purge_deleted_messages(deleted_cutoff, batch_size),
+            "histories": lambda: repo.purge_chat_histories(
+                deleted_cutoff, orphan_cutoff, batch_size
+            ),
+        }
+        try:
+            for kind, purge_batch in steps.items():
+                while True:
+                    deleted = purge_batch()
+                    repo.commit()
+                    totals[kind] += deleted
+                    totals["batches"] += 1
+                    if progress:
+                        progress(kind, deleted, totals)
+                    if deleted < batch_size:
+                        break
+                    time.sleep(pause_seconds)
+        except Exception:
+            repo.rollback()
+            raise
+        finally:
+            db.close()
+    return totals
+
+
+async def run_purge_loop():
+    """Background task purging expired chat data every PURGE_INTERVAL_HOURS"""
+    while True:
+        await asyncio.sleep(PURGE_INTERVAL_HOURS * 3600)
+        try:
+            totals = await asyncio.to_thread(purge_chat_data)
+            if totals:
+                log(
+                    f"Purged {totals['messages']} messages and "
+                    f"{totals['histories']} chat histories"
+                )
+        except Exception as e:
+            log(f"Chat purge failed: {e}", log_level="error")
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, Query, WebSocket
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.auth.auth import JWTBearer
 from src.chat.controller import ChatController
-from src.chat.schemas import ChatRequest
+from src.chat.schemas import ChatRequest, ChatSearchParams
 from src.common.response_examples import ResponseExamples
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
+from src.utils.pagination import CursorParams
 
 routerChat = APIRouter()
 
@@ -29,10 +33,26 @@ async def generate_chat_response(
     summary="Get chat histories",
 )
 async def get_chat_histories(
+    page: CursorParams = Depends(),
+    authorization: str = Depends(JWTBearer()),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
+):
+    """Chat histories by latest activity; pass `next_cursor` as `before` for more"""
+    return await ChatController.get_chat_histories(authorization, page, db)
+
+
+@routerChat.get(
+    "/search",
+    status_code=200,
+    summary="Search chat histories",
+)
+async def search_chat_histories(
+    params: ChatSearchParams = Depends(),
     authorization: str = Depends(JWTBearer()),
     db: Session = Depends(get_db),
 ):
-    return await ChatController.get_chat_histories(authorization, db)
+    """Full-text search over your messages, best matching chats first"""
+    return await ChatController.search_chat_histories(authorization, params, db)
 
 
 @routerChat.get(
@@ -43,10 +63,14 @@ async def get_chat_histories(
 )
 async def get_chat_history_by_id(
     history_id: str,
+    page: CursorParams = Depends(),
     authorization: str = Depends(JWTBearer()),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
 ):
-    return await ChatController.get_chat_history_by_id(history_id, authorization, db)
+    """Latest messages of a chat; pass `next_cursor` as `before` for older ones"""
+    return await ChatController.get_chat_history_by_id(
+        history_id, authorization, page, db
+    )
 
 
 @routerChat.delete(
@@ -60,3 +84,20 @@ async def delete_chat_history(
     db: Session = Depends(get_db),
 ):
     return await ChatController.delete_chat_history(history_id, authorization, db)
+
+
+@routerChat.websocket("/ws")
+async def chat_websocket(
+    websocket: WebSocket,
+    token: str = Query(..., description="Access token (authenticated once)"),
+    chat_history_id: Optional[str] = Query(
+        None, description="Existing chat history to continue"
+    ),
+):
+    """
+    Chat session over WebSocket
+
+    Send `{"input": "..."}` per turn; the server replies with `chunk` events
+    followed by a `done` event carrying the conversation id.
+    """
+    await ChatController.chat_websocket(websocket, token, chat_history_id)
@@ -0,0 +1,117 @@
+"""
+Chat Routing - Local prompt classification for model selection
+Picks a model tier and output cap per turn without any upstream call
+"""
+
+import re
+from typing import Optional
+
+from decouple import config
+from pydantic import BaseModel
+
+# Model tiers
+MODEL_FAST: str = str(config("CHAT_MODEL_FAST", default="gemini-2.5-flash-lite"))
+MODEL_STRONG: str = str(config("CHAT_MODEL_STRONG", default="gemini-2.5-flash"))
+
+# Output caps per tier
+MAX_TOKENS_SIMPLE: int = int(config("CHAT_MAX_TOKENS_SIMPLE", default=256))
+MAX_TOKENS_STANDARD: int = int(config("CHAT_MAX_TOKENS_STANDARD", default=1024))
+MAX_TOKENS_COMPLEX: int = int(config("CHAT_MAX_TOKENS_COMPLEX", default=2048))
+
+TIER_SIMPLE = "simple"
+TIER_STANDARD = "standard"
+TIER_COMPLEX = "complex"
+
+# Sapaan / basa-basi pendek yang tidak butuh model besar. Seluruh pesan harus
+# sapaan (boleh beberapa, plus panggilan), bukan hanya awalannya:
+# "ok, jelaskan TCP handshake" bukan basa-basi
+_GREETING = (
+    r"hai|halo|hallo|hi|hello|hey|pagi|siang|sore|malam|"
+    r"selamat (?:pagi|siang|sore|malam)|terima ?kasih|makasih|thanks|thank you|"
+    r"ok|oke|okay|sip|baik|siap|siapa kamu|kamu siapa|apa kabar|bye|dadah"
+)
+_ADDRESS = r"kak|min|bot|aksara|ya|lagi|semua|banyak|sekali|juga"
+SIMPLE_PATTERN = re.compile(
+    rf"^\s*(?:{_GREETING})(?:[\s,!.]+(?:{_GREETING}|{_ADDRESS}))*[\s!?.,]*$",
+    re.IGNORECASE,
+)
+
+# Kata kunci yang menandakan permintaan panjang / analitis
+COMPLEX_PATTERN = re.compile(
+    r"\b(jelaskan|uraikan|analisis|analisa|bandingkan|evaluasi|rangkum|ringkas|"
+    r"buatkan|tuliskan|susun|kerangka|outline|essay|esai|makalah|skripsi|"
+    r"jurnal|penelitian|metodologi|argumen|kritik|langkah|contoh|mengapa|"
+    r"kenapa|bagaimana|explain|analy[sz]e|compare|summari[sz]e|write|draft)\b",
+    re.IGNORECASE,
+)
+
+
+class ModelRoute(BaseModel):
+    """Routing decision for a single chat turn"""
+
+    tier: str
+    model: str
+    max_tokens: int
+
+
+def classify_prompt(text: str, history_depth: int = 0) -> str:
+    """Classify prompt complexity using length, intent keywords and depth"""
+    text = text or ""
+    words = len(text.split())
+
+    if (
+        words <= 8
+        and SIMPLE_PATTERN.match(text)
+        and not COMPLEX_PATTERN.search(text)
+        and history_depth < 20
+    ):
+        return TIER_SIMPLE
+
+    score = 0
+    if words > 60:
+        score += 2
+    elif words > 20:
+        score += 1
+    if COMPLEX_PATTERN.search(text):
+        score += 2
+    if text.count("?") > 1:
+        score += 1
+    if text.count("\n") >= 3 or "```" in text:
+        score += 1
+    if history_depth >= 12:
+        score += 1
+
+    # Pertanyaan biasa tetap standard: cap 256 token hanya untuk basa-basi
+    if score >= 3:
+        return TIER_COMPLEX
+    return TIER_STANDARD
+
+
+def route_prompt(
+    text: str, history_depth: int = 0, requested_max_tokens: Optional[int] = None
+) -> ModelRoute:
+    """
+    Pick model and output cap for a prompt
+
+    Args:
+        text: Current user input
+        history_depth: Number of previous messages in the conversation
+        requested_max_tokens: Explicit max_tokens from the client, if any
+
+    Returns:
+        ModelRoute with tier, model name and max output tokens
+    """
+    tier = classify_prompt(text, history_depth)
+
+    if tier == TIER_SIMPLE:
+        model, max_tokens = MODEL_FAST, MAX_TOKENS_SIMPLE
+    elif tier == TIER_COMPLEX:
+        model, max_tokens = MODEL_STRONG, MAX_TOKENS_COMPLEX
+    else:
+        model, max_tokens = MODEL_STRONG, MAX_TOKENS_STANDARD
+
+    # Client explicitly asked for a cap, honor it
+    if requested_max_tokens:
+        max_tokens = requested_max_tokens
+
+    return ModelRoute(tier=tier, model=model, max_tokens=max_tokens)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -16,7 +16,26 @@ class ChatRequest(BaseModel):
         default=0.0, ge=0.0, le=1.0, description="Sampling temperature"
     )
     max_tokens: Optional[int] = Field(
-        default=512, ge=1, le=4096, description="Max tokens to generate"
+        default=None,
+        ge=1,
+        le=4096,
+        description="Max tokens to generate (chosen by prompt routing when omitted)",
+    )
+
+
+# 🔌 Pesan dari client pada sesi WebSocket (percakapan sudah di-pin saat connect)
+class ChatSocketRequest(BaseModel):
+    """Incoming WebSocket message for a chat turn."""
+
+    input: str = Field(..., min_length=1, description="User chat input / prompt")
+    temperature: Optional[float] = Field(
+        default=0.0, ge=0.0, le=1.0, description="Sampling temperature"
+    )
+    max_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=4096,
+        description="Max tokens to generate (chosen by prompt routing when omitted)",
     )
 
 
@@ -27,6 +46,7 @@ class ChatMessageResponse(BaseModel):
     id: str
     sender: str  # 'user' or 'assistant'
     text: str
+    model: Optional[str] = None
     created_date: datetime
 
     class Config:
@@ -55,7 +75,11 @@ class ChatHistoryDetail(BaseModel):
     is_active: bool
     created_date: datetime
     updated_date: datetime
+    message_count: int = 0
     messages: List[ChatMessageResponse]
+    # Pass as `before` (or `after` when paging forward) to load the next page
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
     class Config:
         from_attributes = True
@@ -82,3 +106,40 @@ class ChatHistoryListResponse(BaseModel):
 
     histories: List[ChatHistorySummary]
     total: int
+    # Pass as `before` (or `after` when paging forward) to load the next page
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+# 🔍 Query params untuk pencarian full-text di percakapan user
+class ChatSearchParams(BaseModel):
+    """Query params for chat search (page-numbered, best match first)"""
+
+    q: str = Field(..., min_length=1, max_length=200, description="Search text")
+    page: int = Field(default=1, ge=1)
+    size: int = Field(default=10, ge=1, le=50)
+
+
+class ChatSearchSnippet(BaseModel):
+    """
+    Fragment of a matching message: plain text (render it as text, never as
+    HTML) and [start, end) offsets, in Unicode code points, of the matched
+    words within it
+    """
+
+    message_id: str
+    sender: str
+    snippet: str
+    highlights: List[Tuple[int, int]]
+    created_date: datetime
+
+
+class ChatSearchResult(BaseModel):
+    """Chat history matching a search, with its best snippets"""
+
+    chat_history_id: str
+    title: str
+    updated_date: datetime
+    rank: float
+    match_count: int
+    snippets: List[ChatSearchSnippet]
@@ -0,0 +1,89 @@
+"""
+Chat Search - Full-text search setup for chat_messages
+Postgres keeps a generated tsvector column with a GIN index; SQLite dev
+databases use an FTS5 table kept in sync by triggers.
+"""
+
+import re
+from typing import List, Tuple
+
+# 'simple' (no stemming) because conversations mix Indonesian and English
+SEARCH_CONFIG = "simple"
+
+# Match delimiters in raw snippets: control characters, not HTML, so message
+# text never reaches the client as markup. Turned into offsets by
+# split_highlights.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+# ts_headline options, fragments around the matched words
+HEADLINE_OPTIONS = (
+    f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", '
+    'MaxWords=24, MinWords=8, MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+POSTGRES_SEARCH_DDL: List[str] = [
+    f"""
+    ALTER TABLE chat_messages ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(text, ''))) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chat_messages_search
+    ON chat_messages USING gin (search_vector) WHERE deleted = false
+    """,
+]
+
+SQLITE_SEARCH_DDL: List[str] = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts
+    USING fts5(text, content='chat_messages', content_rowid='rowid')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chat_messages_fts_insert
+    AFTER INSERT ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(rowid, text) VALUES (new.rowid, new.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chat_messages_fts_delete
+    AFTER DELETE ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(chat_messages_fts, rowid, text)
+        VALUES ('delete', old.rowid, old.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chat_messages_fts_update
+    AFTER UPDATE OF text ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(chat_messages_fts, rowid, text)
+        VALUES ('delete', old.rowid, old.text);
+        INSERT INTO chat_messages_fts(rowid, text) VALUES (new.rowid, new.text);
+    END
+    """,
+]
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts5_query(text: str) -> str:
+    """Quote each word so user input can't break FTS5 query syntax (AND-ed)"""
+    return " ".join(f'"{word}"' for word in _WORD_PATTERN.findall(text))
+
+
+def split_highlights(snippet: str) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    Strip the match delimiters from a raw snippet: plain text plus
+    [start, end) offsets of each highlighted match in that text
+    """
+    text, highlights, start = [], [], None
+    length = 0
+    for part in re.split(f"([{HIGHLIGHT_START}{HIGHLIGHT_STOP}])", snippet):
+        if part == HIGHLIGHT_START:
+            start = length
+        elif part == HIGHLIGHT_STOP:
+            if start is not None and length > start:
+                highlights.append((start, length))
+            start = None
+        else:
+            text.append(part)
+            length += len(part)
+    return "".join(text), highlights
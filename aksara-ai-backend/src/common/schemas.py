@@ -7,6 +7,7 @@ These schemas define the standardized format for success and error responses.
 
 from typing import Any, Generic, Optional, TypeVar
 
+import orjson
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel as BaseModelV2
@@ -16,6 +17,29 @@ from starlette.responses import JSONResponse
 T = TypeVar("T")
 
 
+def _json_default(value: Any) -> Any:
+    """Values orjson doesn't serialize natively, encoded the way FastAPI does"""
+    if isinstance(value, BaseModelV2):
+        # Serialized by pydantic-core, no intermediate dict walk
+        return orjson.Fragment(value.model_dump_json(by_alias=True))
+    return jsonable_encoder(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson (datetime, UUID, enums and dataclasses
+    natively). Same bytes as Starlette's compact, non-ASCII-escaped json.dumps
+    except for floats: the same values, but orjson writes exponents its own
+    way (1e-05 -> 0.00001, 2.5e-07 -> 2.5e-7), and NaN/Infinity become null
+    where Starlette raises ValueError.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
 # Base response models
 class BaseResponse(BaseModelV2, Generic[T]):
     """Base response model for all API responses"""
@@ -53,16 +77,14 @@ def create_success_response(
 
     Args:
         message: Success message
-        data: Response data (optional)
+        data: Response data (optional), a pydantic model is serialized directly
         status_code: HTTP status code
 
     Returns:
-        JSONResponse with standardized format
+        FastJSONResponse with standardized format
     """
     content = {"message": message, "data": data if data is not None else {}}
-    # Ensure all values (e.g., datetime) are JSON serializable
-    content = jsonable_encoder(content)
-    return JSONResponse(status_code=status_code, content=content)
+    return FastJSONResponse(status_code=status_code, content=content)
 
 
 def create_error_response(
@@ -81,7 +103,7 @@ def create_error_response(
         status_code: HTTP status code (defaults to error_code)
 
     Returns:
-        JSONResponse with standardized format
+        FastJSONResponse with standardized format
     """
     if status_code is None:
         status_code = error_code
@@ -96,9 +118,7 @@ def create_error_response(
     if details:
         content["error"]["details"] = details
 
-    # Ensure all values (e.g., datetime) are JSON serializable
-    content = jsonable_encoder(content)
-    return JSONResponse(status_code=status_code, content=content)
+    return FastJSONResponse(status_code=status_code, content=content)
 
 
 # Common response examples for Swagger documentation
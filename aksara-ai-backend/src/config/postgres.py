@@ -1,51 +1,300 @@
-from decouple import config
-from sqlalchemy import create_engine
+from uuid import uuid4
+
+from decouple import Csv, config
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
+# Every model's tables must be on SQLModel.metadata before init_db's create_all
+import src.chat.models  # noqa: F401
+import src.quota.models  # noqa: F401
+import src.user.models  # noqa: F401
 from src.utils.helper import log
+from src.utils.metrics import metrics
+from src.utils.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_pool,
+    pool_gauges,
+)
+from src.utils.replica import (
+    LAST_WRITE_HEADER,
+    READ_METHODS,
+    RecentWriters,
+    RoutingSession,
+    replica_stats,
+    request_user_id,
+    use_replica_for,
+)
+from src.utils.session import LazySession
+from src.utils.sql_stats import instrument_engine
 
 # URL koneksi database dari environment variables
 SQLALCHEMY_DATABASE_URL: str = str(config("DATABASE_CONN"))
 
+# Async engine (asyncpg / aiosqlite) for the read endpoints, off by default
+DATABASE_ASYNC: bool = config("DATABASE_ASYNC", default=False, cast=bool)
+
+# Read replicas for the read endpoints (comma separated URLs), empty = primary only
+DATABASE_REPLICA_CONNS: list = config("DATABASE_REPLICA_CONNS", default="", cast=Csv())
+# Read-your-writes: a user's reads stay on the primary this long after a write
+REPLICA_STICKY_SECONDS: float = config(
+    "REPLICA_STICKY_SECONDS", default=5.0, cast=float
+)
+
+# PgBouncer (transaction pooling) in front of Postgres: no session state,
+# no server-side prepared statements, NullPool unless DB_POOL_SIZE is set
+DATABASE_PGBOUNCER: bool = config("DATABASE_PGBOUNCER", default=False, cast=bool)
+# Direct server URL for migrations when DATABASE_CONN points at PgBouncer
+DATABASE_DIRECT_CONN: str = config("DATABASE_DIRECT_CONN", default="")
+
+# Connection pool per worker. WEB_CONCURRENCY is the uvicorn worker count;
+# DB_CONNECTION_BUDGET (total for all workers) sizes the pools from it
+DB_WORKERS: int = config("WEB_CONCURRENCY", default=1, cast=int)
+DB_CONNECTION_BUDGET: int = config("DB_CONNECTION_BUDGET", default=0, cast=int)
+DB_POOL_TIMEOUT: int = config("DB_POOL_TIMEOUT", default=30, cast=int)
+DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", default=1800, cast=int)
+
+
+def pool_sizes() -> tuple:
+    """(pool_size, max_overflow) of each engine on the primary"""
+    if not DB_CONNECTION_BUDGET:
+        return (
+            config("DB_POOL_SIZE", default=0 if DATABASE_PGBOUNCER else 10, cast=int),
+            config("DB_MAX_OVERFLOW", default=20, cast=int),
+        )
+    # The async engine keeps its own pool next to the sync one
+    pools = DB_WORKERS * (2 if DATABASE_ASYNC else 1)
+    per_pool = max(DB_CONNECTION_BUDGET // pools, 1)
+    size = max(per_pool * 2 // 3, 1)
+    return size, per_pool - size
+
+
+DB_POOL_SIZE, DB_MAX_OVERFLOW = pool_sizes()
+
 # Debug: Log the database URL (for debugging purposes only)
 log(f"DB URLNYA: {SQLALCHEMY_DATABASE_URL}", log_level="debug")
 
-# Membuat engine dengan pengaturan yang berbeda untuk SQLite dan PostgreSQL
-if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
-    # Untuk SQLite, tidak gunakan opsi PostgreSQL
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        echo=True,
-        pool_pre_ping=True,
+
+def postgres_engine_options(is_async: bool = False) -> dict:
+    """Connection and pool options of Postgres engines (psycopg2 / asyncpg)"""
+    if DATABASE_PGBOUNCER:
+        # Tanpa startup options (PgBouncer menolaknya); zona waktu ditangani
+        # TZDateTime dan local_date, bukan setting sesi
+        options: dict = {}
+        if is_async:
+            # Transaction pooling can run each statement on another server
+            # connection: no prepared statement cache, unique statement names
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+    elif is_async:
+        options = {
+            # asyncpg takes session settings instead of libpq options
+            "connect_args": {"server_settings": {"timezone": "Asia/Jakarta"}},
+            "pool_pre_ping": True,
+        }
+    else:
+        options = {
+            "connect_args": {"options": "-c timezone=Asia/Jakarta"},  # Zona waktu
+            "pool_pre_ping": True,  # Memeriksa koneksi sebelum meminjamkan dari pool
+        }
+
+    if DB_POOL_SIZE == 0:
+        # Koneksi dibuka per checkout, pooling diserahkan ke PgBouncer
+        options["poolclass"] = NullPool
+        return options
+    options.update(
+        # Pool dengan metrik waktu tunggu checkout
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,  # Mengatur ukuran pool
+        max_overflow=DB_MAX_OVERFLOW,  # Koneksi tambahan melebihi pool_size
+        pool_timeout=DB_POOL_TIMEOUT,  # Waktu timeout menunggu koneksi tersedia
+        pool_recycle=DB_POOL_RECYCLE,  # Waktu daur ulang pool (dalam detik)
     )
-else:
+    return options
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    """Engine dengan pengaturan yang berbeda untuk SQLite dan PostgreSQL"""
+    if url.startswith("sqlite"):
+        # Untuk SQLite, tidak gunakan opsi PostgreSQL
+        sqlite_engine = create_engine(
+            url,
+            pool_pre_ping=True,
+            # In-memory databases need SQLAlchemy's default singleton pool
+            poolclass=None if ":memory:" in url else InstrumentedQueuePool,
+        )
+        instrument_engine(sqlite_engine)
+        instrument_pool(sqlite_engine)
+        return sqlite_engine
     # Untuk PostgreSQL, gunakan opsi timezone dan pool settings
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        connect_args={"options": "-c timezone=Asia/Jakarta"},  # Mengatur zona waktu
-        echo=True,
-        pool_size=10,  # Mengatur ukuran pool
-        max_overflow=20,  # Jumlah koneksi yang dapat dibuat melebihi pool_size
-        pool_timeout=30,  # Waktu timeout untuk menunggu koneksi tersedia
-        pool_recycle=1800,  # Mengatur waktu daur ulang pool (dalam detik)
-        pool_pre_ping=True,  # Memeriksa koneksi sebelum meminjamkan dari pool
-    )
+    postgres_engine = create_engine(url, **postgres_engine_options())
+    # Pengganti echo: slow query log, sampling dan statistik per request
+    instrument_engine(postgres_engine)
+    instrument_pool(postgres_engine)
+    return postgres_engine
+
+
+engine = create_db_engine()
+replica_engines = [create_db_engine(url) for url in DATABASE_REPLICA_CONNS]
 
 # Membuat sesi lokal
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sesi baca: SELECT ke replica, tulis tetap ke primary
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=replica_engines,
+)
+
+
+def async_database_url(url: str = SQLALCHEMY_DATABASE_URL) -> str:
+    """Same database through the async driver (asyncpg / aiosqlite)"""
+    scheme, rest = url.split("://", 1)
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    return f"postgresql+asyncpg://{rest}"
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL) -> AsyncEngine:
+    """Async engine with the same settings as the sync one"""
+    if url.startswith("sqlite"):
+        db_engine = create_async_engine(
+            async_database_url(url),
+            poolclass=None if ":memory:" in url else InstrumentedAsyncQueuePool,
+        )
+    else:
+        db_engine = create_async_engine(
+            async_database_url(url), **postgres_engine_options(is_async=True)
+        )
+    instrument_engine(db_engine.sync_engine)
+    instrument_pool(db_engine.sync_engine)
+    return db_engine
+
+
+if DATABASE_ASYNC:
+    async_engine = create_async_db_engine()
+    # No expiry on commit: async sessions can't lazy-load expired attributes
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    async_replica_engines = [
+        create_async_db_engine(url) for url in DATABASE_REPLICA_CONNS
+    ]
+    AsyncReadSessionLocal = async_sessionmaker(
+        async_engine,
+        sync_session_class=RoutingSession,
+        replicas=[replica.sync_engine for replica in async_replica_engines],
+        autoflush=False,
+        expire_on_commit=False,
+    )
 
 # Deklarasi base untuk model
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency untuk mendapatkan sesi database."""
-    db = SessionLocal()
+recent_writers = RecentWriters(REPLICA_STICKY_SECONDS)
+
+
+def get_db(request: Request):
+    """Dependency untuk mendapatkan sesi database (dibuka saat query pertama)."""
+    db = LazySession(SessionLocal)
     try:
         yield db
     finally:
         db.close()
+        # Runs before the response is sent, so the next read already sticks
+        if replica_engines and request.method not in READ_METHODS:
+            recent_writers.mark(request_user_id(request.headers.get("Authorization")))
+
+
+def get_replica_db(request: Request):
+    """Dependency sesi baca: replica kecuali user baru saja menulis."""
+    user_id = request_user_id(request.headers.get("Authorization"))
+    use_replica = use_replica_for(
+        recent_writers, user_id, request.headers.get(LAST_WRITE_HEADER)
+    )
+    db = LazySession(lambda: ReadSessionLocal(use_replica=use_replica))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Dependency untuk mendapatkan sesi database async (DATABASE_ASYNC)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_replica_db(request: Request):
+    """Dependency sesi baca async: replica kecuali user baru saja menulis."""
+    user_id = request_user_id(request.headers.get("Authorization"))
+    use_replica = use_replica_for(
+        recent_writers, user_id, request.headers.get(LAST_WRITE_HEADER)
+    )
+    async with AsyncReadSessionLocal(use_replica=use_replica) as db:
+        yield db
+
+
+# Read endpoints take an AsyncSession when DATABASE_ASYNC is on and read from
+# the replicas when DATABASE_REPLICA_CONNS is set
+if DATABASE_ASYNC:
+    get_read_db = get_async_replica_db if replica_engines else get_async_db
+else:
+    get_read_db = get_replica_db if replica_engines else get_db
+
+
+def pool_stats() -> dict:
+    """Gauges of every engine pool of this worker for the metrics endpoint"""
+    engines = {"primary": engine}
+    engines.update(
+        (f"replica_{number}", replica)
+        for number, replica in enumerate(replica_engines, start=1)
+    )
+    if DATABASE_ASYNC:
+        engines["async"] = async_engine.sync_engine
+    return {name: pool_gauges(db_engine) for name, db_engine in engines.items()}
+
+
+def check_pool_capacity():
+    """Warn when all workers' pools together can exceed max_connections"""
+    if engine.dialect.name != "postgresql" or DB_POOL_SIZE == 0:
+        # No client pool (PgBouncer mode): the pooler caps server connections
+        return
+    pools = DB_WORKERS * (2 if DATABASE_ASYNC else 1)
+    wanted = pools * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    with engine.connect() as conn:
+        max_connections = int(conn.execute(text("SHOW max_connections")).scalar())
+        reserved = int(
+            conn.execute(text("SHOW superuser_reserved_connections")).scalar()
+        )
+    available = max_connections - reserved
+    log(
+        f"DB pools: {pools} x (pool_size {DB_POOL_SIZE} + overflow "
+        f"{DB_MAX_OVERFLOW}) = {wanted} connections, server allows {available}",
+        log_level="info",
+    )
+    if wanted > available:
+        log(
+            f"DB pools can open {wanted} connections but max_connections leaves "
+            f"{available}: lower DB_POOL_SIZE/DB_MAX_OVERFLOW or set "
+            f"DB_CONNECTION_BUDGET",
+            log_level="warning",
+        )
+
+
+metrics.register_collector("db_pool", pool_stats)
+if replica_engines:
+    metrics.register_collector("db_replicas", lambda: replica_stats(replica_engines))
 
 
 def init_db():
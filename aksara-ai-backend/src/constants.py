@@ -9,12 +9,16 @@ HTTP_INTERNAL_SERVER_ERROR = status.HTTP_500_INTERNAL_SERVER_ERROR
 HTTP_NOT_FOUND = status.HTTP_404_NOT_FOUND
 HTTP_FORBIDDEN = status.HTTP_403_FORBIDDEN
 HTTP_UNAUTHORIZED = status.HTTP_401_UNAUTHORIZED
+HTTP_TOO_MANY_REQUESTS = status.HTTP_429_TOO_MANY_REQUESTS
 
 # Success Code
 HTTP_OK = status.HTTP_200_OK
 HTTP_CREATED = status.HTTP_201_CREATED
 HTTP_ACCEPTED = status.HTTP_202_ACCEPTED
 
+# WebSocket Close Code
+WS_POLICY_VIOLATION = status.WS_1008_POLICY_VIOLATION
+
 
 # Date
 CURRENT_DATETIME = datetime.now(pytz.timezone("Asia/Jakarta"))
@@ -1,7 +1,14 @@
+from typing import Union
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
-from src.constants import HTTP_INTERNAL_SERVER_ERROR, HTTP_OK
+from src.constants import HTTP_FORBIDDEN, HTTP_INTERNAL_SERVER_ERROR, HTTP_OK
+from src.middleware.middleware import require_admin_role_async
 from src.utils.helper import formatError, ok
+from src.utils.metrics import metrics
 
 
 class HealthController:
@@ -15,3 +22,22 @@ class HealthController:
             return ok(response, "Server running successfully!", status_code=HTTP_OK)
         except Exception as e:
             return formatError(str(e), HTTP_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    async def metrics(
+        authorization: str, db: Union[AsyncSession, Session]
+    ) -> JSONResponse:
+        """Worker metrics (pool, replica, SQL and session gauges) - Admin only"""
+        try:
+            admin_role = await require_admin_role_async(authorization, db)
+            if not admin_role:
+                raise HTTPException(
+                    status_code=HTTP_FORBIDDEN,
+                    detail="Access denied! Admin role required.",
+                )
+
+            return ok(metrics.snapshot(), "Metrics retrieved successfully!", HTTP_OK)
+        except HTTPException as e:
+            return formatError(e.detail, e.status_code)
+        except Exception as e:
+            return formatError(str(e), HTTP_INTERNAL_SERVER_ERROR)
@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import Union
 
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.auth.auth import JWTBearer
 from src.common.response_examples import ResponseExamples
+from src.config.postgres import get_read_db
 from src.health.controller import HealthController
 
 routerHealth = APIRouter()
@@ -14,3 +20,18 @@ routerHealth = APIRouter()
 )
 async def health_check():
     return await HealthController.health()
+
+
+@routerHealth.get(
+    "/metrics",
+    summary="Worker metrics",
+    description=(
+        "In-process counters and gauges of the worker serving the request "
+        "- Admin only"
+    ),
+)
+async def worker_metrics(
+    authorization: str = Depends(JWTBearer()),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
+):
+    return await HealthController.metrics(authorization, db)
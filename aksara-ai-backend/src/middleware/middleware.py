@@ -3,17 +3,45 @@ Authentication and Authorization Middleware
 This middleware handles JWT authentication and role-based authorization for all users
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 import bcrypt
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.auth.handler import get_current_user
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
 from src.constants import HTTP_FORBIDDEN, HTTP_UNAUTHORIZED
 from src.user.models import User, UserRole
-from src.utils.helper import log
+from src.user.repository import ACTIVE_USER_BY_ID
+from src.utils.helper import log, resolve
+
+
+def _token_user_id(authorization: str) -> str:
+    """User ID from the bearer token, raises HTTPException when missing/invalid"""
+    if not authorization:
+        raise HTTPException(
+            status_code=HTTP_UNAUTHORIZED, detail="Authorization token is missing!"
+        )
+
+    # Handle token extraction
+    if isinstance(authorization, str) and "Bearer" in authorization:
+        try:
+            token = authorization.split("Bearer", 1)[1].strip()
+        except Exception:
+            token = authorization
+    else:
+        token = authorization
+
+    # Get user ID from JWT token
+    user_id = get_current_user(token)
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=HTTP_UNAUTHORIZED, detail="You are not logged in!"
+        )
+    return user_id
 
 
 def get_current_active_user(authorization: str, db: Session = Depends(get_db)) -> User:
@@ -23,35 +51,37 @@ def get_current_active_user(authorization: str, db: Session = Depends(get_db)) -
     Raises HTTPException if user is not authenticated or inactive
     """
     try:
-        if not authorization:
-            raise HTTPException(
-                status_code=HTTP_UNAUTHORIZED, detail="Authorization token is missing!"
-            )
-
-        # Handle token extraction
-        if isinstance(authorization, str) and "Bearer" in authorization:
-            try:
-                token = authorization.split("Bearer", 1)[1].strip()
-            except Exception:
-                token = authorization
-        else:
-            token = authorization
+        user_id = _token_user_id(authorization)
 
-        # Get user ID from JWT token
-        user_id = get_current_user(token)
+        # Get user from database
+        user = db.execute(ACTIVE_USER_BY_ID, {"user_id": user_id}).scalars().first()
 
-        if user_id is None:
+        if not user:
             raise HTTPException(
-                status_code=HTTP_UNAUTHORIZED, detail="You are not logged in!"
+                status_code=HTTP_UNAUTHORIZED,
+                detail="Session has ended, please login again!",
             )
 
-        # Get user from database
-        user = (
-            db.query(User)
-            .filter(User.id == user_id, User.deleted == False, User.is_active == True)
-            .first()
+        return user
+
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=HTTP_UNAUTHORIZED, detail="Invalid authorization token"
         )
 
+
+async def get_current_active_user_async(
+    authorization: str, db: Union[AsyncSession, Session] = Depends(get_read_db)
+) -> User:
+    """get_current_active_user for the read endpoints (AsyncSession or Session)"""
+    try:
+        user_id = _token_user_id(authorization)
+
+        result = await resolve(db.execute(ACTIVE_USER_BY_ID, {"user_id": user_id}))
+        user = result.scalars().first()
+
         if not user:
             raise HTTPException(
                 status_code=HTTP_UNAUTHORIZED,
@@ -100,6 +130,22 @@ def require_user_role(authorization: str, db: Session = Depends(get_db)) -> User
     return user
 
 
+async def require_admin_role_async(
+    authorization: str, db: Union[AsyncSession, Session] = Depends(get_read_db)
+) -> User | None:
+    """require_admin_role for the read endpoints (AsyncSession or Session)"""
+    user = await get_current_active_user_async(authorization, db)
+    return user if user.role == UserRole.ADMIN else None
+
+
+async def require_user_role_async(
+    authorization: str, db: Union[AsyncSession, Session] = Depends(get_read_db)
+) -> User | None:
+    """require_user_role for the read endpoints (AsyncSession or Session)"""
+    user = await get_current_active_user_async(authorization, db)
+    return user if user.role == UserRole.USER else None
+
+
 def require_any_role(
     authorization: str,
     allowed_roles: Optional[list[UserRole]] = None,
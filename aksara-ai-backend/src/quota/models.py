@@ -0,0 +1,38 @@
+import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+from src.utils.date import now
+from src.utils.types import TZDateTime, UUIDString
+
+
+class TokenQuota(SQLModel, table=True):
+    """Per-user daily token quota override (falls back to role default)"""
+
+    __tablename__ = "token_quotas"
+
+    user_id: str = Field(foreign_key="user.id", primary_key=True, sa_type=UUIDString)
+    daily_output_tokens: int  # 0 = unlimited
+    created_by: Optional[str] = None
+    created_date: Optional[datetime.datetime] = Field(
+        default_factory=now, sa_type=TZDateTime
+    )
+    updated_by: Optional[str] = None
+    updated_date: Optional[datetime.datetime] = Field(
+        default_factory=now, sa_type=TZDateTime
+    )
+
+
+class TokenUsageDaily(SQLModel, table=True):
+    """Token usage per user per day, flushed from in-process counters"""
+
+    __tablename__ = "token_usage_daily"
+
+    user_id: str = Field(foreign_key="user.id", primary_key=True, sa_type=UUIDString)
+    usage_date: datetime.date = Field(primary_key=True)
+    prompt_tokens: int = Field(default=0)
+    output_tokens: int = Field(default=0)
+    updated_date: Optional[datetime.datetime] = Field(
+        default_factory=now, sa_type=TZDateTime
+    )
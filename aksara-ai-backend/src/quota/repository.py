@@ -0,0 +1,121 @@
+"""
+Quota Repository - Database operations for token quotas and daily usage
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.quota.models import TokenQuota, TokenUsageDaily
+from src.utils.date import now
+
+
+class QuotaRepository:
+    """Repository class for TokenQuota and TokenUsageDaily operations"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # Quota override operations
+    def get_quota(self, user_id: str) -> Optional[TokenQuota]:
+        """Get quota override for a user"""
+        return self.db.query(TokenQuota).filter(TokenQuota.user_id == user_id).first()
+
+    def set_quota(
+        self, user_id: str, daily_output_tokens: int, updated_by: str
+    ) -> TokenQuota:
+        """Create or update quota override for a user"""
+        quota = self.get_quota(user_id)
+        if quota:
+            quota.daily_output_tokens = daily_output_tokens
+            quota.updated_by = updated_by
+            quota.updated_date = now()
+        else:
+            quota = TokenQuota(
+                user_id=user_id,
+                daily_output_tokens=daily_output_tokens,
+                created_by=updated_by,
+                updated_by=updated_by,
+            )
+            self.db.add(quota)
+        return quota
+
+    def delete_quota(self, user_id: str) -> bool:
+        """Remove quota override so the role default applies again"""
+        result = (
+            self.db.query(TokenQuota).filter(TokenQuota.user_id == user_id).delete()
+        )
+        return result > 0
+
+    # Daily usage operations
+    def get_output_tokens(self, user_id: str, usage_date: date) -> int:
+        """Get flushed output tokens for a user on a day"""
+        usage = (
+            self.db.query(TokenUsageDaily.output_tokens)
+            .filter(
+                TokenUsageDaily.user_id == user_id,
+                TokenUsageDaily.usage_date == usage_date,
+            )
+            .scalar()
+        )
+        return usage or 0
+
+    def get_output_tokens_bulk(
+        self, user_ids: List[str], usage_date: date
+    ) -> Dict[str, int]:
+        """Get flushed output tokens for several users on a day"""
+        if not user_ids:
+            return {}
+        rows = (
+            self.db.query(TokenUsageDaily.user_id, TokenUsageDaily.output_tokens)
+            .filter(
+                TokenUsageDaily.user_id.in_(user_ids),
+                TokenUsageDaily.usage_date == usage_date,
+            )
+            .all()
+        )
+        return {row.user_id: row.output_tokens for row in rows}
+
+    def add_usage(
+        self, user_id: str, usage_date: date, prompt_tokens: int, output_tokens: int
+    ):
+        """Atomically add token deltas to a user's daily usage row"""
+        values = {
+            TokenUsageDaily.prompt_tokens: TokenUsageDaily.prompt_tokens
+            + prompt_tokens,
+            TokenUsageDaily.output_tokens: TokenUsageDaily.output_tokens
+            + output_tokens,
+            TokenUsageDaily.updated_date: now(),
+        }
+        query = self.db.query(TokenUsageDaily).filter(
+            TokenUsageDaily.user_id == user_id,
+            TokenUsageDaily.usage_date == usage_date,
+        )
+        if query.update(values, synchronize_session=False) > 0:
+            return
+
+        try:
+            # First flush of the day for this user
+            with self.db.begin_nested():
+                self.db.add(
+                    TokenUsageDaily(
+                        user_id=user_id,
+                        usage_date=usage_date,
+                        prompt_tokens=prompt_tokens,
+                        output_tokens=output_tokens,
+                    )
+                )
+        except IntegrityError:
+            # Another worker inserted the row first
+            query.update(values, synchronize_session=False)
+
+    # Transaction management
+    def commit(self):
+        """Commit the current transaction"""
+        self.db.commit()
+
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.db.rollback()
@@ -0,0 +1,169 @@
+"""
+Quota Tracker - In-process token counters for hot-path quota checks
+Counters are flushed to token_usage_daily periodically and reconciled with
+the totals written by the other workers.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from decouple import config
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from src.config.postgres import SessionLocal
+from src.constants import HTTP_TOO_MANY_REQUESTS
+from src.quota.repository import QuotaRepository
+from src.user.models import User, UserRole
+from src.utils.helper import log
+
+# Default daily output-token quota per role (0 = unlimited)
+ROLE_DAILY_OUTPUT_TOKENS = {
+    UserRole.USER: int(config("QUOTA_DAILY_OUTPUT_TOKENS_USER", default=100000)),
+    UserRole.ADMIN: int(config("QUOTA_DAILY_OUTPUT_TOKENS_ADMIN", default=0)),
+}
+QUOTA_FLUSH_INTERVAL_SECONDS = int(config("QUOTA_FLUSH_INTERVAL_SECONDS", default=15))
+QUOTA_LIMIT_CACHE_SECONDS = int(config("QUOTA_LIMIT_CACHE_SECONDS", default=60))
+
+UsageKey = Tuple[str, date]
+
+
+def usage_day() -> date:
+    """Quota day boundary follows Asia/Jakarta"""
+    return datetime.now(pytz.timezone("Asia/Jakarta")).date()
+
+
+class QuotaTracker:
+    """Per-worker token counters with periodic flush to Postgres"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Output tokens already in the database (all workers), as of last sync
+        self._totals: Dict[UsageKey, int] = {}
+        # [prompt_tokens, output_tokens] recorded here and not flushed yet
+        self._pending: Dict[UsageKey, List[int]] = {}
+        # Deltas currently being written by flush()
+        self._inflight: Dict[UsageKey, List[int]] = {}
+        # user_id -> (override or None, fetched_at)
+        self._overrides: Dict[str, Tuple[Optional[int], float]] = {}
+
+    # ============ Hot path ============
+
+    def get_limit(self, db: Session, user: User) -> int:
+        """Daily output-token limit for a user (0 = unlimited)"""
+        cached = self._overrides.get(user.id)
+        if cached is None or time.monotonic() - cached[1] > QUOTA_LIMIT_CACHE_SECONDS:
+            quota = QuotaRepository(db).get_quota(user.id)
+            override = quota.daily_output_tokens if quota else None
+            cached = (override, time.monotonic())
+            self._overrides[user.id] = cached
+
+        if cached[0] is not None:
+            return cached[0]
+        return ROLE_DAILY_OUTPUT_TOKENS.get(user.role, 0)
+
+    def get_used(self, db: Session, user_id: str) -> int:
+        """Output tokens used today: flushed total plus local unflushed deltas"""
+        key = (user_id, usage_day())
+        with self._lock:
+            total = self._totals.get(key)
+        if total is None:
+            total = QuotaRepository(db).get_output_tokens(user_id, key[1])
+            with self._lock:
+                self._totals.setdefault(key, total)
+
+        with self._lock:
+            return (
+                total
+                + self._pending.get(key, [0, 0])[1]
+                + self._inflight.get(key, [0, 0])[1]
+            )
+
+    def check(self, db: Session, user: User) -> Tuple[int, int]:
+        """Reject with 429 when the user has exhausted today's quota"""
+        limit = self.get_limit(db, user)
+        if not limit:
+            return 0, 0
+
+        used = self.get_used(db, user.id)
+        if used >= limit:
+            raise HTTPException(
+                status_code=HTTP_TOO_MANY_REQUESTS,
+                detail="Daily token quota exceeded, please try again tomorrow.",
+            )
+        return used, limit
+
+    def record(self, user_id: str, prompt_tokens: int, output_tokens: int):
+        """Record usage of a finished turn"""
+        key = (user_id, usage_day())
+        with self._lock:
+            delta = self._pending.setdefault(key, [0, 0])
+            delta[0] += prompt_tokens or 0
+            delta[1] += output_tokens or 0
+
+    def invalidate_limit(self, user_id: str):
+        """Drop cached override after an admin change"""
+        self._overrides.pop(user_id, None)
+
+    # ============ Flush ============
+
+    def flush(self):
+        """Write pending deltas to Postgres and refresh totals from all workers"""
+        with self._lock:
+            self._inflight, self._pending = self._pending, {}
+            inflight = self._inflight
+
+        today = usage_day()
+        db = SessionLocal()
+        repo = QuotaRepository(db)
+        try:
+            for (user_id, day), (prompt_tokens, output_tokens) in inflight.items():
+                repo.add_usage(user_id, day, prompt_tokens, output_tokens)
+            repo.commit()
+        except Exception as e:
+            repo.rollback()
+            db.close()
+            with self._lock:
+                # Keep deltas for the next attempt
+                for key, (prompt_tokens, output_tokens) in inflight.items():
+                    delta = self._pending.setdefault(key, [0, 0])
+                    delta[0] += prompt_tokens
+                    delta[1] += output_tokens
+                self._inflight = {}
+            log(f"Quota flush failed: {e}", log_level="error")
+            return
+
+        try:
+            # Reconcile: totals now include what every worker flushed
+            with self._lock:
+                user_ids = [user_id for user_id, day in self._totals if day == today]
+            totals = repo.get_output_tokens_bulk(user_ids, today)
+            with self._lock:
+                self._totals = {
+                    (user_id, today): totals.get(user_id, 0) for user_id in user_ids
+                }
+                self._inflight = {}
+        except Exception as e:
+            with self._lock:
+                # Deltas are in the database already, fold them into totals
+                for key, (_, output_tokens) in inflight.items():
+                    if key in self._totals:
+                        self._totals[key] += output_tokens
+                self._inflight = {}
+            log(f"Quota reconcile failed: {e}", log_level="error")
+        finally:
+            repo.rollback()
+            db.close()
+
+    async def run_flush_loop(self):
+        """Background task flushing counters every QUOTA_FLUSH_INTERVAL_SECONDS"""
+        while True:
+            await asyncio.sleep(QUOTA_FLUSH_INTERVAL_SECONDS)
+            await asyncio.to_thread(self.flush)
+
+
+quota_tracker = QuotaTracker()
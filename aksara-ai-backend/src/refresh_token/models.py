@@ -1,17 +1,17 @@
 import datetime
-import uuid
 from typing import Optional
 
 from sqlmodel import Field, SQLModel
 
+from src.utils.ids import new_id
+from src.utils.types import UUIDString
+
 
 class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_token"
-    id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()), primary_key=True, index=True
-    )
+    id: str = Field(default_factory=new_id, primary_key=True, index=True)
     token: str = Field(unique=True, index=True)
-    user_id: str = Field(foreign_key="user.id", index=True)
+    user_id: str = Field(foreign_key="user.id", index=True, sa_type=UUIDString)
     expires_at: datetime.datetime
     is_revoked: bool = Field(default=False)
     created_date: Optional[datetime.datetime] = None
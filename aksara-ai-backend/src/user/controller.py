@@ -1,9 +1,12 @@
+from typing import Union
+
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from src.auth.handler import signJWT
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
 from src.constants import (
     HTTP_ACCEPTED,
     HTTP_BAD_REQUEST,
@@ -17,9 +20,10 @@ from src.middleware.middleware import (
     get_password_hash,
     get_user_id_from_token,
     require_user_role,
+    require_user_role_async,
     verify_password,
 )
-from src.user.repository import UserRepository
+from src.user.repository import AsyncUserRepository, UserRepository
 from src.user.schemas import (
     PasswordUpdate,
     ProfileUpdate,
@@ -395,24 +399,23 @@ class UserController:
     @staticmethod
     async def profile(
         authorization: str,
-        db: Session = Depends(get_db),
+        db: Union[AsyncSession, Session] = Depends(get_read_db),
     ) -> JSONResponse:
+        # Initialize repository
+        repo = AsyncUserRepository(db)
         try:
-            user_role = require_user_role(authorization, db)
+            user_role = await require_user_role_async(authorization, db)
             if not user_role:
                 raise HTTPException(
                     status_code=HTTP_FORBIDDEN,
                     detail="Access denied! User role required.",
                 )
 
-            # Initialize repository
-            repo = UserRepository(db)
-
             # Get user ID from token (authentication already handled by middleware)
             user_id = get_user_id_from_token(authorization)
 
             # Get user with profile from repository
-            user_with_profile = repo.get_user_with_profile(user_id)
+            user_with_profile = await repo.get_user_with_profile(user_id)
             if not user_with_profile:
                 raise HTTPException(
                     status_code=HTTP_NOT_FOUND,
@@ -423,10 +426,10 @@ class UserController:
             transformer = mapUserProfileData(user_with_profile)
             return ok(transformer, "Successfully Get user Profile!", HTTP_OK)
         except HTTPException as e:
-            repo.rollback()
+            await repo.rollback()
             return formatError(e.detail, e.status_code)
         except Exception as e:
-            repo.rollback()
+            await repo.rollback()
             return formatError(str(e), HTTP_BAD_REQUEST)
 
     @staticmethod
@@ -1,41 +1,49 @@
 import datetime
-import uuid
 from enum import Enum
 from typing import Optional
 
 from sqlmodel import Field, SQLModel
 
+from src.utils.ids import new_id
+from src.utils.types import SmallEnum, TZDateTime, UUIDString
+
 
 class UserRole(str, Enum):
     ADMIN = "ADMIN"
     USER = "USER"
 
 
+# Compact smallint codes for user.role
+ROLE_CODES = {UserRole.ADMIN.value: 1, UserRole.USER.value: 2}
+
+
 class User(SQLModel, table=True):
     id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()), primary_key=True, index=True
+        default_factory=new_id, primary_key=True, index=True, sa_type=UUIDString
     )
     username: str = Field(unique=True, index=True)
     password: str
     is_active: bool
-    role: UserRole = Field(default=UserRole.USER, index=True)
+    role: UserRole = Field(
+        default=UserRole.USER, index=True, sa_type=SmallEnum(ROLE_CODES, UserRole)
+    )
     deleted: bool = Field(default=False)
     created_by: str
-    created_date: Optional[datetime.datetime] = None
+    created_date: Optional[datetime.datetime] = Field(default=None, sa_type=TZDateTime)
     updated_by: str
-    updated_date: Optional[datetime.datetime] = None
+    updated_date: Optional[datetime.datetime] = Field(default=None, sa_type=TZDateTime)
 
 
 class UserProfile(SQLModel, table=True):
     __tablename__ = "user_profile"
     id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()), primary_key=True, index=True
+        default_factory=new_id, primary_key=True, index=True, sa_type=UUIDString
     )
-    id_user: str = Field(foreign_key="user.id", unique=True)
+    id_user: str = Field(foreign_key="user.id", unique=True, sa_type=UUIDString)
     nama_lengkap: str
     email: str
     deleted: bool = Field(default=False)
     created_by: str
-    created_date: Optional[datetime.datetime] = None
+    created_date: Optional[datetime.datetime] = Field(default=None, sa_type=TZDateTime)
     updated_by: str
-    updated_date: Optional[datetime.datetime] = None
+    updated_date: Optional[datetime.datetime] = Field(default=None, sa_type=TZDateTime)
@@ -1,11 +1,40 @@
-import uuid
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-from sqlalchemy import Row
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.constants import CURRENT_DATETIME
 from src.user.models import User, UserProfile
+from src.utils.helper import resolve
+from src.utils.ids import new_id
+
+# Hot read statements built once at import: SQLAlchemy keeps their cache key
+# and compiled SQL, a call only binds :user_id instead of rebuilding the tree
+ACTIVE_USER_BY_ID = (
+    select(User)
+    .where(
+        User.id == bindparam("user_id"),
+        User.deleted == False,
+        User.is_active == True,
+    )
+    .limit(1)
+)
+PROFILE_BY_USER_ID = (
+    select(UserProfile)
+    .where(UserProfile.id_user == bindparam("user_id"), UserProfile.deleted == False)
+    .limit(1)
+)
+USER_WITH_PROFILE = (
+    select(User, UserProfile)
+    .join(UserProfile, UserProfile.id_user == User.id)
+    .where(
+        User.deleted == False,
+        UserProfile.deleted == False,
+        User.id == bindparam("user_id"),
+    )
+    .limit(1)
+)
 
 
 class UserRepository:
@@ -21,7 +50,7 @@ class UserRepository:
         """Create a new user"""
         from src.user.models import UserRole
 
-        user_id = uuid.uuid4().hex
+        user_id = new_id()
         user = User(
             id=user_id,
             username=username,
@@ -38,9 +67,7 @@ class UserRepository:
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID (active, not deleted)"""
         return (
-            self.db.query(User)
-            .filter(User.id == user_id, User.is_active, User.deleted == False)
-            .first()
+            self.db.execute(ACTIVE_USER_BY_ID, {"user_id": user_id}).scalars().first()
         )
 
     def get_user_by_username(self, username: str) -> Optional[User]:
@@ -82,7 +109,7 @@ class UserRepository:
         self, user_id: str, nama_lengkap: str, email: str, created_by: str
     ) -> UserProfile:
         """Create a new user profile"""
-        profile_id = uuid.uuid4().hex
+        profile_id = new_id()
         profile = UserProfile(
             id=profile_id,
             id_user=user_id,
@@ -212,3 +239,34 @@ class UserRepository:
     def rollback(self):
         """Rollback the current transaction"""
         self.db.rollback()
+
+
+class AsyncUserRepository:
+    """Async variant of UserRepository for the read endpoints"""
+
+    def __init__(self, db: Union[AsyncSession, Session]):
+        self.db = db
+
+    async def _execute(self, statement, params=None):
+        return await resolve(self.db.execute(statement, params))
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID (active, not deleted)"""
+        result = await self._execute(ACTIVE_USER_BY_ID, {"user_id": user_id})
+        return result.scalars().first()
+
+    async def get_profile_by_user_id(self, user_id: str) -> Optional[UserProfile]:
+        """Get user profile by user ID (not deleted)"""
+        result = await self._execute(PROFILE_BY_USER_ID, {"user_id": user_id})
+        return result.scalars().first()
+
+    async def get_user_with_profile(
+        self, user_id: str
+    ) -> Optional[Row[Tuple[User, UserProfile]]]:
+        """Get user with profile by user ID (both not deleted)"""
+        result = await self._execute(USER_WITH_PROFILE, {"user_id": user_id})
+        return result.first()
+
+    async def rollback(self):
+        """Rollback the current transaction"""
+        await resolve(self.db.rollback())
@@ -1,9 +1,12 @@
+from typing import Union
+
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.auth.auth import JWTBearer
 from src.common.response_examples import ResponseExamples
-from src.config.postgres import get_db
+from src.config.postgres import get_db, get_read_db
 from src.user.controller import UserController
 from src.user.schemas import (
     PasswordUpdate,
@@ -46,7 +49,7 @@ async def login_user(
 )
 async def get_user_profile(
     authorization: str = Depends(JWTBearer()),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_read_db),
 ):
     # Role validation handled by controller
     return await UserController.profile(authorization, db)
@@ -22,4 +22,5 @@ ALLOWED_HEADERS = [
     "ip_address",
     "Ip-Address",
     "ip-address",
+    "X-Last-Write",
 ]
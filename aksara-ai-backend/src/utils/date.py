@@ -1,12 +1,32 @@
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Tuple
 
 import pytz
 
+# Zona waktu aplikasi (naive timestamps lama disimpan sebagai waktu Jakarta)
+APP_TIMEZONE = pytz.timezone("Asia/Jakarta")
+
+
+def now() -> datetime:
+    """Current time as an aware Asia/Jakarta datetime"""
+    return datetime.now(APP_TIMEZONE)
+
 
 def serialize_date(d):
     return d.isoformat() if isinstance(d, date) else None
 
 
+def date_range_bounds(
+    start_date: Optional[date], end_date: Optional[date], default_days: int = 30
+) -> Tuple[datetime, datetime]:
+    """Turn inclusive start/end dates into a half-open [start, end) datetime range"""
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=default_days - 1)
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date + timedelta(days=1), time.min)
+    return start, end
+
+
 def format_date(date_str):
     dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
     jakarta_tz = pytz.timezone("Asia/Jakarta")
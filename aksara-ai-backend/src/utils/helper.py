@@ -1,3 +1,4 @@
+import inspect
 import logging
 import re
 
@@ -53,6 +54,11 @@ def formatError(message, status_code):
     )
 
 
+async def resolve(value):
+    """Await results of an AsyncSession call, pass Session results through"""
+    return await value if inspect.isawaitable(value) else value
+
+
 # function logging errors, info, debug
 def log(message, log_level="info"):
     log_level = log_level.lower()
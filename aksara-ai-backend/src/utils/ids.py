@@ -0,0 +1,47 @@
+"""
+Time-ordered identifiers (UUIDv7, RFC 9562)
+New rows land at the right edge of the primary key index, and the string
+form sorts by creation time so ids can also break keyset pagination ties.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7
+
+    Layout: 48-bit unix milliseconds, version, 12-bit counter, variant and
+    62 random bits. The counter keeps ids from one process strictly
+    increasing within the same millisecond (and if the clock steps back).
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Random start, top bit left clear as headroom for increments
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Counter exhausted, borrow the next millisecond
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    value = (timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """UUIDv7 as a hyphenated string (primary key format)"""
+    return str(uuid7())
@@ -0,0 +1,80 @@
+"""
+Metrics - In-process counters, histograms and collectors
+Exposed per worker on GET /api/v1/health/metrics
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Sequence
+
+# Default histogram buckets (upper bounds, milliseconds)
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def snapshot(self) -> dict:
+        """Cumulative counts per upper bound, like Prometheus le buckets"""
+        cumulative, total = {}, 0
+        for bound, count in zip(self.buckets + ("inf",), self.counts):
+            total += count
+            cumulative[f"le_{bound}"] = total
+        return {"count": self.count, "sum": round(self.sum, 3), "buckets": cumulative}
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms plus on-demand collectors for gauges"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._collectors: Dict[str, Callable[[], dict]] = {}
+
+    def inc(self, name: str, value: float = 1):
+        """Increment a counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(
+        self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS_MS
+    ):
+        """Record a value in a histogram (buckets fixed on first use)"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(buckets)
+            histogram.counts[bisect_left(histogram.buckets, value)] += 1
+            histogram.count += 1
+            histogram.sum += value
+
+    def get(self, name: str) -> float:
+        """Current value of a counter"""
+        return self._counters.get(name, 0)
+
+    def register_collector(self, name: str, collector: Callable[[], dict]):
+        """Register a callable returning a dict of gauges, evaluated on snapshot"""
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict:
+        """All counters and collector values"""
+        with self._lock:
+            data: dict = {"counters": dict(sorted(self._counters.items()))}
+            if self._histograms:
+                data["histograms"] = {
+                    name: histogram.snapshot()
+                    for name, histogram in sorted(self._histograms.items())
+                }
+        for name, collector in self._collectors.items():
+            data[name] = collector()
+        return data
+
+
+metrics = MetricsRegistry()
@@ -1,6 +1,14 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
 from pydantic import BaseModel as BaseModelV2
 from pydantic import conint
 
+from src.constants import HTTP_BAD_REQUEST
+
 
 class PageParams(BaseModelV2):
     """Request query params for paginated API."""
@@ -20,3 +28,32 @@ def MapPagination(data, totalItems, pageParams):
             // pageParams.size,  # Calculate total pages
         },
     }
+
+
+class CursorParams(BaseModelV2):
+    """Request query params for keyset (cursor) paginated API."""
+
+    limit: conint(ge=1, le=100) = 20
+    before: Optional[str] = None
+    after: Optional[str] = None
+
+
+Cursor = Tuple[datetime, str]
+
+
+def encode_cursor(timestamp: datetime, id: str) -> str:
+    """Opaque cursor for a (timestamp, id) keyset position"""
+    raw = f"{timestamp.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Decode a cursor from encode_cursor, 400 when it is malformed"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=HTTP_BAD_REQUEST, detail="Invalid cursor.")
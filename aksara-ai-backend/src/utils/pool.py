@@ -0,0 +1,70 @@
+"""
+Pool Metrics - Instrumented connection pools
+Checkout wait times go to a histogram, so a saturated pool shows up as a
+growing tail instead of only as 30-second stalls; timeouts, new connections
+and invalidations are counted.
+"""
+
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.utils.metrics import metrics
+
+
+class _TimedCheckout:
+    """Times QueuePool._do_get: waiting for a free slot plus any new connect"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.inc("db_pool.timeouts")
+            raise
+        finally:
+            metrics.observe(
+                "db_pool.checkout_wait_ms", (time.perf_counter() - started) * 1000
+            )
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def _on_connect(dbapi_connection, connection_record):
+    metrics.inc("db_pool.connects")
+
+
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    metrics.inc("db_pool.invalidations")
+
+
+def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+    metrics.inc("db_pool.soft_invalidations")
+
+
+def instrument_pool(engine: Engine):
+    """Count connects and invalidations (pass AsyncEngine.sync_engine for async)"""
+    event.listen(engine, "connect", _on_connect)
+    event.listen(engine, "invalidate", _on_invalidate)
+    event.listen(engine, "soft_invalidate", _on_soft_invalidate)
+
+
+def pool_gauges(engine: Engine) -> dict:
+    """Current size, checked out and overflow in use of a queue pool"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow_in_use": max(pool.overflow(), 0),
+        "idle": pool.checkedin(),
+    }
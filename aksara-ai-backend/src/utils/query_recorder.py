@@ -0,0 +1,149 @@
+"""
+Query Recorder - Records SQL statements for tests and ad-hoc checks
+Catches N+1 patterns (the same statement shape repeated per row) and
+endpoints going over their query budget, with the call sites responsible.
+
+    with QueryRecorder(max_queries=3, max_repeats=2):
+        client.get("/api/v1/admin/users", headers=admin_headers)
+"""
+
+import re
+import threading
+import traceback
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists: "(?, ?, ?)" / "(%(id_1_1)s, ...)" / "($1, $2)"
+_PARAM = r"(?:\?|%\(\w+\)s|\$\d+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})*\s*\)")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|\$\d+|:\w+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a recorded block breaks its query budget"""
+
+
+class RecordedQuery:
+    __slots__ = ("statement", "shape", "call_site")
+
+    def __init__(self, statement: str, shape: str, call_site: str):
+        self.statement = statement
+        self.shape = shape
+        self.call_site = call_site
+
+
+def statement_shape(statement: str) -> str:
+    """Statement with whitespace, parameter names and IN lists normalized"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PARAM_LIST.sub("(?)", shape)
+    return _NAMED_PARAM.sub("?", shape)
+
+
+def _call_site(depth: int = 2) -> str:
+    """Innermost project frames outside this module (repository <- caller)"""
+    sites = []
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename)
+        if path == Path(__file__) or PROJECT_ROOT not in path.parents:
+            continue
+        if "site-packages" in path.parts:
+            continue
+        location = path.relative_to(PROJECT_ROOT)
+        sites.append(f"{location}:{frame.lineno} in {frame.name}")
+        if len(sites) == depth:
+            break
+    return " <- ".join(sites) or "<unknown>"
+
+
+class QueryRecorder:
+    """
+    Context manager recording statements on the given engines (default: the
+    app engines). With max_queries / max_repeats set, leaving the block
+    checks the budget and raises QueryBudgetExceeded with a report.
+    """
+
+    def __init__(
+        self,
+        *engines,
+        max_queries: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+    ):
+        self.engines = engines
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.queries: List[RecordedQuery] = []
+        self._lock = threading.Lock()
+        self._targets: list = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        query = RecordedQuery(statement, statement_shape(statement), _call_site())
+        with self._lock:
+            self.queries.append(query)
+
+    def __enter__(self) -> "QueryRecorder":
+        engines = self.engines
+        if not engines:
+            from src.config import postgres
+
+            engines = [postgres.engine, *postgres.replica_engines]
+            if postgres.DATABASE_ASYNC:
+                engines += [postgres.async_engine, *postgres.async_replica_engines]
+        # AsyncEngine events are registered on its sync engine
+        self._targets = [getattr(engine, "sync_engine", engine) for engine in engines]
+        for target in self._targets:
+            event.listen(target, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for target in self._targets:
+            event.remove(target, "before_cursor_execute", self._record)
+        if exc_type is None:
+            self.assert_budget(self.max_queries, self.max_repeats)
+        return False
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int, Dict[str, int]]]:
+        """(shape, count, call sites) of shapes issued more than `threshold` times"""
+        by_shape: Dict[str, Counter] = {}
+        for query in self.queries:
+            by_shape.setdefault(query.shape, Counter())[query.call_site] += 1
+        return sorted(
+            (
+                (shape, sum(sites.values()), dict(sites))
+                for shape, sites in by_shape.items()
+                if sum(sites.values()) > threshold
+            ),
+            key=lambda item: -item[1],
+        )
+
+    def report(self, max_repeats: Optional[int] = None) -> str:
+        """Readable summary: totals, then repeated shapes with their call sites"""
+        lines = [f"{self.count} queries"]
+        for shape, count, sites in self.repeated(max_repeats or 1):
+            lines.append(f"  {count}x {shape[:200]}")
+            for site, site_count in sites.items():
+                lines.append(f"      {site_count}x at {site}")
+        return "\n".join(lines)
+
+    def assert_budget(
+        self, max_queries: Optional[int] = None, max_repeats: Optional[int] = None
+    ):
+        """Raise QueryBudgetExceeded when over the total or repeat budget"""
+        problems = []
+        if max_queries is not None and self.count > max_queries:
+            problems.append(f"{self.count} queries (budget {max_queries})")
+        if max_repeats is not None and self.repeated(max_repeats):
+            problems.append(f"statement repeated more than {max_repeats} times")
+        if problems:
+            raise QueryBudgetExceeded(
+                "; ".join(problems) + "\n" + self.report(max_repeats)
+            )
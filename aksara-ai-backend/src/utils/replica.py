@@ -0,0 +1,169 @@
+"""
+Read Replicas - Routing of read-only sessions to replica databases
+Plain SELECTs of a read session go to a replica; any write, locking read or
+raw SQL goes to the primary, and the rest of that session stays there.
+Users who wrote recently read from the primary (read-your-writes): the
+write time goes back to the client in X-Last-Write, which it echoes on the
+next requests so any worker can honour it.
+"""
+
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.auth.handler import get_current_user
+from src.utils.metrics import metrics
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Response header with the epoch time of the request's write, sent back by
+# the client on later requests
+LAST_WRITE_HEADER = "X-Last-Write"
+
+# Seconds behind the primary, 0 when all received WAL is replayed
+_REPLICA_LAG = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class RoutingSession(Session):
+    """Session bound to the primary that reads from a replica when allowed"""
+
+    def __init__(
+        self, *args, replicas: Sequence[Engine] = (), use_replica: bool = False, **kw
+    ):
+        super().__init__(*args, **kw)
+        # One replica per session so its reads see a single snapshot source
+        self.replica = random.choice(replicas) if replicas and use_replica else None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.replica is not None:
+            if (
+                isinstance(clause, Select)
+                and clause._for_update_arg is None
+                and not self._flushing
+            ):
+                return self.replica
+            # First write: stay on the primary for the rest of the session
+            self.replica = None
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+class RequestWrite:
+    __slots__ = ("at",)
+
+    def __init__(self):
+        self.at: Optional[float] = None
+
+
+_request_write: ContextVar[Optional[RequestWrite]] = ContextVar(
+    "replica_request_write", default=None
+)
+
+
+def start_write_tracking():
+    """Begin tracking writes of the current request, returns a token"""
+    return _request_write.set(RequestWrite())
+
+
+def finish_write_tracking(token) -> Optional[str]:
+    """Stop tracking; X-Last-Write value when the request wrote"""
+    write = _request_write.get()
+    _request_write.reset(token)
+    return None if write.at is None else f"{write.at:.3f}"
+
+
+class RecentWriters:
+    """
+    Users who wrote within the last `window` seconds. The per-user map only
+    covers this worker (and WebSocket turns, which have no response headers);
+    other workers rely on the X-Last-Write header the client sends back.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._lock = threading.Lock()
+        self._until: Dict[str, float] = {}
+
+    def mark(self, user_id: Optional[str]):
+        if self.window <= 0:
+            return
+        write = _request_write.get()
+        if write is not None:
+            write.at = time.time()
+        if not user_id:
+            return
+        current = time.monotonic()
+        with self._lock:
+            self._until[user_id] = current + self.window
+            if len(self._until) > 10_000:
+                self._until = {
+                    key: until for key, until in self._until.items() if until > current
+                }
+
+    def is_recent(self, user_id: Optional[str]) -> bool:
+        if not user_id:
+            return False
+        return self._until.get(user_id, 0) > time.monotonic()
+
+    def is_recent_header(self, last_write: Optional[str]) -> bool:
+        """Whether an X-Last-Write value falls within the window"""
+        try:
+            written = float(last_write)
+        except (TypeError, ValueError):
+            return False
+        current = time.time()
+        # Bounded both ways: a future value (skew, forged) can't pin reads
+        return current - self.window < written <= current + self.window
+
+
+def request_user_id(authorization: Optional[str]) -> Optional[str]:
+    """User ID of a bearer token without raising (routing only, not auth)"""
+    if not authorization:
+        return None
+    token = authorization.split("Bearer", 1)[-1].strip()
+    return get_current_user(token)
+
+
+def use_replica_for(
+    writers: RecentWriters, user_id: Optional[str], last_write: Optional[str] = None
+) -> bool:
+    """Whether a read request of this user may go to a replica"""
+    if writers.is_recent(user_id) or writers.is_recent_header(last_write):
+        metrics.inc("db_replica.sticky_reads")
+        return False
+    metrics.inc("db_replica.replica_reads")
+    return True
+
+
+def replica_lag(replica: Engine) -> Optional[float]:
+    """Replication lag in seconds (Postgres), None when not measurable"""
+    if replica.dialect.name != "postgresql":
+        return None
+    with replica.connect() as conn:
+        lag = conn.execute(_REPLICA_LAG).scalar()
+    return None if lag is None else round(float(lag), 3)
+
+
+def replica_stats(replicas: Sequence[Engine]) -> dict:
+    """Gauges for the metrics endpoint, one entry per replica"""
+    stats = {}
+    for number, replica in enumerate(replicas, start=1):
+        try:
+            stats[f"replica_{number}"] = {"lag_seconds": replica_lag(replica)}
+        except Exception as e:
+            stats[f"replica_{number}"] = {"error": str(e)}
+    return stats
@@ -0,0 +1,86 @@
+"""
+Lazy Session - Request-scoped database session created on first use
+A request answered without the database (auth or quota rejection, cache)
+never takes a pooled connection, and a handler can hand its connection back
+before slow non-database work such as the upstream model call.
+"""
+
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.utils.metrics import metrics
+
+
+class LazySession:
+    """
+    Proxy of a Session opened on the first attribute access.
+    Repositories and helpers take it wherever they take a Session.
+    """
+
+    __slots__ = ("_factory", "_session", "_opened_at", "_used")
+
+    def __init__(self, factory: Callable[[], Session]):
+        self._factory = factory
+        self._session: Optional[Session] = None
+        self._opened_at = 0.0
+        self._used = False
+
+    def _open(self) -> Session:
+        if self._session is None:
+            self._session = self._factory()
+            self._opened_at = time.perf_counter()
+            self._used = True
+        return self._session
+
+    def __getattr__(self, name):
+        return getattr(self._open(), name)
+
+    def _close_session(self):
+        if self._session is None:
+            return
+        try:
+            self._session.close()
+        finally:
+            self._session = None
+            metrics.inc(
+                "db_session.held_seconds", time.perf_counter() - self._opened_at
+            )
+
+    def commit(self):
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+        # Nothing to roll back once released, don't open a session for it
+        if self._session is not None:
+            self._session.rollback()
+
+    def release(self):
+        """
+        Give the connection back to the pool now (uncommitted work is rolled
+        back, loaded objects stay readable); the next use opens a new session
+        """
+        if self._session is not None:
+            self._close_session()
+            metrics.inc("db_session.released_early")
+
+    def close(self):
+        """End of request"""
+        self._close_session()
+        metrics.inc("db_session.requests")
+        if not self._used:
+            metrics.inc("db_session.untouched")
+
+
+def session_stats() -> dict:
+    """Gauges for the metrics endpoint"""
+    requests = metrics.get("db_session.requests")
+    untouched = metrics.get("db_session.untouched")
+    return {
+        "untouched_ratio": round(untouched / requests, 4) if requests else None,
+    }
+
+
+metrics.register_collector("db_session", session_stats)
@@ -0,0 +1,138 @@
+"""
+SQL Stats - Statement instrumentation on SQLAlchemy engine events
+Replaces engine echo: slow statements are always logged, others only when
+sampled, and every HTTP request gets its query count, rows and time.
+"""
+
+import random
+import re
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from decouple import config
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.utils.helper import log
+from src.utils.metrics import metrics
+
+# Statements at least this slow are logged as warnings (0 = off)
+SQL_SLOW_QUERY_MS: float = config("SQL_SLOW_QUERY_MS", default=200.0, cast=float)
+# Fraction of the other statements logged (1 = everything, like echo)
+SQL_LOG_SAMPLE_RATE: float = config("SQL_LOG_SAMPLE_RATE", default=0.0, cast=float)
+# Requests running more statements than this are logged (0 = off)
+SQL_QUERY_BUDGET: int = config("SQL_QUERY_BUDGET", default=30, cast=int)
+
+MAX_LOGGED_STATEMENT = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RequestQueryStats:
+    __slots__ = ("label", "queries", "rows", "seconds")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "sql_request_stats", default=None
+)
+
+
+def _shorten(statement: str) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > MAX_LOGGED_STATEMENT:
+        return statement[:MAX_LOGGED_STATEMENT] + " …"
+    return statement
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # On the execution context, not the connection: a statement that raises
+    # never reaches after_cursor_execute and its start time goes with it
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    if started is None:
+        return  # dialect setup statements run without an execution context
+    elapsed = time.perf_counter() - started
+    # Driver-reported rows (affected rows; -1 for SELECTs on some drivers)
+    rows = max(cursor.rowcount or 0, 0)
+
+    metrics.inc("sql.queries")
+    metrics.inc("sql.rows", rows)
+    metrics.inc("sql.seconds", elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.rows += rows
+        stats.seconds += elapsed
+
+    elapsed_ms = elapsed * 1000
+    if SQL_SLOW_QUERY_MS and elapsed_ms >= SQL_SLOW_QUERY_MS:
+        metrics.inc("sql.slow_queries")
+        where = f" [{stats.label}]" if stats else ""
+        log(
+            f"Slow query {elapsed_ms:.1f} ms{where}: {_shorten(statement)}",
+            log_level="warning",
+        )
+    elif SQL_LOG_SAMPLE_RATE and random.random() < SQL_LOG_SAMPLE_RATE:
+        log(f"SQL {elapsed_ms:.1f} ms, {rows} rows: {_shorten(statement)}")
+
+
+def instrument_engine(engine: Engine):
+    """Attach the statement hooks (pass AsyncEngine.sync_engine for async)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_request(label: str):
+    """Begin collecting for the current request, returns a token for finish"""
+    return _request_stats.set(RequestQueryStats(label))
+
+
+def finish_request(token) -> RequestQueryStats:
+    """Stop collecting, record the request and log it when over budget"""
+    stats = _request_stats.get()
+    _request_stats.reset(token)
+
+    metrics.inc("sql.requests")
+    metrics.inc("sql.request_queries", stats.queries)
+    if SQL_QUERY_BUDGET and stats.queries > SQL_QUERY_BUDGET:
+        metrics.inc("sql.requests_over_budget")
+        log(
+            f"Query budget exceeded [{stats.label}]: {stats.queries} queries, "
+            f"{stats.rows} rows, {stats.seconds * 1000:.1f} ms",
+            log_level="warning",
+        )
+    elif stats.queries:
+        log(
+            f"SQL [{stats.label}]: {stats.queries} queries, {stats.rows} rows, "
+            f"{stats.seconds * 1000:.1f} ms",
+            log_level="debug",
+        )
+    return stats
+
+
+def sql_stats() -> dict:
+    """Gauges for the metrics endpoint"""
+    requests = metrics.get("sql.requests")
+    return {
+        "avg_queries_per_request": (
+            round(metrics.get("sql.request_queries") / requests, 2)
+            if requests
+            else None
+        ),
+        "slow_query_ms": SQL_SLOW_QUERY_MS,
+        "query_budget": SQL_QUERY_BUDGET,
+    }
+
+
+metrics.register_collector("sql", sql_stats)
@@ -0,0 +1,115 @@
+"""
+Column Types - Compact native storage behind the values the app already uses
+IDs stay str, enums stay str/Enum and timestamps are aware datetimes in Python,
+while Postgres stores uuid, smallint and timestamptz.
+"""
+
+import uuid
+from enum import Enum
+from typing import Dict, Optional, Type
+
+from sqlalchemy import Date, DateTime, SmallInteger, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+from src.utils.date import APP_TIMEZONE
+
+
+class UUIDString(TypeDecorator):
+    """Native uuid on Postgres (string elsewhere), exposed as str"""
+
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            # Not a uuid, so it cannot match any row (avoids a cast error)
+            return None
+
+
+class SmallEnum(TypeDecorator):
+    """Fixed set of string values stored as smallint codes"""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: Dict[str, int], enum_class: Optional[Type[Enum]] = None):
+        super().__init__()
+        # Tuple keeps the type hashable for the statement cache
+        self.codes = tuple(codes.items())
+        self.enum_class = enum_class
+        self._to_code = dict(codes)
+        self._to_value = {code: value for value, code in codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        value = getattr(value, "value", value)
+        if value not in self._to_code:
+            raise ValueError(f"Unknown value {value!r}")
+        return self._to_code[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        value = self._to_value.get(value, value)
+        return self.enum_class(value) if self.enum_class else value
+
+
+class TZDateTime(TypeDecorator):
+    """
+    timestamptz on Postgres; naive values are taken as Asia/Jakarta and
+    results are always aware (SQLite keeps Jakarta wall time)
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = APP_TIMEZONE.localize(value)
+        if dialect.name != "postgresql":
+            return value.astimezone(APP_TIMEZONE).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return APP_TIMEZONE.localize(value)
+        return value.astimezone(APP_TIMEZONE)
+
+
+class local_date(FunctionElement):
+    """
+    Calendar date of a TZDateTime column in the app timezone, regardless of
+    the connection's TimeZone setting (none is set behind PgBouncer)
+    """
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(local_date)
+def _local_date(element, compiler, **kw):
+    # SQLite stores Jakarta wall time already
+    return f"date({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(local_date, "postgresql")
+def _local_date_postgresql(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"date(timezone('{APP_TIMEZONE.zone}', {column}))"
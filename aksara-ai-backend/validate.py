@@ -3,6 +3,7 @@
 Validation script untuk memastikan migration berjalan dengan benar
 """
 import sys
+import uuid
 from pathlib import Path
 
 # Tambahkan root project ke sys.path
@@ -152,6 +153,64 @@ def check_indexes():
         return False
 
 
+def check_query_plans():
+    """Cek apakah query chat yang sering dipakai memakai index scan"""
+    # (nama, query, index yang diharapkan)
+    hot_queries = [
+        (
+            "chat history sidebar",
+            """
+            SELECT id, title, message_count, last_message_preview, updated_date
+            FROM chat_histories
+            WHERE user_id = :id AND deleted = false AND is_active = true
+            ORDER BY updated_date DESC, id DESC
+            LIMIT 21
+            """,
+            "ix_chat_histories_user_activity",
+        ),
+        (
+            "chat messages page",
+            """
+            SELECT id, sender, text, created_date
+            FROM chat_messages
+            WHERE chat_history_id = :id AND deleted = false
+            ORDER BY created_date DESC, id DESC
+            LIMIT 21
+            """,
+            "ix_chat_messages_history_created",
+        ),
+    ]
+
+    try:
+        db = SessionLocal()
+        all_indexed = True
+
+        # Tabel kecil selalu di-seq scan, jadi paksa planner memilih index
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        print("🧭 Query Plans:")
+        for name, query, index_name in hot_queries:
+            # Kolom id bertipe uuid native (012): bind uuid yang valid
+            result = db.execute(text(f"EXPLAIN {query}"), {"id": str(uuid.uuid4())})
+            plan = "\n".join(row[0] for row in result.fetchall())
+
+            if index_name in plan and "Seq Scan" not in plan:
+                print(f"   ✅ {name}: uses {index_name}")
+            else:
+                print(f"   ❌ {name}: expected index scan on {index_name}")
+                for line in plan.splitlines():
+                    print(f"      {line}")
+                all_indexed = False
+
+        db.rollback()
+        db.close()
+        return all_indexed
+
+    except Exception as e:
+        print(f"❌ Error checking query plans: {e}")
+        return False
+
+
 def check_sample_data():
     """Cek apakah ada sample data (dari seeding)"""
     try:
@@ -238,6 +297,7 @@ def run_validation():
         ("Tables Existence", check_tables_exist),
         ("Foreign Keys", check_foreign_keys),
         ("Indexes", check_indexes),
+        ("Query Plans", check_query_plans),
         ("Migration History", check_migration_history),
         ("Sample Data", check_sample_data),
     ]
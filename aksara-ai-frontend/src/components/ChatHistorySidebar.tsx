@@ -33,14 +33,20 @@ export const ChatHistorySidebar: React.FC<ChatHistorySidebarProps> = ({
     const [error, setError] = useState<string | null>(null);
     const [deleteDialogOpen, setDeleteDialogOpen] = useState(false);
     const [chatToDelete, setChatToDelete] = useState<string | null>(null);
+    // Keyset paging: cursor of the oldest loaded chat
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [hasMore, setHasMore] = useState(false);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     // Load chat histories
     const loadChatHistories = useCallback(async () => {
         try {
             setLoading(true);
             setError(null);
-            const histories = await chatApi.getChatHistories();
-            setChatHistories(histories);
+            const page = await chatApi.getChatHistories();
+            setChatHistories(page.histories);
+            setNextCursor(page.next_cursor);
+            setHasMore(page.has_more);
         } catch (err) {
             console.error('Failed to load chat histories:', err);
             setError('Failed to load chat histories');
@@ -49,6 +55,26 @@ export const ChatHistorySidebar: React.FC<ChatHistorySidebarProps> = ({
         }
     }, []);
 
+    // Load the next (older) page and append it
+    const loadMoreHistories = useCallback(async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const page = await chatApi.getChatHistories(nextCursor);
+            setChatHistories((prev) => {
+                const loaded = new Set(prev.map((chat) => chat.conversation_id));
+                return [...prev, ...page.histories.filter((chat) => !loaded.has(chat.conversation_id))];
+            });
+            setNextCursor(page.next_cursor);
+            setHasMore(page.has_more);
+        } catch (err) {
+            console.error('Failed to load more chat histories:', err);
+            setError('Failed to load chat histories');
+        } finally {
+            setLoadingMore(false);
+        }
+    }, [nextCursor]);
+
     useEffect(() => {
         loadChatHistories();
     }, [loadChatHistories]);
@@ -240,6 +266,19 @@ export const ChatHistorySidebar: React.FC<ChatHistorySidebarProps> = ({
                                 )}
                             </div>
                         ))}
+                        {hasMore && (
+                            <div className="p-4">
+                                <Button
+                                    onClick={loadMoreHistories}
+                                    disabled={loadingMore}
+                                    size="sm"
+                                    variant="outline"
+                                    className="w-full"
+                                >
+                                    {loadingMore ? 'Memuat...' : 'Muat percakapan lainnya'}
+                                </Button>
+                            </div>
+                        )}
                     </div>
                 )}
             </div>
@@ -14,7 +14,7 @@ import {
 import ChatHistorySidebar from '@/components/ChatHistorySidebar';
 import Navbar from '@/components/Navbar';
 import { useAuth } from '@/context/AuthContext';
-import { chatApi } from '@/services/api';
+import { chatApi, type ChatHistoryDetail } from '@/services/api';
 import { DUMMY_MODE, type DummyMessage } from '@/services/dummyData';
 import { mockChatApi } from '@/services/mockApi';
 import { Bot, Send, User } from 'lucide-react';
@@ -29,6 +29,14 @@ interface Message {
     timestamp: Date;
 }
 
+const toMessages = (detail: ChatHistoryDetail): Message[] =>
+    detail.messages.map((msg) => ({
+        id: msg.id,
+        content: msg.text,
+        sender: msg.sender === 'assistant' ? 'ai' : (msg.sender as 'user' | 'ai'),
+        timestamp: new Date(msg.created_date),
+    }));
+
 const ChatPage: React.FC = () => {
     const [messages, setMessages] = useState<Message[]>([]);
     const [inputMessage, setInputMessage] = useState('');
@@ -38,6 +46,10 @@ const ChatPage: React.FC = () => {
     const [sidebarOpen, setSidebarOpen] = useState(true);
     const [logoutDialogOpen, setLogoutDialogOpen] = useState(false);
     const messagesEndRef = useRef<HTMLDivElement>(null);
+    // Older messages of the open chat are loaded a page at a time
+    const [olderCursor, setOlderCursor] = useState<string | null>(null);
+    const [loadingOlder, setLoadingOlder] = useState(false);
+    const keepScrollRef = useRef(false);
     const { logout } = useAuth();
 
     // Load initial messages
@@ -99,13 +111,8 @@ const ChatPage: React.FC = () => {
                 setMessages(formattedMessages);
             } else {
                 const chatDetail = await chatApi.getChatHistoryById(chatId);
-                const formattedMessages = chatDetail.messages.map((msg) => ({
-                    id: msg.id,
-                    content: msg.text,
-                    sender: msg.sender === 'assistant' ? 'ai' : msg.sender as 'user' | 'ai',
-                    timestamp: new Date(msg.created_date),
-                }));
-                setMessages(formattedMessages);
+                setMessages(toMessages(chatDetail));
+                setOlderCursor(chatDetail.has_more ? (chatDetail.next_cursor ?? null) : null);
             }
             setSelectedChatId(chatId);
         } catch (error) {
@@ -115,6 +122,22 @@ const ChatPage: React.FC = () => {
         }
     }, []);
 
+    // Prepend the previous page of the open chat
+    const loadOlderMessages = useCallback(async () => {
+        if (!selectedChatId || !olderCursor) return;
+        try {
+            setLoadingOlder(true);
+            const chatDetail = await chatApi.getChatHistoryById(selectedChatId, olderCursor);
+            keepScrollRef.current = true;
+            setMessages((prev) => [...toMessages(chatDetail), ...prev]);
+            setOlderCursor(chatDetail.has_more ? (chatDetail.next_cursor ?? null) : null);
+        } catch (error) {
+            console.error('Error loading older messages:', error);
+        } finally {
+            setLoadingOlder(false);
+        }
+    }, [selectedChatId, olderCursor]);
+
     // Handle chat selection from sidebar
     const handleChatSelect = useCallback((chatId: string) => {
         loadChatById(chatId);
@@ -123,6 +146,7 @@ const ChatPage: React.FC = () => {
     // Handle new chat creation
     const handleNewChat = useCallback(() => {
         setSelectedChatId(null);
+        setOlderCursor(null);
         setMessages([
             {
                 id: '1',
@@ -138,6 +162,11 @@ const ChatPage: React.FC = () => {
     };
 
     useEffect(() => {
+        // Older messages were prepended: stay where the user is reading
+        if (keepScrollRef.current) {
+            keepScrollRef.current = false;
+            return;
+        }
         scrollToBottom();
     }, [messages]);
 
@@ -270,6 +299,18 @@ const ChatPage: React.FC = () => {
                             </div>
                         ) : (
                             <div className="h-full space-y-4 overflow-y-auto pr-4 scrollbar-w-2 scrollbar-thumb-neutral-500 hover:scrollbar-thumb-neutral-600">
+                                {olderCursor && (
+                                    <div className="flex justify-center pt-2">
+                                        <Button
+                                            onClick={loadOlderMessages}
+                                            disabled={loadingOlder}
+                                            size="sm"
+                                            variant="outline"
+                                        >
+                                            {loadingOlder ? 'Memuat...' : 'Muat pesan sebelumnya'}
+                                        </Button>
+                                    </div>
+                                )}
                                 {messages.map((message) => (
                                     <div
                                         key={message.id}
@@ -16,6 +16,11 @@ api.interceptors.request.use(
         if (token) {
             config.headers.Authorization = `Bearer ${token}`;
         }
+        // Read-your-writes: setelah menulis, baca dari primary (bukan replica)
+        const lastWrite = localStorage.getItem('lastWrite');
+        if (lastWrite) {
+            config.headers['X-Last-Write'] = lastWrite;
+        }
         return config;
     },
     (error) => {
@@ -25,7 +30,13 @@ api.interceptors.request.use(
 
 // Response interceptor untuk handle errors
 api.interceptors.response.use(
-    (response) => response,
+    (response) => {
+        const lastWrite = response.headers['x-last-write'];
+        if (lastWrite) {
+            localStorage.setItem('lastWrite', lastWrite);
+        }
+        return response;
+    },
     (error) => {
         if (error.response?.status === 401 || error.response?.status === 403) {
             // Token expired, invalid, or forbidden
@@ -178,12 +189,23 @@ export interface ChatHistoryDetail {
     is_active: boolean;
     created_date: string;
     updated_date: string;
+    message_count?: number;
+    // One page of messages, oldest first; older pages via `before: next_cursor`
     messages: Array<{
         id: string;
         sender: string;
         text: string;
         created_date: string;
     }>;
+    next_cursor?: string | null;
+    has_more?: boolean;
+}
+
+// One page of the keyset-paginated sidebar list
+export interface ChatHistoryPage {
+    histories: ChatHistory[];
+    next_cursor: string | null;
+    has_more: boolean;
 }
 
 export const chatApi = {
@@ -192,8 +214,11 @@ export const chatApi = {
         return response.data.data;
     },
 
-    getChatHistories: async (): Promise<ChatHistory[]> => {
-        const response = await api.get('/chat/histories');
+    // Newest activity first; pass the previous page's next_cursor to load older chats
+    getChatHistories: async (before?: string): Promise<ChatHistoryPage> => {
+        const response = await api.get('/chat/histories', {
+            params: before ? { before } : undefined,
+        });
         const payload = response.data?.data;
 
         // Backend returns { histories: [...], total: n }
@@ -220,11 +245,18 @@ export const chatApi = {
             created_date: it.created_date || new Date().toISOString(),
         }));
 
-        return normalized;
+        return {
+            histories: normalized,
+            next_cursor: payload?.next_cursor ?? null,
+            has_more: Boolean(payload?.has_more),
+        };
     },
 
-    getChatHistoryById: async (historyId: string): Promise<ChatHistoryDetail> => {
-        const response = await api.get(`/chat/histories/${historyId}`);
+    // Latest page of messages by default; pass next_cursor as `before` for older ones
+    getChatHistoryById: async (historyId: string, before?: string): Promise<ChatHistoryDetail> => {
+        const response = await api.get(`/chat/histories/${historyId}`, {
+            params: before ? { before } : undefined,
+        });
         return response.data.data;
     },
 